@@ -8,6 +8,7 @@ from app.schemas.tubehunt import (
 )
 from app.services.notion import NotionNichosService, NotionNichosServiceAPI
 from app.core.job_queue import job_manager
+from app.core.rate_limit import bind_job
 from datetime import datetime
 import threading
 
@@ -19,6 +20,7 @@ router = APIRouter(prefix="/notion", tags=["Notion Nichos"])
 def scrape_nichos_job(job_id: str, request: ScrapeNichosRequest):
     """Função que executa o scraping em background usando API interception"""
     try:
+        bind_job(job_id)
         logger.info(f"[JOB {job_id}] Iniciando scraping de nichos (versão API interception)...")
         job_manager.update_job_progress(job_id, 10)
 
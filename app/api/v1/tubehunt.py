@@ -15,16 +15,28 @@ from app.schemas.tubehunt import (
     JobStartResponse,
     JobStatusResponse,
     JobResultResponse,
+    JobPartialResultsResponse,
+    ScrapePipelineRequest,
+    ScrapeChannelResumeRequest,
 )
 from app.services.tubehunt import TubeHuntService
+from app.services.tubehunt_async import TubeHuntAsyncService
+from app.services.tubehunt_pipeline import run_pipeline, run_pipeline_async
+from app.services.tubehunt_batch import run_detail_batch, run_detail_batch_async
+from app.services.tubehunt_crawl import ListingCrawl, crawl_listing, crawl_listing_async
 from app.services.webhook import webhook_caller
 from app.core.config import settings
-from app.core.job_queue import job_manager
+from app.core.job_queue import job_manager, JobStatus
+from app.core.async_browser import async_engine
+from app.core.high_water import high_water_store
+from app.core.checkpoint import checkpoint_store
+from app.core.rate_limit import bind_job
 import logging
 import time
 import asyncio
 import threading
 from datetime import datetime
+from typing import Optional
 from urllib.parse import urlparse
 from concurrent.futures import ThreadPoolExecutor
 
@@ -34,9 +46,83 @@ router = APIRouter(prefix="/tubehunt", tags=["tubehunt"])
 # Tracking startup time for uptime calculation
 _startup_time = time.time()
 
-# Executor para jobs de scraping com limite de 2 workers concorrentes
-# Previne uso excessivo de recursos (Playwright browsers)
-scraping_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="scraper")
+# Executor para jobs de scraping com limite de BROWSER_POOL_SIZE workers concorrentes
+# Cada worker mantém um navegador persistente do BrowserPool (app/core/browser.py)
+scraping_executor = ThreadPoolExecutor(
+    max_workers=settings.BROWSER_POOL_SIZE,
+    thread_name_prefix=settings.BROWSER_POOL_THREAD_PREFIX
+)
+
+
+async def _send_webhook_async(**kwargs) -> bool:
+    """Enviar webhook a partir do engine async sem bloquear o event loop"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, lambda: webhook_caller.send_webhook(**kwargs))
+
+
+# Webhooks parciais em uma única thread: não bloqueiam o scraping e chegam em ordem
+_partial_webhook_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="webhook-partial")
+
+
+class _ResultStream:
+    """
+    Publica os resultados do job conforme são extraídos
+
+    Cada item vai para job_manager.append_job_results (lido em
+    GET /jobs/{job_id}/results) e, com WEBHOOK_PARTIAL_BATCH_SIZE > 0, a cada
+    lote um webhook "partial" é enviado em segundo plano.
+    """
+
+    def __init__(self, job_id: str, webhook_url: Optional[str] = None):
+        self.job_id = job_id
+        self.webhook_url = webhook_url
+        self.batch_size = settings.WEBHOOK_PARTIAL_BATCH_SIZE
+        self._pending: list = []
+        self._sent = 0
+
+    def add(self, item: dict):
+        """Publicar um item (e enviar o lote parcial se completou)"""
+        job_manager.append_job_results(self.job_id, [item])
+        if self.webhook_url and self.batch_size > 0:
+            self._pending.append(item)
+            if len(self._pending) >= self.batch_size:
+                self.flush()
+
+    def flush(self):
+        """Enviar o lote parcial pendente"""
+        if not self._pending:
+            return
+        batch, offset = self._pending, self._sent
+        self._pending = []
+        self._sent += len(batch)
+        _partial_webhook_executor.submit(
+            webhook_caller.send_webhook,
+            webhook_url=self.webhook_url,
+            job_id=self.job_id,
+            status="partial",
+            result={"offset": offset, "items": batch},
+        )
+
+    def reference(self) -> dict:
+        """
+        Campos do resultado final que apontam para os itens publicados
+
+        A lista não entra no resultado do job (nem no webhook final): só a janela
+        fica em memória e os itens são lidos em GET /jobs/{job_id}/results.
+        """
+        self.flush()
+        return {
+            "results_total": self.count(),
+            "results_url": f"/api/v1{router.prefix}/jobs/{self.job_id}/results",
+        }
+
+    def iter(self):
+        """Percorrer os itens publicados sem montar a lista (arquivo de spill + janela)"""
+        return job_manager.iter_job_results(self.job_id)
+
+    def count(self) -> int:
+        """Total de itens publicados, sem materializar a lista"""
+        return job_manager.count_job_results(self.job_id)
 
 
 
@@ -323,6 +409,21 @@ def _validate_url(url: str) -> bool:
         return False
 
 
+def _listing_crawl(request: ScrapeChannelsRequest, scrape_url: str) -> Optional[ListingCrawl]:
+    """Crawl de várias páginas pedido na request (None = apenas a scrape_url)"""
+    if not request.is_crawl:
+        return None
+    if request.page_start and request.page_end and request.page_end < request.page_start:
+        raise HTTPException(status_code=400, detail="page_end deve ser maior ou igual a page_start")
+    return ListingCrawl(
+        scrape_url,
+        page_start=request.page_start,
+        page_end=request.page_end,
+        until_empty=request.until_empty,
+        known=high_water_store.load(scrape_url) if request.incremental else None,
+    )
+
+
 @router.post("/scrape-channels", response_model=JobStartResponse)
 async def scrape_channels_async(request: ScrapeChannelsRequest = None) -> JobStartResponse:
     """
@@ -341,6 +442,14 @@ async def scrape_channels_async(request: ScrapeChannelsRequest = None) -> JobSta
     - **scrape_url** (opcional): URL da página para extrair canais (fallback .env)
     - **wait_time** (default: 15): Timeout em segundos (5-600)
     - **webhook_url** (opcional): URL para notificação ao final
+    - **page_start** / **page_end** (opcional): Crawl de um intervalo de páginas (reescreve `page=`)
+    - **until_empty** (default: false): Crawl até a primeira página sem canais (limite CRAWL_MAX_PAGES)
+    - **crawl_concurrency** (opcional): Páginas em paralelo no engine async (fallback CRAWL_CONCURRENCY)
+    - **incremental** (default: false): Crawl até o primeiro canal já visto nesta listagem;
+      retorna só os canais novos e `crawl.stopped_at` (página/posição/canal onde parou)
+
+    No crawl, canais repetidos entre páginas (mesmo handle/ID) são removidos e
+    os resultados saem na ordem das páginas.
 
     ## Exemplo de uso
     ```bash
@@ -399,18 +508,28 @@ async def scrape_channels_async(request: ScrapeChannelsRequest = None) -> JobSta
                 detail=f"scrape_url inválida: {scrape_url}"
             )
 
+        # Crawl de várias páginas (page_end, until_empty ou incremental)
+        crawl = _listing_crawl(request, scrape_url)
+
         # Criar job
         job_id = job_manager.create_job()
 
         logger.info(f"📋 Job criado: {job_id}")
         logger.info(f"  - URL: {scrape_url}")
         logger.info(f"  - Wait Time: {wait_time}s")
+        if crawl is not None:
+            logger.info(
+                f"  - Crawl: páginas {crawl.page_start}-{crawl.page_end}"
+                f"{' (até página vazia)' if crawl.until_empty else ''}"
+                f"{f' (incremental, {len(crawl.known)} canais já vistos)' if crawl.incremental else ''}"
+            )
         if webhook_url:
             logger.info(f"  - Webhook: {webhook_url}")
 
         # Disparar scraping em background
         def scrape_job_sync():
             job_manager.mark_job_processing(job_id)
+            bind_job(job_id)
             logger.info(f"⏳ Job {job_id} iniciado")
 
             service = TubeHuntService()
@@ -420,24 +539,36 @@ async def scrape_channels_async(request: ScrapeChannelsRequest = None) -> JobSta
                 logger.info(f"[Job {job_id}] Fazendo login...")
                 service.username = username
                 service.password = password
-                service._access_login_page()
-                service._fill_credentials()
-                service._submit_form()
-                service._wait_for_redirect()
+                service.authenticate()
 
                 logger.info(f"[Job {job_id}] Login concluído. Iniciando scraping...")
-                result = service.scrape_channels(wait_time=wait_time, scrape_url=scrape_url)
+                # Cada canal é publicado assim que extraído (resultados parciais)
+                stream = _ResultStream(job_id, webhook_url)
+                error = None
+                try:
+                    if crawl is not None:
+                        crawl_listing(service, crawl, wait_time, stream.add)
+                    else:
+                        for channel in service.iter_channels(service.get_page(), wait_time=wait_time, scrape_url=scrape_url):
+                            stream.add(channel)
+                except Exception as e:
+                    logger.error(f"[Job {job_id}] ❌ Erro no scraping de canais: {str(e)}", exc_info=True)
+                    error = str(e)
 
-                logger.info(f"[Job {job_id}] Scraping completo: {result.get('total_channels', 0)} canais")
+                results = stream.reference()
+                logger.info(f"[Job {job_id}] Scraping completo: {results['results_total']} canais")
 
-                # Preparar resultado
+                # Preparar resultado (os canais ficam em GET /jobs/{job_id}/results)
                 job_result = {
-                    "success": result["success"],
-                    "channels": result.get("channels", []),
-                    "total_channels": result.get("total_channels", 0),
-                    "url": result.get("url"),
-                    "error": result.get("error"),
+                    "success": error is None,
+                    "total_channels": results["results_total"],
+                    **results,
+                    "url": service.get_page().url if error is None else None,
+                    "error": error,
                 }
+                if crawl is not None:
+                    job_result["crawl"] = crawl.summary()
+                    crawl.update_high_water(high_water_store, error)
 
                 job_manager.mark_job_completed(job_id, job_result)
 
@@ -473,9 +604,77 @@ async def scrape_channels_async(request: ScrapeChannelsRequest = None) -> JobSta
                 except:
                     pass
 
-        # Disparar em background usando executor
-        loop = asyncio.get_event_loop()
-        loop.run_in_executor(scraping_executor, scrape_job_sync)
+        async def scrape_job_async():
+            job_manager.mark_job_processing(job_id)
+            bind_job(job_id)
+            logger.info(f"⏳ Job {job_id} iniciado (engine async)")
+
+            service = TubeHuntAsyncService(username=username, password=password)
+            try:
+                await service.authenticate()
+                page = await service.get_page()
+                stream = _ResultStream(job_id, webhook_url)
+                error = None
+                try:
+                    if crawl is not None:
+                        await crawl_listing_async(
+                            username, password, crawl, wait_time, stream.add,
+                            concurrency=request.crawl_concurrency, service=service,
+                        )
+                    else:
+                        async for channel in service.iter_channels(page, wait_time=wait_time, scrape_url=scrape_url):
+                            stream.add(channel)
+                except Exception as e:
+                    logger.error(f"[Job {job_id}] ❌ Erro no scraping de canais: {str(e)}", exc_info=True)
+                    error = str(e)
+
+                results = stream.reference()
+                logger.info(f"[Job {job_id}] Scraping completo: {results['results_total']} canais")
+
+                job_result = {
+                    "success": error is None,
+                    "total_channels": results["results_total"],
+                    **results,
+                    "url": scrape_url if crawl is not None else (page.url if error is None else None),
+                    "error": error,
+                }
+                if crawl is not None:
+                    job_result["crawl"] = crawl.summary()
+                    crawl.update_high_water(high_water_store, error)
+
+                job_manager.mark_job_completed(job_id, job_result)
+
+                if webhook_url:
+                    await _send_webhook_async(
+                        webhook_url=webhook_url,
+                        job_id=job_id,
+                        status="completed",
+                        result=job_result,
+                        execution_time_seconds=None
+                    )
+
+            except Exception as e:
+                logger.error(f"[Job {job_id}] ❌ Erro: {str(e)}", exc_info=True)
+                job_manager.mark_job_failed(job_id, str(e))
+
+                if webhook_url:
+                    await _send_webhook_async(
+                        webhook_url=webhook_url,
+                        job_id=job_id,
+                        status="failed",
+                        result=None,
+                        error=str(e)
+                    )
+
+            finally:
+                await service.close()
+
+        # Disparar em background: engine async (loop dedicado) ou executor sync
+        if settings.SCRAPER_ENGINE == "async":
+            async_engine.submit(scrape_job_async())
+        else:
+            loop = asyncio.get_event_loop()
+            loop.run_in_executor(scraping_executor, scrape_job_sync)
 
         # Retornar resposta imediata com job_id
         job_dict = job_manager.get_job_dict(job_id)
@@ -496,6 +695,249 @@ async def scrape_channels_async(request: ScrapeChannelsRequest = None) -> JobSta
         )
 
 
+@router.post("/scrape-channels-details", response_model=JobStartResponse)
+async def scrape_channels_details(request: ScrapePipelineRequest = None) -> JobStartResponse:
+    """
+    Iniciar job de listagem + detalhes dos canais (pipeline)
+
+    ## Descrição
+    Um único job que lê a listagem e extrai os detalhes de cada canal, sem
+    precisar de um segundo job em `/scrape-channel`. Os canais vão da
+    listagem para uma fila limitada e workers de detalhes (mesma sessão
+    autenticada) começam assim que o primeiro card é lido. O resultado
+    combinado (canal + `details`) sai em um único webhook.
+
+    ## Body Parameters
+    Os mesmos de `POST /scrape-channels` (incluindo o crawl de várias páginas), mais:
+    - **detail_concurrency** (opcional): Workers de detalhes (fallback PIPELINE_DETAIL_CONCURRENCY)
+
+    ## Exemplo de uso
+    ```bash
+    curl -X POST http://localhost:8000/api/v1/tubehunt/scrape-channels-details \\
+      -H "Content-Type: application/json" \\
+      -d '{
+        "scrape_url": "https://app.tubehunt.io/long/?page=1&OrderBy=DateDESC&ChangePerPage=50",
+        "page_end": 3,
+        "detail_concurrency": 4,
+        "webhook_url": "https://seu-webhook.com/callback"
+      }'
+    ```
+
+    Consulte o status com: `GET /scrape-channels/status/{job_id}`
+    """
+    try:
+        if request is None:
+            request = ScrapePipelineRequest()
+
+        username = request.username or settings.user
+        password = request.password or settings.password
+        scrape_url = request.scrape_url or settings.url_scrape_channels
+        wait_time = request.wait_time
+        webhook_url = request.webhook_url
+
+        if not username or not password:
+            raise HTTPException(
+                status_code=400,
+                detail="Credenciais não fornecidas. Forneça username/password ou configure .env"
+            )
+
+        if not _validate_url(scrape_url):
+            raise HTTPException(
+                status_code=400,
+                detail=f"scrape_url inválida: {scrape_url}"
+            )
+
+        crawl = _listing_crawl(request, scrape_url)
+        job_id = job_manager.create_job()
+
+        logger.info(f"📋 Job criado (listagem + detalhes): {job_id}")
+        logger.info(f"  - URL: {scrape_url}")
+        if webhook_url:
+            logger.info(f"  - Webhook: {webhook_url}")
+
+        def pipeline_result(stream: _ResultStream, total: int, error: Optional[str]) -> dict:
+            """
+            Resultado combinado: totais e falhas, com os canais em GET /jobs/{job_id}/results
+
+            Os canais são publicados na ordem de conclusão; listing_index de cada
+            item dá a ordem da listagem.
+            """
+            results = stream.reference()
+            with_details, failed_channels = 0, []
+            for channel in stream.iter():
+                if channel["details"] is not None:
+                    with_details += 1
+                else:
+                    failed_channels.append({
+                        "listing_index": channel["listing_index"],
+                        "channel_link": channel["channel_link"],
+                        "error": channel["detail_error"],
+                    })
+            job_result = {
+                "success": error is None,
+                "total_channels": total,
+                "total_with_details": with_details,
+                "failed_channels": sorted(failed_channels, key=lambda c: c["listing_index"]),
+                **results,
+                "url": scrape_url,
+                "error": error,
+            }
+            if crawl is not None:
+                job_result["crawl"] = crawl.summary()
+                crawl.update_high_water(high_water_store, error)
+            logger.info(
+                f"[Job {job_id}] Pipeline completo: {job_result['total_with_details']}/{total} canais com detalhes"
+            )
+            return job_result
+
+        def pipeline_job_sync():
+            job_manager.mark_job_processing(job_id)
+            bind_job(job_id)
+            logger.info(f"⏳ Job {job_id} iniciado (pipeline)")
+
+            service = TubeHuntService()
+            service._create_driver()
+            try:
+                service.username = username
+                service.password = password
+                service.authenticate()
+
+                def listing(put):
+                    if crawl is not None:
+                        crawl_listing(service, crawl, wait_time, put)
+                    else:
+                        for channel in service.iter_channels(service.get_page(), wait_time=wait_time, scrape_url=scrape_url):
+                            put(channel)
+
+                stream = _ResultStream(job_id, webhook_url)
+                error, total = None, 0
+                try:
+                    total = run_pipeline(
+                        username, password, scrape_url, listing, stream.add,
+                        concurrency=request.detail_concurrency,
+                        storage_state=service.browser_manager.export_storage_state(),
+                    )
+                except Exception as e:
+                    logger.error(f"[Job {job_id}] ❌ Erro no pipeline: {str(e)}", exc_info=True)
+                    error = str(e)
+                    total = stream.count()
+
+                job_result = pipeline_result(stream, total, error)
+                job_manager.mark_job_completed(job_id, job_result)
+
+                if webhook_url:
+                    logger.info(f"[Job {job_id}] 📤 Enviando webhook para {webhook_url}")
+                    webhook_caller.send_webhook(
+                        webhook_url=webhook_url,
+                        job_id=job_id,
+                        status="completed",
+                        result=job_result,
+                        execution_time_seconds=None
+                    )
+
+            except Exception as e:
+                logger.error(f"[Job {job_id}] ❌ Erro: {str(e)}", exc_info=True)
+                job_manager.mark_job_failed(job_id, str(e))
+
+                if webhook_url:
+                    webhook_caller.send_webhook(
+                        webhook_url=webhook_url,
+                        job_id=job_id,
+                        status="failed",
+                        result=None,
+                        error=str(e)
+                    )
+
+            finally:
+                try:
+                    service.close()
+                except:
+                    pass
+
+        async def pipeline_job_async():
+            job_manager.mark_job_processing(job_id)
+            bind_job(job_id)
+            logger.info(f"⏳ Job {job_id} iniciado (pipeline, engine async)")
+
+            service = TubeHuntAsyncService(username=username, password=password)
+            try:
+                await service.authenticate()
+                page = await service.get_page()
+
+                async def listing(put):
+                    if crawl is not None:
+                        await crawl_listing_async(
+                            username, password, crawl, wait_time, put,
+                            concurrency=request.crawl_concurrency, service=service,
+                        )
+                    else:
+                        async for channel in service.iter_channels(page, wait_time=wait_time, scrape_url=scrape_url):
+                            await put(channel)
+
+                stream = _ResultStream(job_id, webhook_url)
+                error, total = None, 0
+                try:
+                    total = await run_pipeline_async(
+                        username, password, scrape_url, listing, stream.add,
+                        concurrency=request.detail_concurrency,
+                    )
+                except Exception as e:
+                    logger.error(f"[Job {job_id}] ❌ Erro no pipeline: {str(e)}", exc_info=True)
+                    error = str(e)
+                    total = stream.count()
+
+                job_result = pipeline_result(stream, total, error)
+                job_manager.mark_job_completed(job_id, job_result)
+
+                if webhook_url:
+                    await _send_webhook_async(
+                        webhook_url=webhook_url,
+                        job_id=job_id,
+                        status="completed",
+                        result=job_result,
+                        execution_time_seconds=None
+                    )
+
+            except Exception as e:
+                logger.error(f"[Job {job_id}] ❌ Erro: {str(e)}", exc_info=True)
+                job_manager.mark_job_failed(job_id, str(e))
+
+                if webhook_url:
+                    await _send_webhook_async(
+                        webhook_url=webhook_url,
+                        job_id=job_id,
+                        status="failed",
+                        result=None,
+                        error=str(e)
+                    )
+
+            finally:
+                await service.close()
+
+        if settings.SCRAPER_ENGINE == "async":
+            async_engine.submit(pipeline_job_async())
+        else:
+            loop = asyncio.get_event_loop()
+            loop.run_in_executor(scraping_executor, pipeline_job_sync)
+
+        job_dict = job_manager.get_job_dict(job_id)
+        return JobStartResponse(
+            job_id=job_id,
+            status=job_dict["status"],
+            message=job_dict.get("message", "Job enfileirado com sucesso"),
+            created_at=datetime.fromisoformat(job_dict["created_at"])
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Erro ao criar job: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Erro ao criar job de scraping: {str(e)}"
+        )
+
+
 @router.get("/scrape-channels/status/{job_id}", response_model=JobStatusResponse)
 async def get_scrape_channels_status(job_id: str) -> JobStatusResponse:
     """
@@ -559,7 +1001,9 @@ async def get_scrape_channels_status(job_id: str) -> JobStatusResponse:
             status=job_dict["status"],
             progress=job_dict["progress"],
             message=job_dict.get("message", ""),
-            started_at=datetime.fromisoformat(job_dict["started_at"]) if job_dict.get("started_at") else None
+            started_at=datetime.fromisoformat(job_dict["started_at"]) if job_dict.get("started_at") else None,
+            concurrency=job_dict.get("concurrency"),
+            rate_limit_wait_seconds=job_dict.get("rate_limit_wait_seconds")
         )
 
     except HTTPException:
@@ -581,8 +1025,9 @@ async def get_scrape_channels_result(job_id: str) -> JobResultResponse:
     - `job_id`: ID do job (obtido em POST /scrape-channels)
 
     ## Descrição
-    Retorna o resultado completo do scraping, incluindo lista de canais,
-    tempo de execução e status final.
+    Retorna o resumo do scraping, tempo de execução e status final. Os canais
+    não vêm no resultado: leia-os em `results_url` (GET /jobs/{job_id}/results,
+    paginado com offset/limit).
 
     Espere o job estar em status "completed" antes de chamar este endpoint.
 
@@ -598,8 +1043,9 @@ async def get_scrape_channels_result(job_id: str) -> JobResultResponse:
       "status": "completed",
       "result": {
         "success": true,
-        "channels": [ ... ],
         "total_channels": 50,
+        "results_total": 50,
+        "results_url": "/api/v1/tubehunt/jobs/550e8400-e29b-41d4-a716-446655440000/results",
         "url": "https://app.tubehunt.io/long/?page=1&OrderBy=DateDESC&ChangePerPage=50",
         "error": null
       },
@@ -640,6 +1086,32 @@ async def get_scrape_channels_result(job_id: str) -> JobResultResponse:
         )
 
 
+@router.get("/jobs/{job_id}/results", response_model=JobPartialResultsResponse)
+async def get_job_partial_results(job_id: str, offset: int = 0, limit: Optional[int] = None) -> JobPartialResultsResponse:
+    """
+    Ler os resultados já publicados por um job, inclusive durante a execução
+
+    ## Descrição
+    Os jobs de canais publicam cada item assim que ele é extraído. Use `offset`
+    com o `total` da chamada anterior para buscar apenas os itens novos.
+
+    ## Exemplo de uso
+    ```bash
+    curl "http://localhost:8000/api/v1/tubehunt/jobs/550e8400-e29b-41d4-a716-446655440000/results?offset=0"
+    ```
+    """
+    if offset < 0 or (limit is not None and limit < 1):
+        raise HTTPException(status_code=400, detail="offset deve ser >= 0 e limit >= 1")
+
+    results = job_manager.get_job_results(job_id, offset=offset, limit=limit)
+    if results is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Job não encontrado: {job_id}"
+        )
+    return JobPartialResultsResponse(**results)
+
+
 # ============================================================================
 # Job Queue + Webhook Endpoints - Backwards Compatibility
 # ============================================================================
@@ -702,6 +1174,7 @@ async def start_scrape_job(request: Optional[ScrapeChannelsRequest] = None) -> J
             try:
                 logger.info(f"[Job {job_id}] Iniciando scraping...")
                 job_manager.mark_job_processing(job_id)
+                bind_job(job_id)
 
                 # Preparar credenciais (usar request ou fallback para .env)
                 if request:
@@ -736,12 +1209,19 @@ async def start_scrape_job(request: Optional[ScrapeChannelsRequest] = None) -> J
                 service._create_driver()
 
                 try:
-                    result = service.scrape_channels(wait_time=wait_time, scrape_url=scrape_url)
+                    service.authenticate()
+
+                    # Cada canal é publicado assim que extraído (resultados parciais)
+                    stream = _ResultStream(job_id, request.webhook_url if request else None)
+                    for channel in service.iter_channels(service.get_page(), wait_time=wait_time, scrape_url=scrape_url):
+                        stream.add(channel)
 
-                    # Converter resultado para formato canais_extraidos_simples.json
+                    # Resultado no formato canais_extraidos_simples.json, com os canais
+                    # em GET /jobs/{job_id}/results
+                    results = stream.reference()
                     scrape_result = {
-                        "total_canais": result.get("total_channels", 0),
-                        "canais": result.get("channels", [])
+                        "total_canais": results["results_total"],
+                        **results,
                     }
 
                     logger.info(f"[Job {job_id}] ✅ Scraping concluído: {scrape_result['total_canais']} canais")
@@ -838,7 +1318,8 @@ async def get_scrape_result(job_id: str):
       "status": "completed",
       "result": {
         "total_canais": 50,
-        "canais": [...]
+        "results_total": 50,
+        "results_url": "/api/v1/tubehunt/jobs/550e8400-e29b-41d4-a716-446655440000/results"
       },
       "execution_time_seconds": 330.5,
       "completed_at": "2026-01-01T20:15:30.000000"
@@ -892,7 +1373,9 @@ async def get_scrape_result(job_id: str):
                 status=job_data["status"],
                 progress=job_data.get("progress", 0),
                 message=job_data.get("message", "Job em progresso"),
-                started_at=job_data.get("started_at")
+                started_at=job_data.get("started_at"),
+                concurrency=job_data.get("concurrency"),
+                rate_limit_wait_seconds=job_data.get("rate_limit_wait_seconds")
             )
 
     except HTTPException:
@@ -970,10 +1453,7 @@ async def login_with_session(request: LoginRequest) -> LoginResponse:
                 # Fazer login
                 service.username = username
                 service.password = password
-                service._access_login_page()
-                service._fill_credentials()
-                service._submit_form()
-                service._wait_for_redirect()
+                service.authenticate()
 
                 logger.info("✅ Login realizado com sucesso")
 
@@ -1034,6 +1514,198 @@ async def login_with_session(request: LoginRequest) -> LoginResponse:
         )
 
 
+def _launch_scrape_channel_job(job_id: str, request: ScrapeChannelRequest, username: str, password: str):
+    """
+    Disparar em background o job de /scrape-channel (também usado na retomada de checkpoints)
+
+    Lotes de channel_links gravam cada canal no checkpoint_store com o job_id;
+    ao rodar de novo com o mesmo job_id, os canais já gravados são pulados.
+
+    Args:
+        job_id: ID do job (já criado no job_manager)
+        request: Request original (na retomada, sem a senha)
+        username: Usuário da conta
+        password: Senha da conta (na retomada: a enviada ao endpoint ou a do .env)
+    """
+    def scrape_job_sync():
+        job_manager.mark_job_processing(job_id)
+        bind_job(job_id)
+        logger.info(f"⏳ Job {job_id} iniciado")
+
+        service = TubeHuntService()
+        service._create_driver()
+        try:
+            # Login na MESMA thread
+            logger.info(f"[Job {job_id}] Fazendo login...")
+            service.username = username
+            service.password = password
+            service.authenticate()
+
+            page = service.get_page()
+            logger.info(f"[Job {job_id}] Login concluído")
+
+            # ===== UM CANAL =====
+            if request.channel_link:
+                logger.info(f"[Job {job_id}] Extraindo dados do canal: {request.channel_link}")
+                channel_data = service.scrape_channel_details(page, request.channel_link)
+
+                if not channel_data:
+                    raise Exception("Falha ao extrair dados do canal")
+
+                logger.info(f"[Job {job_id}] ✅ Canal extraído com sucesso")
+
+                # Preparar resultado para um canal
+                job_result = {
+                    "channel_link": channel_data.channel_link,
+                    "keywords": channel_data.keywords,
+                    "subjects": channel_data.subjects,
+                    "niches": channel_data.niches,
+                    "views_30_days": channel_data.views_30_days,
+                    "revenue_30_days": channel_data.revenue_30_days
+                }
+
+            # ===== MÚLTIPLOS CANAIS =====
+            else:
+                logger.info(f"[Job {job_id}] Extraindo dados de {len(request.channel_links)} canais")
+                stream = _ResultStream(job_id, request.webhook_url)
+
+                # HTTP (lotes grandes) + N abas no contexto autenticado, na ordem dos links
+                total_scraped, failed_channels = run_detail_batch(
+                    service,
+                    request.channel_links,
+                    tabs=request.tabs,
+                    on_result=stream.add,
+                    on_progress=lambda done, total: job_manager.update_job_progress(job_id, int(done / total * 100)),
+                    checkpoint_job_id=job_id,
+                )
+                logger.info(f"[Job {job_id}] ✅ Scraping concluído: {total_scraped}/{len(request.channel_links)} canais")
+
+                # Canais em GET /jobs/{job_id}/results (link_index = posição em channel_links)
+                job_result = {
+                    "total_scraped": total_scraped,
+                    "total_requested": len(request.channel_links),
+                    "failed_channels": failed_channels,
+                    **stream.reference(),
+                }
+
+            job_manager.mark_job_completed(job_id, job_result)
+            if request.channel_links:
+                checkpoint_store.finish(job_id, "completed")
+
+            # Enviar webhook se fornecido
+            if request.webhook_url:
+                logger.info(f"[Job {job_id}] 📤 Enviando webhook para {request.webhook_url}")
+                webhook_caller.send_webhook(
+                    webhook_url=request.webhook_url,
+                    job_id=job_id,
+                    status="completed",
+                    result=job_result,
+                    execution_time_seconds=None  # job_manager já calcula
+                )
+
+        except Exception as e:
+            logger.error(f"[Job {job_id}] ❌ Erro: {str(e)}", exc_info=True)
+            job_manager.mark_job_failed(job_id, str(e))
+            if request.channel_links:
+                checkpoint_store.finish(job_id, "failed")
+
+            # Enviar webhook com erro se fornecido
+            if request.webhook_url:
+                logger.info(f"[Job {job_id}] 📤 Enviando webhook de erro para {request.webhook_url}")
+                webhook_caller.send_webhook(
+                    webhook_url=request.webhook_url,
+                    job_id=job_id,
+                    status="failed",
+                    result=None,
+                    error=str(e)
+                )
+
+        finally:
+            try:
+                service.close()
+            except:
+                pass
+
+    async def scrape_job_async():
+        job_manager.mark_job_processing(job_id)
+        bind_job(job_id)
+        logger.info(f"⏳ Job {job_id} iniciado (engine async)")
+
+        service = TubeHuntAsyncService(username=username, password=password)
+        try:
+            await service.authenticate()
+            page = await service.get_page()
+            logger.info(f"[Job {job_id}] Login concluído")
+
+            if request.channel_link:
+                channel_data = await service.scrape_channel_details(page, request.channel_link)
+
+                if not channel_data:
+                    raise Exception("Falha ao extrair dados do canal")
+
+                job_result = channel_data.model_dump()
+
+            else:
+                stream = _ResultStream(job_id, request.webhook_url)
+
+                total_scraped, failed_channels = await run_detail_batch_async(
+                    service,
+                    request.channel_links,
+                    tabs=request.tabs,
+                    on_result=stream.add,
+                    on_progress=lambda done, total: job_manager.update_job_progress(job_id, int(done / total * 100)),
+                    checkpoint_job_id=job_id,
+                )
+                logger.info(f"[Job {job_id}] ✅ Scraping concluído: {total_scraped}/{len(request.channel_links)} canais")
+
+                # Canais em GET /jobs/{job_id}/results (link_index = posição em channel_links)
+                job_result = {
+                    "total_scraped": total_scraped,
+                    "total_requested": len(request.channel_links),
+                    "failed_channels": failed_channels,
+                    **stream.reference(),
+                }
+
+            job_manager.mark_job_completed(job_id, job_result)
+            if request.channel_links:
+                await asyncio.to_thread(checkpoint_store.finish, job_id, "completed")
+
+            if request.webhook_url:
+                await _send_webhook_async(
+                    webhook_url=request.webhook_url,
+                    job_id=job_id,
+                    status="completed",
+                    result=job_result,
+                    execution_time_seconds=None
+                )
+
+        except Exception as e:
+            logger.error(f"[Job {job_id}] ❌ Erro: {str(e)}", exc_info=True)
+            job_manager.mark_job_failed(job_id, str(e))
+            if request.channel_links:
+                await asyncio.to_thread(checkpoint_store.finish, job_id, "failed")
+
+            if request.webhook_url:
+                await _send_webhook_async(
+                    webhook_url=request.webhook_url,
+                    job_id=job_id,
+                    status="failed",
+                    result=None,
+                    error=str(e)
+                )
+
+        finally:
+            await service.close()
+
+    # Disparar em background: engine async (loop dedicado) ou executor sync
+    if settings.SCRAPER_ENGINE == "async":
+        async_engine.submit(scrape_job_async())
+    else:
+        loop = asyncio.get_event_loop()
+        loop.run_in_executor(scraping_executor, scrape_job_sync)
+
+
+
 @router.post("/scrape-channel", response_model=JobStartResponse)
 async def scrape_channel_async(request: ScrapeChannelRequest) -> JobStartResponse:
     """
@@ -1057,6 +1729,7 @@ async def scrape_channel_async(request: ScrapeChannelRequest) -> JobStartRespons
     - **channel_links** (opcional): Lista de URLs de canais
     - **wait_time** (default: 15): Timeout em segundos (5-600)
     - **webhook_url** (opcional): URL para notificação ao final
+    - **tabs** (opcional): Abas em paralelo no lote (fallback BATCH_TABS_DEFAULT no engine async e 1 no sync, teto BATCH_TABS_MAX)
 
     ## Exemplos de uso
 
@@ -1125,135 +1798,14 @@ async def scrape_channel_async(request: ScrapeChannelRequest) -> JobStartRespons
         if request.webhook_url:
             logger.info(f"  - Webhook: {request.webhook_url}")
 
-        # Disparar scraping em background
-        def scrape_job_sync():
-            job_manager.mark_job_processing(job_id)
-            logger.info(f"⏳ Job {job_id} iniciado")
-
-            service = TubeHuntService()
-            service._create_driver()
-            try:
-                # Login na MESMA thread
-                logger.info(f"[Job {job_id}] Fazendo login...")
-                service.username = username
-                service.password = password
-                service._access_login_page()
-                service._fill_credentials()
-                service._submit_form()
-                service._wait_for_redirect()
-
-                page = service.get_page()
-                logger.info(f"[Job {job_id}] Login concluído")
-
-                # ===== UM CANAL =====
-                if request.channel_link:
-                    logger.info(f"[Job {job_id}] Extraindo dados do canal: {request.channel_link}")
-                    channel_data = service.scrape_channel_details(page, request.channel_link)
-
-                    if not channel_data:
-                        raise Exception("Falha ao extrair dados do canal")
-
-                    logger.info(f"[Job {job_id}] ✅ Canal extraído com sucesso")
-
-                    # Preparar resultado para um canal
-                    job_result = {
-                        "channel_link": channel_data.channel_link,
-                        "keywords": channel_data.keywords,
-                        "subjects": channel_data.subjects,
-                        "niches": channel_data.niches,
-                        "views_30_days": channel_data.views_30_days,
-                        "revenue_30_days": channel_data.revenue_30_days
-                    }
-
-                # ===== MÚLTIPLOS CANAIS =====
-                else:
-                    logger.info(f"[Job {job_id}] Extraindo dados de {len(request.channel_links)} canais")
-                    channels_data = []
-                    failed_channels = []
-
-                    for idx, channel_link in enumerate(request.channel_links, 1):
-                        try:
-                            logger.info(f"[Job {job_id}] [{idx}/{len(request.channel_links)}] Extraindo: {channel_link}")
-                            channel_data = service.scrape_channel_details(page, channel_link)
-
-                            if not channel_data:
-                                raise Exception("Falha ao extrair dados do canal")
-
-                            channels_data.append(channel_data)
-                            logger.info(f"[Job {job_id}] [{idx}/{len(request.channel_links)}] ✅ Sucesso")
-
-                            # Atualizar progresso
-                            progress = int((idx / len(request.channel_links)) * 100)
-                            job_manager.update_job_progress(job_id, progress)
-
-                        except Exception as e:
-                            logger.error(f"[Job {job_id}] [{idx}/{len(request.channel_links)}] ❌ Erro: {str(e)}", exc_info=True)
-                            failed_channels.append({
-                                "channel_link": channel_link,
-                                "error": str(e)
-                            })
-                            continue
-
-                    logger.info(f"[Job {job_id}] ✅ Scraping concluído: {len(channels_data)}/{len(request.channel_links)} canais")
-
-                    # Preparar resultado para múltiplos canais
-                    # Converter ChannelDetailedData para dicts para serialização JSON
-                    channels_dicts = [
-                        {
-                            "channel_link": ch.channel_link,
-                            "keywords": ch.keywords,
-                            "subjects": ch.subjects,
-                            "niches": ch.niches,
-                            "views_30_days": ch.views_30_days,
-                            "revenue_30_days": ch.revenue_30_days
-                        }
-                        for ch in channels_data
-                    ]
-
-                    job_result = {
-                        "total_scraped": len(channels_data),
-                        "total_requested": len(request.channel_links),
-                        "channels": channels_dicts,
-                        "failed_channels": failed_channels
-                    }
-
-                job_manager.mark_job_completed(job_id, job_result)
-
-                # Enviar webhook se fornecido
-                if request.webhook_url:
-                    logger.info(f"[Job {job_id}] 📤 Enviando webhook para {request.webhook_url}")
-                    webhook_caller.send_webhook(
-                        webhook_url=request.webhook_url,
-                        job_id=job_id,
-                        status="completed",
-                        result=job_result,
-                        execution_time_seconds=None  # job_manager já calcula
-                    )
-
-            except Exception as e:
-                logger.error(f"[Job {job_id}] ❌ Erro: {str(e)}", exc_info=True)
-                job_manager.mark_job_failed(job_id, str(e))
-
-                # Enviar webhook com erro se fornecido
-                if request.webhook_url:
-                    logger.info(f"[Job {job_id}] 📤 Enviando webhook de erro para {request.webhook_url}")
-                    webhook_caller.send_webhook(
-                        webhook_url=request.webhook_url,
-                        job_id=job_id,
-                        status="failed",
-                        result=None,
-                        error=str(e)
-                    )
-
-            finally:
-                try:
-                    service.close()
-                except:
-                    pass
+        # Checkpoint do lote (sem a senha) para retomar após reinício ou falha
+        if request.channel_links:
+            checkpoint_store.start_job(
+                job_id, "scrape-channel", {**request.model_dump(exclude={"password"}), "username": username}
+            )
 
-        # Disparar em background usando executor
-        loop = asyncio.get_event_loop()
-        loop.run_in_executor(scraping_executor, scrape_job_sync)
+        # Disparar scraping em background
+        _launch_scrape_channel_job(job_id, request, username, password)
 
         # Retornar resposta imediata com job_id
         job_dict = job_manager.get_job_dict(job_id)
@@ -1280,6 +1832,117 @@ async def scrape_channel_async(request: ScrapeChannelRequest) -> JobStartRespons
         )
 
 
+def _resume_scrape_channel_job(checkpoint: dict, password: Optional[str] = None, webhook_url: Optional[str] = None) -> str:
+    """
+    Recriar o job de um checkpoint com o mesmo job_id e disparar o lote de novo
+
+    Os canais já gravados entram no resultado sem nova extração; só os links
+    restantes (e os que falharam) são extraídos.
+
+    Args:
+        checkpoint: Registro do checkpoint_store (get_job / interrupted_jobs)
+        password: Senha da conta (None = senha do .env, só se for a conta do .env)
+        webhook_url: Webhook que substitui o da request original
+
+    Returns:
+        job_id retomado
+
+    Raises:
+        ValueError: Conta diferente da do .env sem senha (a senha não é gravada no checkpoint)
+    """
+    job_id = checkpoint["job_id"]
+    request = ScrapeChannelRequest(**checkpoint["request"])
+    if webhook_url:
+        request.webhook_url = webhook_url
+
+    username = request.username or settings.user
+    if not password:
+        # Sem isso o serviço logaria a conta do checkpoint com a senha do .env
+        if username != settings.user:
+            raise ValueError(f"Informe a senha da conta {username} para retomar o job {job_id}")
+        password = settings.password
+
+    done = len(checkpoint_store.done_items(job_id))
+    job_manager.create_job(job_id)
+    checkpoint_store.start_job(job_id, checkpoint["kind"], checkpoint["request"])
+    logger.info(f"♻️ Retomando job {job_id}: {done}/{len(request.channel_links)} canais já no checkpoint")
+
+    _launch_scrape_channel_job(job_id, request, username, password)
+    return job_id
+
+
+def resume_checkpointed_jobs() -> int:
+    """
+    Retomar os lotes de /scrape-channel interrompidos por reinício do processo
+
+    Chamado na inicialização da API (CHECKPOINT_RESUME_ON_STARTUP).
+
+    Returns:
+        Número de jobs retomados
+    """
+    checkpoint_store.cleanup(settings.CHECKPOINT_RETENTION_HOURS)
+    resumed = 0
+    for checkpoint in checkpoint_store.interrupted_jobs():
+        try:
+            _resume_scrape_channel_job(checkpoint)
+            resumed += 1
+        except ValueError as e:
+            # Falha até alguém retomar pelo endpoint com a senha
+            logger.warning(f"⚠️ Job {checkpoint['job_id']} não retomado: {str(e)}")
+            checkpoint_store.finish(checkpoint["job_id"], "failed")
+        except Exception as e:
+            logger.error(f"❌ Falha ao retomar job {checkpoint['job_id']}: {str(e)}", exc_info=True)
+            checkpoint_store.finish(checkpoint["job_id"], "failed")
+    if resumed:
+        logger.info(f"✅ {resumed} jobs retomados do checkpoint")
+    return resumed
+
+
+@router.post("/scrape-channel/resume/{job_id}", response_model=JobStartResponse)
+async def resume_scrape_channel(job_id: str, request: Optional[ScrapeChannelResumeRequest] = None) -> JobStartResponse:
+    """
+    Retomar um lote de /scrape-channel a partir do checkpoint
+
+    ## Descrição
+    Reexecuta o job com o **mesmo job_id**: os canais já extraídos (gravados no
+    checkpoint) são reaproveitados e só os restantes são extraídos. O resultado
+    final contém todos os canais, na ordem dos links originais.
+
+    Útil quando o job falhou no meio do lote ou quando o processo reiniciou com
+    `CHECKPOINT_RESUME_ON_STARTUP=false`.
+
+    ## Body Parameters (opcional)
+    - **password** (opcional): Senha da conta (não é gravada no checkpoint)
+    - **webhook_url** (opcional): Substitui o webhook da request original
+
+    ## Erros
+    - 400: Conta diferente da do .env e password não informado
+    - 404: Job sem checkpoint
+    - 409: Job ainda em execução ou já concluído
+    """
+    checkpoint = checkpoint_store.get_job(job_id)
+    if not checkpoint:
+        raise HTTPException(status_code=404, detail=f"Checkpoint não encontrado para o job {job_id}")
+
+    job = job_manager.get_job(job_id)
+    if checkpoint["status"] == "completed" or (job and job.status in (JobStatus.PENDING, JobStatus.PROCESSING)):
+        raise HTTPException(status_code=409, detail=f"Job {job_id} não pode ser retomado (status: {checkpoint['status']})")
+
+    request = request or ScrapeChannelResumeRequest()
+    try:
+        _resume_scrape_channel_job(checkpoint, password=request.password, webhook_url=request.webhook_url)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    job_dict = job_manager.get_job_dict(job_id)
+    return JobStartResponse(
+        job_id=job_id,
+        status=job_dict["status"],
+        message="Job retomado a partir do checkpoint",
+        created_at=datetime.fromisoformat(job_dict["created_at"])
+    )
+
+
 @router.get("/scrape-channel/status/{job_id}", response_model=JobStatusResponse)
 async def get_scrape_channel_status(job_id: str) -> JobStatusResponse:
     """
@@ -1341,7 +2004,9 @@ async def get_scrape_channel_status(job_id: str) -> JobStatusResponse:
             status=job_dict["status"],
             progress=job_dict["progress"],
             message=job_dict.get("message", ""),
-            started_at=datetime.fromisoformat(job_dict["started_at"]) if job_dict.get("started_at") else None
+            started_at=datetime.fromisoformat(job_dict["started_at"]) if job_dict.get("started_at") else None,
+            concurrency=job_dict.get("concurrency"),
+            rate_limit_wait_seconds=job_dict.get("rate_limit_wait_seconds")
         )
 
     except HTTPException:
@@ -1397,8 +2062,9 @@ async def get_scrape_channel_result(job_id: str) -> JobResultResponse:
       "result": {
         "total_scraped": 2,
         "total_requested": 2,
-        "channels": [...],
-        "failed_channels": []
+        "failed_channels": [],
+        "results_total": 2,
+        "results_url": "/api/v1/tubehunt/jobs/550e8400-e29b-41d4-a716-446655440000/results"
       },
       "execution_time_seconds": 120.5,
       "completed_at": "2026-02-09T17:02:00.000000"
@@ -1452,6 +2118,7 @@ async def scrape_channel_async(session_id: str, request: ScrapeChannelRequest) -
     - **session_id**: ID da sessão (obtido em POST /login)
     - **channel_links**: Lista de URLs de canais
     - **webhook_url** (opcional): URL para notificação quando terminar
+    - **tabs** (opcional): Abas em paralelo no mesmo contexto autenticado (teto BATCH_TABS_MAX)
 
     ## Resposta imediata
     ```json
@@ -1505,13 +2172,12 @@ async def scrape_channel_async(session_id: str, request: ScrapeChannelRequest) -
             try:
                 logger.info(f"[Job {job_id}] Iniciando scraping de {len(request.channel_links)} canais...")
                 job_manager.mark_job_processing(job_id)
+                bind_job(job_id)
 
                 start_time = time.time()
-                channels_data = []
-                failed_channels = []
+                stream = _ResultStream(job_id, request.webhook_url)
 
                 service = None
-                page = None
                 try:
                     # Criar nova instância de serviço completamente independente
                     # Playwright sync_api usa greenlet que é vinculado à thread - não pode ser reutilizado
@@ -1520,49 +2186,33 @@ async def scrape_channel_async(session_id: str, request: ScrapeChannelRequest) -
                     service = TubeHuntService()
                     service._create_driver()
 
-                    page = service.page
                     logger.info(f"[Job {job_id}] Browser criado, fazendo login...")
 
                     # Fazer login manualmente
-                    service._access_login_page()
-                    service._fill_credentials()
-                    service._submit_form()
-                    service._wait_for_redirect()
+                    service.authenticate()
 
                     logger.info(f"[Job {job_id}] Login bem-sucedido, iniciando scraping")
 
-                    # Scrape each channel sequentially
-                    for idx, channel_link in enumerate(request.channel_links, 1):
-                        try:
-                            logger.info(f"[Job {job_id}] [{idx}/{len(request.channel_links)}] 🔍 Extraindo: {channel_link}")
-                            channel_data = service.scrape_channel_details(page, channel_link)
-
-                            if not channel_data:
-                                raise Exception("Falha ao extrair dados do canal")
-
-                            channels_data.append(channel_data)
-                            logger.info(f"[Job {job_id}] [{idx}/{len(request.channel_links)}] ✅ Sucesso!")
-
-                        except Exception as e:
-                            logger.error(f"[Job {job_id}] [{idx}/{len(request.channel_links)}] ❌ Erro: {str(e)}", exc_info=True)
-                            failed_channels.append({
-                                "channel_link": channel_link,
-                                "error": str(e)
-                            })
-                            continue
+                    total_scraped, failed_channels = run_detail_batch(
+                        service,
+                        request.channel_links,
+                        tabs=request.tabs,
+                        on_result=stream.add,
+                        on_progress=lambda done, total: job_manager.update_job_progress(job_id, int(done / total * 100)),
+                    )
 
                     execution_time = time.time() - start_time
 
-                    # Preparar resultado
+                    # Preparar resultado (canais em GET /jobs/{job_id}/results)
                     scrape_result = {
-                        "total_scraped": len(channels_data),
+                        "total_scraped": total_scraped,
                         "total_requested": len(request.channel_links),
-                        "channels": channels_data,
                         "failed_channels": failed_channels,
-                        "session_id": session_id
+                        "session_id": session_id,
+                        **stream.reference(),
                     }
 
-                    logger.info(f"[Job {job_id}] ✅ Scraping concluído: {len(channels_data)}/{len(request.channel_links)} canais")
+                    logger.info(f"[Job {job_id}] ✅ Scraping concluído: {total_scraped}/{len(request.channel_links)} canais")
                     job_manager.mark_job_completed(job_id, scrape_result)
 
                     # Chamar webhook se fornecido
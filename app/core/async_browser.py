@@ -0,0 +1,357 @@
+"""
+Gerenciador de navegador Playwright Async API.
+
+Todas as páginas async compartilham um único event loop (em uma thread
+dedicada) e um único navegador; cada job abre apenas um BrowserContext.
+Assim dezenas de páginas podem aguardar rede ao mesmo tempo sem ocupar
+uma thread cada.
+"""
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Optional, Dict, Any, Coroutine
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Playwright
+from app.core.browser import _count_recycle
+from app.core.config import settings
+from app.core.request_policy import RequestRoutingPolicy
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncBrowserEngine:
+    """
+    Event loop dedicado com uma instância Playwright async e um navegador compartilhado.
+
+    Código síncrono (endpoints, threads de job) envia corrotinas com submit()/run();
+    o navegador é lançado sob demanda e relançado se desconectar.
+    """
+
+    def __init__(self, browser_type: str = "chromium", headless: bool = True, max_pages: int = 20):
+        """
+        Inicializar AsyncBrowserEngine.
+
+        Args:
+            browser_type: Tipo de navegador ("chromium", "firefox", "webkit")
+            headless: Se True, executa em modo headless
+            max_pages: Máximo de páginas abertas simultaneamente no engine
+        """
+        self.browser_type = browser_type
+        self.headless = headless
+        self.max_pages = max_pages
+        self.playwright: Optional[Playwright] = None
+        self.browser: Optional[Browser] = None
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._browser_lock: Optional[asyncio.Lock] = None
+        self.page_slots: Optional[asyncio.Semaphore] = None
+
+    def start(self):
+        """Iniciar thread do event loop (idempotente)."""
+        with self._start_lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+
+            self.loop = asyncio.new_event_loop()
+            ready = threading.Event()
+
+            def run_loop():
+                asyncio.set_event_loop(self.loop)
+                self._browser_lock = asyncio.Lock()
+                self.page_slots = asyncio.Semaphore(self.max_pages)
+                ready.set()
+                self.loop.run_forever()
+
+            self._thread = threading.Thread(target=run_loop, name="async-browser-engine", daemon=True)
+            self._thread.start()
+            ready.wait()
+            logger.info(f"✅ Engine async iniciado (max_pages={self.max_pages})")
+
+    def submit(self, coro: Coroutine) -> Future:
+        """
+        Agendar corrotina no loop do engine.
+
+        Args:
+            coro: Corrotina a executar
+
+        Returns:
+            concurrent.futures.Future com o resultado
+        """
+        self.start()
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Coroutine, timeout: Optional[float] = None) -> Any:
+        """
+        Executar corrotina no loop do engine e aguardar o resultado (bloqueante).
+
+        Não deve ser chamado de dentro do próprio loop do engine.
+        """
+        return self.submit(coro).result(timeout=timeout)
+
+    async def get_browser(self) -> Browser:
+        """
+        Obter navegador compartilhado, lançando ou relançando se necessário.
+
+        Returns:
+            Browser: Navegador conectado
+        """
+        async with self._browser_lock:
+            if self.browser is not None and self.browser.is_connected():
+                return self.browser
+
+            if self.playwright is None:
+                self.playwright = await async_playwright().start()
+                logger.info("✅ Instância Playwright async criada")
+
+            if self.browser_type == "chromium":
+                launcher = self.playwright.chromium
+            elif self.browser_type == "firefox":
+                launcher = self.playwright.firefox
+            elif self.browser_type == "webkit":
+                launcher = self.playwright.webkit
+            else:
+                raise ValueError(f"Browser type inválido: {self.browser_type}")
+
+            if settings.BROWSER_HOST_ENABLED and self.browser_type == "chromium":
+                self.browser = await self._connect_to_host()
+                return self.browser
+
+            self.browser = await launcher.launch(headless=self.headless)
+            logger.info(f"✅ Navegador async {self.browser_type} lançado (headless={self.headless})")
+            return self.browser
+
+    async def _connect_to_host(self) -> Browser:
+        """Conectar ao Chromium do BrowserHost, tentando novamente se o host estiver reiniciando."""
+        endpoint = settings.BROWSER_HOST_ENDPOINT
+        attempts = settings.BROWSER_HOST_CONNECT_ATTEMPTS
+        for attempt in range(1, attempts + 1):
+            try:
+                browser = await self.playwright.chromium.connect_over_cdp(endpoint)
+                logger.info(f"✅ [async] Conectado ao BrowserHost em {endpoint}")
+                return browser
+            except Exception as e:
+                logger.warning(f"⚠️ [async] Falha ao conectar ao BrowserHost ({attempt}/{attempts}): {str(e)}")
+                if attempt == attempts:
+                    raise
+                await asyncio.sleep(settings.BROWSER_HOST_CONNECT_DELAY)
+
+    async def shutdown(self):
+        """Fechar navegador e Playwright do engine."""
+        if self.browser is not None:
+            try:
+                await self.browser.close()
+            except Exception as e:
+                logger.warning(f"⚠️ Erro ao fechar navegador async: {str(e)}")
+            self.browser = None
+
+        if self.playwright is not None:
+            await self.playwright.stop()
+            self.playwright = None
+
+    def stop(self):
+        """Encerrar navegador e loop do engine."""
+        if self.loop is None or self._thread is None or not self._thread.is_alive():
+            return
+        try:
+            self.run(self.shutdown(), timeout=30)
+        finally:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join(timeout=10)
+            logger.info("✅ Engine async encerrado")
+
+
+# Instância global do engine async
+async_engine = AsyncBrowserEngine(
+    headless=settings.SELENIUM_HEADLESS,
+    max_pages=settings.ASYNC_MAX_CONCURRENT_PAGES,
+)
+
+
+class AsyncPlaywrightBrowserManager:
+    """
+    Equivalente async de PlaywrightBrowserManager.
+
+    Usa o navegador compartilhado do AsyncBrowserEngine e cria um contexto
+    próprio por job. Deve ser usado dentro do loop do engine.
+    """
+
+    def __init__(
+        self,
+        engine: Optional[AsyncBrowserEngine] = None,
+        viewport: Optional[dict] = None,
+        routing_policy: Optional[RequestRoutingPolicy] = None,
+    ):
+        """
+        Inicializar AsyncPlaywrightBrowserManager.
+
+        Args:
+            engine: Engine async (None = instância global)
+            viewport: Dicionário com "width" e "height" ou None para padrão
+            routing_policy: Política que aborta requisições desnecessárias
+        """
+        self.engine = engine or async_engine
+        self.viewport = viewport or {"width": 1280, "height": 720}
+        self.routing_policy = routing_policy
+        self.context: Optional[BrowserContext] = None
+        self.page: Optional[Page] = None
+        self._holds_slot = False
+        # Navegações (frame principal) desde a criação da página / do contexto atuais
+        self.page_navigations = 0
+        self.context_navigations = 0
+
+    async def __aenter__(self):
+        """Context manager entry - criar contexto e página."""
+        await self.launch()
+        return self.page
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - limpar recursos."""
+        await self.close()
+        return False
+
+    async def new_context(self, storage_state: Optional[Dict[str, Any]] = None) -> BrowserContext:
+        """
+        Criar contexto no navegador compartilhado, com a política de requisições aplicada.
+
+        Args:
+            storage_state: Cookies/localStorage para iniciar o contexto autenticado
+
+        Returns:
+            BrowserContext: Novo contexto
+        """
+        browser = await self.engine.get_browser()
+        options: Dict[str, Any] = {"viewport": self.viewport}
+        if storage_state:
+            options["storage_state"] = storage_state
+        context = await browser.new_context(**options)
+        if self.routing_policy is not None:
+            await self.routing_policy.apply_async(context)
+        return context
+
+    async def try_reserve_slot(self) -> bool:
+        """
+        Ocupar uma vaga de página do engine sem aguardar (launch() usa a vaga reservada).
+
+        Returns:
+            bool: True se a vaga está reservada; False se o engine está no limite de páginas
+        """
+        if self._holds_slot:
+            return True
+        if self.engine.page_slots.locked():
+            return False
+        await self.engine.page_slots.acquire()
+        self._holds_slot = True
+        return True
+
+    async def launch(self, storage_state: Optional[Dict[str, Any]] = None) -> Page:
+        """
+        Criar contexto e página (aguarda vaga se o engine estiver no limite de páginas).
+
+        Args:
+            storage_state: Cookies/localStorage para iniciar o contexto autenticado
+
+        Returns:
+            Page: Página Playwright async
+        """
+        if not self._holds_slot:
+            await self.engine.page_slots.acquire()
+            self._holds_slot = True
+
+        try:
+            self.context = await self.new_context(storage_state)
+            await self._new_page()
+            logger.info("✅ Página async criada")
+            return self.page
+        except Exception as e:
+            logger.error(f"❌ Erro ao criar página async: {str(e)}")
+            await self.close()
+            raise
+
+    async def reset_context(self, storage_state: Optional[Dict[str, Any]] = None) -> Page:
+        """
+        Substituir contexto e página atuais por novos.
+
+        Args:
+            storage_state: Cookies/localStorage para o novo contexto
+
+        Returns:
+            Page: Nova página
+        """
+        await self._close_context()
+        return await self.launch(storage_state)
+
+    async def _new_page(self) -> Page:
+        """Criar página no contexto atual e contar suas navegações."""
+        self.page = await self.context.new_page()
+        self.page_navigations = 0
+        page = self.page
+
+        def on_navigated(frame):
+            if frame == page.main_frame:
+                self.page_navigations += 1
+                self.context_navigations += 1
+
+        page.on("framenavigated", on_navigated)
+        return page
+
+    async def maybe_recycle(self) -> Page:
+        """
+        Reciclar página ou contexto se os limites de navegação foram atingidos.
+
+        O navegador é compartilhado pelo engine inteiro, então aqui só há
+        reciclagem de página e contexto (com storage_state preservado).
+
+        Returns:
+            Page: Página a usar a partir de agora
+        """
+        if self.page is None or self.context is None:
+            return await self.launch()
+
+        context_limit = settings.RECYCLE_CONTEXT_AFTER_NAVIGATIONS
+        if context_limit > 0 and self.context_navigations >= context_limit:
+            logger.info(f"♻️ [async] Contexto atingiu {self.context_navigations} navegações, reciclando contexto")
+            storage_state = await self.export_storage_state()
+            await self.reset_context(storage_state)
+            _count_recycle("context")
+            return self.page
+
+        page_limit = settings.RECYCLE_PAGE_AFTER_NAVIGATIONS
+        if page_limit > 0 and self.page_navigations >= page_limit:
+            logger.info(f"♻️ [async] Página atingiu {self.page_navigations} navegações, reciclando página")
+            await self.page.close()
+            await self._new_page()
+            _count_recycle("page")
+            return self.page
+
+        return self.page
+
+    async def export_storage_state(self) -> Optional[Dict[str, Any]]:
+        """Exportar cookies e localStorage do contexto atual."""
+        if self.context is None:
+            return None
+        return await self.context.storage_state()
+
+    async def _close_context(self):
+        """Fechar página e contexto atuais."""
+        if self.page:
+            await self.page.close()
+            self.page = None
+
+        if self.context:
+            await self.context.close()
+            self.context = None
+            self.context_navigations = 0
+
+    async def close(self):
+        """Fechar página e contexto e liberar a vaga no engine."""
+        try:
+            await self._close_context()
+            logger.info("✅ Contexto async fechado")
+        except Exception as e:
+            logger.error(f"❌ Erro ao fechar contexto async: {str(e)}")
+        finally:
+            if self._holds_slot:
+                self.engine.page_slots.release()
+                self._holds_slot = False
@@ -0,0 +1,128 @@
+"""
+Auth State Cache - Cache em disco de storage_state autenticado do Playwright
+
+Guarda cookies e localStorage de uma sessão logada por credencial, para que
+novos BrowserContexts da mesma conta já iniciem autenticados e o fluxo
+completo de login seja pulado enquanto o estado estiver válido.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, Any, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class AuthStateCache:
+    """
+    Cache de storage_state com TTL, chaveado por credencial
+
+    Responsável por:
+    - Salvar storage_state (cookies + localStorage) após login bem-sucedido
+    - Recuperar estado válido (dentro do TTL) para a mesma conta
+    - Invalidar estado quando a sessão for rejeitada pelo site
+    """
+
+    def __init__(self, directory: str = ".auth_state", ttl_seconds: int = 21600):
+        """
+        Inicializa o cache
+
+        Args:
+            directory: Diretório onde os arquivos de estado são salvos
+            ttl_seconds: Tempo de validade de um estado salvo
+        """
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+        self.lock = threading.RLock()
+
+    def _path(self, username: str, login_url: str) -> str:
+        """Caminho do arquivo de estado (hash evita expor o email no disco)"""
+        key = hashlib.sha256(f"{login_url}|{username}".encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{key}.json")
+
+    def load(self, username: str, login_url: str) -> Optional[Dict[str, Any]]:
+        """
+        Recupera o storage_state de uma conta se ainda estiver dentro do TTL
+
+        Args:
+            username: Email/username da conta
+            login_url: URL de login (separa contas de ambientes diferentes)
+
+        Returns:
+            storage_state ou None se ausente/expirado
+        """
+        path = self._path(username, login_url)
+
+        with self.lock:
+            if not os.path.exists(path):
+                return None
+
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    entry = json.load(f)
+            except Exception as e:
+                logger.warning(f"⚠️ [AuthState] Arquivo de estado inválido, descartando: {str(e)}")
+                self._remove(path)
+                return None
+
+            age = time.time() - entry.get("saved_at", 0)
+            if age > self.ttl_seconds:
+                logger.info(f"[AuthState] Estado expirado ({age:.0f}s), descartando")
+                self._remove(path)
+                return None
+
+            return entry.get("storage_state")
+
+    def save(self, username: str, login_url: str, storage_state: Dict[str, Any]):
+        """
+        Salva o storage_state de uma conta
+
+        Args:
+            username: Email/username da conta
+            login_url: URL de login
+            storage_state: Resultado de BrowserContext.storage_state()
+        """
+        path = self._path(username, login_url)
+        entry = {"saved_at": time.time(), "storage_state": storage_state}
+
+        with self.lock:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            # Cookies de sessão: apenas o próprio usuário do processo pode ler
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, path)
+
+        logger.info(f"✅ [AuthState] Estado autenticado salvo ({len(storage_state.get('cookies', []))} cookies)")
+
+    def invalidate(self, username: str, login_url: str):
+        """
+        Remove o estado salvo de uma conta
+
+        Args:
+            username: Email/username da conta
+            login_url: URL de login
+        """
+        with self.lock:
+            self._remove(self._path(username, login_url))
+
+    def _remove(self, path: str):
+        """Remove arquivo de estado (sem lock - usar apenas dentro de lock)"""
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+# Instância global do cache de estado autenticado
+auth_state_cache = AuthStateCache(
+    directory=settings.AUTH_STATE_DIR,
+    ttl_seconds=settings.AUTH_STATE_TTL_SECONDS,
+)
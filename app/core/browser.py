@@ -3,9 +3,15 @@ Gerenciador de navegador Playwright com suporte a context manager.
 """
 
 import logging
-from typing import Optional
-from playwright.sync_api import sync_playwright, Browser, BrowserContext, Page, Playwright
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Optional, Dict, Any, List, Tuple
+from playwright.sync_api import sync_playwright, Browser, BrowserContext, BrowserType, Page, Playwright
 import threading
+from app.core.browser_host import connect_to_host
+from app.core.config import settings
+from app.core.request_policy import RequestRoutingPolicy
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +35,456 @@ def _get_or_create_playwright() -> Playwright:
     return _thread_local.playwright_instance
 
 
+def _get_browser_launcher(playwright: Playwright, browser_type: str) -> BrowserType:
+    """Selecionar launcher do Playwright pelo tipo de navegador."""
+    if browser_type == "chromium":
+        return playwright.chromium
+    elif browser_type == "firefox":
+        return playwright.firefox
+    elif browser_type == "webkit":
+        return playwright.webkit
+    raise ValueError(f"Browser type inválido: {browser_type}")
+
+
+def _start_browser(playwright: Playwright, browser_type: str, headless: bool) -> Browser:
+    """
+    Obter navegador para a thread atual: conexão ao BrowserHost (se ativo) ou lançamento local.
+
+    O host só executa Chromium; outros tipos continuam sendo lançados localmente.
+    """
+    if settings.BROWSER_HOST_ENABLED and browser_type == "chromium":
+        return connect_to_host(playwright)
+    return _get_browser_launcher(playwright, browser_type).launch(headless=headless)
+
+
+def _driver_pid(playwright: Optional[Playwright]) -> Optional[int]:
+    """
+    PID do driver Playwright de uma instância (um driver por thread).
+
+    Os navegadores lançados pela thread são descendentes desse processo.
+    Usa atributos internos do Playwright; retorna None se não estiverem disponíveis.
+    """
+    try:
+        return playwright._impl_obj._connection._transport._proc.pid
+    except AttributeError:
+        return None
+
+
+def sample_browser_rss_mb(root_pid: Optional[int] = None) -> Optional[float]:
+    """
+    Somar o RSS (MB) dos processos de navegador descendentes de root_pid.
+
+    Lê /proc, então só funciona em Linux; retorna None em outras plataformas.
+    Sem root_pid, inclui todos os navegadores do processo (pool e dedicados);
+    com o PID do driver de uma thread, só os navegadores daquela thread.
+    """
+    if not os.path.isdir("/proc"):
+        return None
+
+    children: Dict[int, list] = {}
+    names: Dict[int, str] = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", "r") as f:
+                stat = f.read()
+            # Formato: pid (comm) state ppid ...
+            comm = stat[stat.index("(") + 1:stat.rindex(")")]
+            ppid = int(stat[stat.rindex(")") + 2:].split()[1])
+        except (OSError, ValueError, IndexError):
+            continue
+        pid = int(entry)
+        names[pid] = comm
+        children.setdefault(ppid, []).append(pid)
+
+    total_kb = 0
+    stack = list(children.get(root_pid or os.getpid(), []))
+    while stack:
+        pid = stack.pop()
+        stack.extend(children.get(pid, []))
+        name = names.get(pid, "").lower()
+        if "chrom" not in name and "headless_shell" not in name and "firefox" not in name and "webkit" not in name:
+            continue
+        try:
+            with open(f"/proc/{pid}/status", "r") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        total_kb += int(line.split()[1])
+                        break
+        except (OSError, ValueError):
+            continue
+
+    return total_kb / 1024
+
+
+# Contadores globais de reciclagem (página, contexto, navegador)
+_recycle_lock = threading.Lock()
+recycle_stats = {"page": 0, "context": 0, "browser": 0}
+
+
+def _count_recycle(level: str):
+    """Incrementar contador de reciclagem."""
+    with _recycle_lock:
+        recycle_stats[level] += 1
+
+
+class BrowserPool:
+    """
+    Pool de navegadores persistentes, um por thread de scraping.
+
+    A Sync API do Playwright vincula cada navegador à thread que o lançou,
+    então o pool mantém um navegador vivo por thread elegível (threads do
+    executor cujo nome começa com `thread_prefix`). Cada job recebe um
+    BrowserContext novo desse navegador e o devolve ao terminar, evitando
+    lançar e fechar o Chromium a cada job.
+
+    Outros executors entram com add_thread_group(): cada prefixo de thread tem
+    seus próprios slots (o tamanho do executor), e uma thread conta no grupo do
+    prefixo mais longo que casa com seu nome.
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        thread_prefix: str = "scraper",
+        health_check_interval: int = 60,
+        enabled: bool = True,
+    ):
+        """
+        Inicializar BrowserPool.
+
+        Args:
+            size: Número máximo de threads com navegador persistente do grupo thread_prefix
+            thread_prefix: Prefixo do nome das threads elegíveis ao pool
+            health_check_interval: Segundos entre verificações ativas do navegador
+            enabled: Se False, o pool nunca empresta contextos
+        """
+        self.size = size
+        self.thread_prefix = thread_prefix
+        self.health_check_interval = health_check_interval
+        self.enabled = enabled
+        self.lock = threading.RLock()
+        # Slots por grupo de threads (prefixo do nome -> tamanho), um grupo por executor
+        self.group_sizes: Dict[str, int] = {thread_prefix: size}
+        # Threads que ocupam um slot do pool (ident -> nome)
+        self._slots: Dict[int, str] = {}
+        self._stats = {
+            "browsers_launched": 0,
+            "contexts_leased": 0,
+            "contexts_active": 0,
+            "health_check_failures": 0,
+        }
+        # Estado do warm-up: "cold" → "warming" → "ready" (ou "failed")
+        self.warmup_state = "cold"
+        self.warmup_seconds: Optional[float] = None
+
+    def add_thread_group(self, thread_prefix: str, size: int):
+        """
+        Registrar os slots das threads de outro executor
+
+        Args:
+            thread_prefix: thread_name_prefix do executor
+            size: Número de workers do executor
+        """
+        with self.lock:
+            self.group_sizes[thread_prefix] = size
+
+    def _group_of(self, thread_name: str) -> Optional[str]:
+        """Grupo (prefixo mais longo) de uma thread; None se não for elegível"""
+        prefixes = [prefix for prefix in self.group_sizes if thread_name.startswith(prefix)]
+        return max(prefixes, key=len) if prefixes else None
+
+    def _thread_browsers(self) -> Dict[tuple, Dict[str, Any]]:
+        """Navegadores do pool pertencentes à thread atual."""
+        if not hasattr(_thread_local, "pooled_browsers"):
+            _thread_local.pooled_browsers = {}
+        return _thread_local.pooled_browsers
+
+    def is_eligible(self) -> bool:
+        """
+        Verificar se a thread atual pode usar o pool.
+
+        Returns:
+            bool: True se o pool está ativo, a thread é do executor de scraping
+                  e há slot livre (ou a thread já possui um)
+        """
+        if not self.enabled:
+            return False
+
+        thread = threading.current_thread()
+        with self.lock:
+            group = self._group_of(thread.name)
+            if group is None:
+                return False
+            if thread.ident in self._slots:
+                return True
+
+            # Liberar slots de threads que já terminaram
+            alive = {t.ident for t in threading.enumerate()}
+            for ident in [i for i in self._slots if i not in alive]:
+                del self._slots[ident]
+
+            used = sum(1 for name in self._slots.values() if self._group_of(name) == group)
+            return used < self.group_sizes[group]
+
+    def _reserve_slot(self):
+        """Reservar slot do pool para a thread atual."""
+        thread = threading.current_thread()
+        with self.lock:
+            self._slots[thread.ident] = thread.name
+
+    def _launch(self, browser_type: str, headless: bool) -> Dict[str, Any]:
+        """Lançar navegador persistente para a thread atual."""
+        playwright = _get_or_create_playwright()
+        browser = _start_browser(playwright, browser_type, headless)
+        self._reserve_slot()
+
+        with self.lock:
+            self._stats["browsers_launched"] += 1
+
+        logger.info(
+            f"✅ [Pool] Navegador {browser_type} persistente lançado "
+            f"(thread: {threading.current_thread().name}, headless={headless})"
+        )
+        return {"browser": browser, "last_health_check": time.time()}
+
+    def _is_healthy(self, entry: Dict[str, Any]) -> bool:
+        """
+        Verificar saúde do navegador.
+
+        A verificação passiva (is_connected) roda sempre; a ativa (abrir e
+        fechar um contexto descartável) roda a cada health_check_interval.
+        """
+        browser: Browser = entry["browser"]
+        if not browser.is_connected():
+            return False
+
+        if time.time() - entry["last_health_check"] < self.health_check_interval:
+            return True
+
+        try:
+            browser.new_context().close()
+            entry["last_health_check"] = time.time()
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️ [Pool] Health check falhou: {str(e)}")
+            return False
+
+    def get_browser(self, browser_type: str = "chromium", headless: bool = True) -> Browser:
+        """
+        Obter navegador persistente da thread atual, lançando ou substituindo se necessário.
+
+        Args:
+            browser_type: Tipo de navegador ("chromium", "firefox", "webkit")
+            headless: Se True, executa em modo headless
+
+        Returns:
+            Browser: Navegador saudável vinculado à thread atual
+        """
+        browsers = self._thread_browsers()
+        key = (browser_type, headless)
+        entry = browsers.get(key)
+
+        if entry is not None and not self._is_healthy(entry):
+            logger.warning("⚠️ [Pool] Navegador não saudável, relançando...")
+            with self.lock:
+                self._stats["health_check_failures"] += 1
+            try:
+                entry["browser"].close()
+            except Exception:
+                pass
+            entry = None
+
+        if entry is None:
+            entry = self._launch(browser_type, headless)
+            browsers[key] = entry
+
+        return entry["browser"]
+
+    def lease_context(self, browser_type: str = "chromium", headless: bool = True, **context_options) -> Optional[BrowserContext]:
+        """
+        Emprestar um BrowserContext novo do navegador da thread atual.
+
+        Args:
+            browser_type: Tipo de navegador ("chromium", "firefox", "webkit")
+            headless: Se True, executa em modo headless
+            **context_options: Opções repassadas para browser.new_context()
+
+        Returns:
+            BrowserContext novo ou None se a thread não for elegível ao pool
+        """
+        if not self.is_eligible():
+            return None
+
+        browser = self.get_browser(browser_type, headless)
+        try:
+            context = browser.new_context(**context_options)
+        except Exception as e:
+            # Navegador pode ter caído entre o health check e o new_context
+            logger.warning(f"⚠️ [Pool] Falha ao criar contexto, relançando navegador: {str(e)}")
+            self._thread_browsers().pop((browser_type, headless), None)
+            browser = self.get_browser(browser_type, headless)
+            context = browser.new_context(**context_options)
+
+        with self.lock:
+            self._stats["contexts_leased"] += 1
+            self._stats["contexts_active"] += 1
+
+        return context
+
+    def release_context(self, context: BrowserContext):
+        """
+        Devolver contexto ao pool (o contexto é fechado; o navegador continua vivo).
+
+        Args:
+            context: Contexto obtido via lease_context()
+        """
+        try:
+            context.close()
+        finally:
+            with self.lock:
+                self._stats["contexts_active"] = max(0, self._stats["contexts_active"] - 1)
+
+    def recycle_browser(self, browser_type: str = "chromium", headless: bool = True) -> Browser:
+        """
+        Fechar e relançar o navegador persistente da thread atual.
+
+        Os contextos ainda abertos nesse navegador são perdidos; quem chama
+        deve ter exportado o storage_state antes.
+
+        Returns:
+            Browser: Novo navegador da thread
+        """
+        entry = self._thread_browsers().pop((browser_type, headless), None)
+        if entry is not None:
+            try:
+                entry["browser"].close()
+            except Exception as e:
+                logger.warning(f"⚠️ [Pool] Erro ao fechar navegador reciclado: {str(e)}")
+        return self.get_browser(browser_type, headless)
+
+    def warm_up(self, browser_type: str = "chromium", headless: bool = True) -> bool:
+        """
+        Lançar antecipadamente o navegador da thread atual.
+
+        Returns:
+            bool: True se a thread é elegível e o navegador está pronto
+        """
+        if not self.is_eligible():
+            return False
+        self.get_browser(browser_type, headless)
+        return True
+
+    def _warm_up_group(
+        self,
+        executor: ThreadPoolExecutor,
+        thread_prefix: str,
+        browser_type: str,
+        headless: bool,
+        timeout: float,
+    ) -> Tuple[int, int]:
+        """
+        Aquecer as threads de um executor (uma por slot do grupo do seu prefixo)
+
+        Returns:
+            (navegadores prontos, slots do grupo)
+        """
+        size = self.group_sizes[thread_prefix]
+        barrier = threading.Barrier(size)
+
+        def warm_thread() -> bool:
+            try:
+                return self.warm_up(browser_type, headless)
+            finally:
+                # Segurar a thread até todas as outras estarem ocupadas
+                try:
+                    barrier.wait(timeout=timeout)
+                except threading.BrokenBarrierError:
+                    pass
+
+        futures = [executor.submit(warm_thread) for _ in range(size)]
+        done, not_done = wait(futures, timeout=timeout)
+        if not_done:
+            logger.error(f"❌ [Pool] Warm-up das threads {thread_prefix} não terminou em {timeout}s")
+            barrier.abort()
+
+        ready = 0
+        for future in done:
+            try:
+                ready += 1 if future.result() else 0
+            except Exception as e:
+                logger.error(f"❌ [Pool] Falha no warm-up ({thread_prefix}): {str(e)}")
+        return ready, size
+
+    def warm_up_executors(
+        self,
+        executors: List[Tuple[ThreadPoolExecutor, str]],
+        browser_type: str = "chromium",
+        headless: bool = True,
+        timeout: float = 120,
+    ) -> bool:
+        """
+        Aquecer todas as threads dos executors que usam o pool (bloqueante).
+
+        Para cada executor, envia uma tarefa por slot do grupo do seu prefixo;
+        as tarefas só terminam juntas (barreira), o que obriga o executor a
+        criar uma thread distinta para cada uma. Cada thread inicia seu driver
+        Playwright e lança seu navegador persistente.
+
+        Args:
+            executors: (executor, thread_name_prefix) de cada executor; o prefixo
+                deve ter sido registrado (thread_prefix ou add_thread_group)
+            browser_type: Tipo de navegador a lançar
+            headless: Se True, executa em modo headless
+            timeout: Segundos máximos de espera pelo warm-up de cada executor
+
+        Returns:
+            bool: True se todas as threads ficaram com navegador pronto
+        """
+        if not self.enabled:
+            return False
+
+        self.warmup_state = "warming"
+        started = time.time()
+        ready = total = 0
+        for executor, thread_prefix in executors:
+            group_ready, group_size = self._warm_up_group(executor, thread_prefix, browser_type, headless, timeout)
+            ready += group_ready
+            total += group_size
+
+        self.warmup_seconds = round(time.time() - started, 2)
+        self.warmup_state = "ready" if ready == total else "failed"
+
+        if self.warmup_state == "ready":
+            logger.info(f"✅ [Pool] Warm-up concluído: {ready} navegadores prontos em {self.warmup_seconds}s")
+        else:
+            logger.warning(f"⚠️ [Pool] Warm-up incompleto: {ready}/{total} navegadores prontos")
+        return self.warmup_state == "ready"
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retornar estatísticas do pool."""
+        with self.lock:
+            return {
+                **self._stats,
+                "size": self.size,
+                "group_sizes": dict(self.group_sizes),
+                "warmup_state": self.warmup_state,
+                "warmup_seconds": self.warmup_seconds,
+                "threads": sorted(self._slots.values()),
+            }
+
+
+# Instância global do pool de navegadores
+# Slots: threads do executor de scraping (os workers do pipeline registram o próprio grupo)
+browser_pool = BrowserPool(
+    size=settings.BROWSER_POOL_SIZE,
+    thread_prefix=settings.BROWSER_POOL_THREAD_PREFIX,
+    health_check_interval=settings.BROWSER_POOL_HEALTH_CHECK_INTERVAL,
+    enabled=settings.BROWSER_POOL_ENABLED,
+)
+
+
 class PlaywrightBrowserManager:
     """
     Gerenciador de navegador Playwright com ciclo de vida completo.
@@ -36,7 +492,14 @@ class PlaywrightBrowserManager:
     Suporta inicialização automática e limpeza de recursos via context manager.
     """
 
-    def __init__(self, headless: bool = True, browser_type: str = "chromium", viewport: Optional[dict] = None):
+    def __init__(
+        self,
+        headless: bool = True,
+        browser_type: str = "chromium",
+        viewport: Optional[dict] = None,
+        use_pool: Optional[bool] = None,
+        routing_policy: Optional[RequestRoutingPolicy] = None,
+    ):
         """
         Inicializar PlaywrightBrowserManager.
 
@@ -44,14 +507,27 @@ class PlaywrightBrowserManager:
             headless: Se True, executa em modo headless (sem GUI)
             browser_type: Tipo de navegador ("chromium", "firefox", "webkit")
             viewport: Dicionário com "width" e "height" ou None para padrão
+            use_pool: Se True, empresta contexto do BrowserPool quando possível
+                      (None = usar settings.BROWSER_POOL_ENABLED)
+            routing_policy: Política que aborta requisições desnecessárias
+                            (None = nenhuma requisição bloqueada)
         """
         self.headless = headless
         self.browser_type = browser_type
         self.viewport = viewport or {"width": 1280, "height": 720}
+        self.use_pool = settings.BROWSER_POOL_ENABLED if use_pool is None else use_pool
+        self.routing_policy = routing_policy
         self.playwright = None
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
+        # True quando o contexto foi emprestado do pool (navegador não é nosso)
+        self._pooled = False
+        # Navegações (frame principal) desde a criação da página / do contexto atuais
+        self.page_navigations = 0
+        self.context_navigations = 0
+        self.total_navigations = 0
+        self._rss_checked_at = 0
 
     def __enter__(self):
         """Context manager entry - inicializar navegador."""
@@ -63,10 +539,13 @@ class PlaywrightBrowserManager:
         self.close()
         return False
 
-    def launch(self) -> Page:
+    def launch(self, storage_state: Optional[Dict[str, Any]] = None) -> Page:
         """
         Lançar navegador Playwright e criar nova página.
 
+        Args:
+            storage_state: Cookies/localStorage para iniciar o contexto já autenticado
+
         Returns:
             Page: Instância de página Playwright para automação
 
@@ -80,26 +559,10 @@ class PlaywrightBrowserManager:
             self.playwright = _get_or_create_playwright()
             logger.info("✅ Usando instância singleton do Playwright")
 
-            # Selecionar tipo de navegador
-            if self.browser_type == "chromium":
-                browser_launcher = self.playwright.chromium
-            elif self.browser_type == "firefox":
-                browser_launcher = self.playwright.firefox
-            elif self.browser_type == "webkit":
-                browser_launcher = self.playwright.webkit
-            else:
-                raise ValueError(f"Browser type inválido: {self.browser_type}")
-
-            # Lançar navegador
-            self.browser = browser_launcher.launch(headless=self.headless)
-            logger.info(f"✅ Navegador {self.browser_type} lançado (headless={self.headless})")
-
-            # Criar contexto com viewport customizado
-            self.context = self.browser.new_context(viewport=self.viewport)
-            logger.info(f"✅ Contexto de navegador criado (viewport: {self.viewport['width']}x{self.viewport['height']})")
+            self._open_context(storage_state)
 
             # Criar página
-            self.page = self.context.new_page()
+            self._new_page()
             logger.info("✅ Página criada")
 
             return self.page
@@ -109,29 +572,189 @@ class PlaywrightBrowserManager:
             self.close()
             raise
 
+    def _context_options(self, storage_state: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Opções de criação de contexto."""
+        options: Dict[str, Any] = {"viewport": self.viewport}
+        if storage_state:
+            options["storage_state"] = storage_state
+        return options
+
+    def _open_context(self, storage_state: Optional[Dict[str, Any]] = None):
+        """
+        Criar contexto: emprestado do pool quando possível, senão em navegador dedicado.
+        """
+        options = self._context_options(storage_state)
+
+        # Emprestar contexto do navegador persistente da thread, se possível
+        if self.use_pool and (self.browser is None or self._pooled):
+            self.context = browser_pool.lease_context(self.browser_type, self.headless, **options)
+            if self.context is not None:
+                self._pooled = True
+                self.browser = self.context.browser
+                logger.info(f"✅ Contexto emprestado do pool (viewport: {self.viewport['width']}x{self.viewport['height']})")
+
+        if self.context is None:
+            if self.browser is None or not self.browser.is_connected():
+                # Lançar navegador dedicado (ou reconectar ao host após reinício)
+                self.browser = _start_browser(self.playwright, self.browser_type, self.headless)
+                logger.info(f"✅ Navegador {self.browser_type} pronto (headless={self.headless})")
+
+            # Criar contexto com viewport customizado
+            self.context = self.browser.new_context(**options)
+            logger.info(f"✅ Contexto de navegador criado (viewport: {self.viewport['width']}x{self.viewport['height']})")
+
+        if self.routing_policy is not None:
+            self.routing_policy.apply(self.context)
+
+    def _new_page(self) -> Page:
+        """Criar página no contexto atual e contar suas navegações."""
+        self.page = self.context.new_page()
+        self.page_navigations = 0
+        page = self.page
+
+        def on_navigated(frame):
+            if frame == page.main_frame:
+                self.page_navigations += 1
+                self.context_navigations += 1
+                self.total_navigations += 1
+
+        page.on("framenavigated", on_navigated)
+        return page
+
+    def _close_context(self):
+        """Fechar página e contexto atuais (contexto do pool é devolvido)."""
+        if self.page:
+            self.page.close()
+            self.page = None
+            logger.info("✅ Página fechada")
+
+        if self.context:
+            if self._pooled:
+                browser_pool.release_context(self.context)
+                logger.info("✅ Contexto devolvido ao pool")
+            else:
+                self.context.close()
+                logger.info("✅ Contexto fechado")
+            self.context = None
+            self.context_navigations = 0
+
+    def reset_context(self, storage_state: Optional[Dict[str, Any]] = None) -> Page:
+        """
+        Substituir contexto e página atuais por novos, mantendo o navegador.
+
+        Args:
+            storage_state: Cookies/localStorage para o novo contexto
+
+        Returns:
+            Page: Nova página no novo contexto
+        """
+        if self.browser is None:
+            return self.launch(storage_state)
+
+        self._close_context()
+        self._open_context(storage_state)
+        self._new_page()
+        logger.info("✅ Contexto recriado")
+        return self.page
+
+    def maybe_recycle(self) -> Page:
+        """
+        Reciclar página, contexto ou navegador se algum limite configurado foi atingido.
+
+        Limites (Settings):
+        - RECYCLE_PAGE_AFTER_NAVIGATIONS: nova página no mesmo contexto
+        - RECYCLE_CONTEXT_AFTER_NAVIGATIONS: novo contexto
+        - RECYCLE_BROWSER_RSS_MB: novo navegador (RSS amostrado a cada
+          RECYCLE_RSS_CHECK_EVERY navegações)
+
+        Cookies e localStorage são preservados (storage_state exportado antes
+        de recriar o contexto), então a sessão autenticada continua válida.
+
+        Returns:
+            Page: Página a usar a partir de agora (a mesma se nada foi reciclado)
+        """
+        if self.page is None or self.context is None:
+            return self.get_page()
+
+        rss_limit = settings.RECYCLE_BROWSER_RSS_MB
+        check_every = max(1, settings.RECYCLE_RSS_CHECK_EVERY)
+        if rss_limit > 0 and self.total_navigations - self._rss_checked_at >= check_every:
+            self._rss_checked_at = self.total_navigations
+            # Só os navegadores desta thread: o limite é por navegador, não do processo
+            driver_pid = _driver_pid(self.playwright)
+            rss_mb = sample_browser_rss_mb(driver_pid) if driver_pid else None
+            if rss_mb is not None and rss_mb > rss_limit:
+                logger.warning(f"♻️ RSS do navegador da thread em {rss_mb:.0f}MB (limite {rss_limit}MB), reciclando navegador")
+                return self._recycle_browser()
+
+        context_limit = settings.RECYCLE_CONTEXT_AFTER_NAVIGATIONS
+        if context_limit > 0 and self.context_navigations >= context_limit:
+            logger.info(f"♻️ Contexto atingiu {self.context_navigations} navegações, reciclando contexto")
+            storage_state = self.export_storage_state()
+            self.reset_context(storage_state)
+            _count_recycle("context")
+            return self.page
+
+        page_limit = settings.RECYCLE_PAGE_AFTER_NAVIGATIONS
+        if page_limit > 0 and self.page_navigations >= page_limit:
+            logger.info(f"♻️ Página atingiu {self.page_navigations} navegações, reciclando página")
+            self.page.close()
+            self._new_page()
+            _count_recycle("page")
+            return self.page
+
+        return self.page
+
+    def _recycle_browser(self) -> Page:
+        """Relançar o navegador preservando a sessão (storage_state)."""
+        storage_state = self.export_storage_state()
+        self._close_context()
+
+        if self._pooled:
+            self.browser = browser_pool.recycle_browser(self.browser_type, self.headless)
+        else:
+            try:
+                self.browser.close()
+            except Exception as e:
+                logger.warning(f"⚠️ Erro ao fechar navegador reciclado: {str(e)}")
+            self.browser = None
+
+        self._open_context(storage_state)
+        self._new_page()
+        _count_recycle("browser")
+        return self.page
+
+    def export_storage_state(self) -> Optional[Dict[str, Any]]:
+        """
+        Exportar cookies e localStorage do contexto atual.
+
+        Returns:
+            storage_state do contexto ou None se não há contexto
+        """
+        if self.context is None:
+            return None
+        return self.context.storage_state()
+
     def close(self):
         """
         Fechar navegador e limpar recursos.
 
         Fecha página, contexto e navegador.
+        Contextos emprestados do pool são devolvidos e o navegador persistente
+        continua vivo para o próximo job da thread.
         A instância Playwright (thread-local) permanece ativa para outras
         instâncias de PlaywrightBrowserManager na mesma thread.
         """
         try:
-            if self.page:
-                self.page.close()
-                self.page = None
-                logger.info("✅ Página fechada")
-
-            if self.context:
-                self.context.close()
-                self.context = None
-                logger.info("✅ Contexto fechado")
+            self._close_context()
 
             if self.browser:
-                self.browser.close()
+                if not self._pooled:
+                    self.browser.close()
+                    logger.info("✅ Navegador fechado")
                 self.browser = None
-                logger.info("✅ Navegador fechado")
+
+            self._pooled = False
 
             # Não fechamos self.playwright pois é compartilhada entre
             # múltiplas instâncias de PlaywrightBrowserManager na mesma thread.
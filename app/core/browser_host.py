@@ -0,0 +1,187 @@
+"""
+Browser Host - Processo supervisor com um Chromium compartilhado.
+
+Em vez de cada thread/processo de scraping lançar seus próprios navegadores,
+um único processo host mantém um Chromium com endpoint de depuração remota
+(CDP) e os workers se conectam a ele abrindo apenas BrowserContexts.
+
+A Python API do Playwright não expõe `launch_server`, então o host executa o
+binário Chromium empacotado pelo Playwright com `--remote-debugging-port`,
+e os workers usam `connect_over_cdp`. O host reinicia o Chromium se ele cair;
+os workers reconectam automaticamente.
+
+Uso:
+    python -m app.core.browser_host --port 9222
+"""
+
+import argparse
+import logging
+import shutil
+import signal
+import subprocess
+import tempfile
+import time
+from typing import Optional, List
+
+from playwright.sync_api import sync_playwright, Browser, Playwright
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserHost:
+    """
+    Supervisor do Chromium compartilhado
+
+    Responsável por:
+    - Lançar o Chromium com endpoint CDP
+    - Relançar o Chromium quando o processo termina
+    - Encerrar tudo ao receber SIGTERM/SIGINT
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 9222,
+        headless: bool = True,
+        restart_delay: float = 2.0,
+    ):
+        """
+        Inicializa o host
+
+        Args:
+            host: Endereço em que o endpoint CDP escuta
+            port: Porta do endpoint CDP
+            headless: Se True, executa em modo headless
+            restart_delay: Segundos de espera antes de relançar o Chromium
+        """
+        self.host = host
+        self.port = port
+        self.headless = headless
+        self.restart_delay = restart_delay
+        self.process: Optional[subprocess.Popen] = None
+        self.user_data_dir: Optional[str] = None
+        self.restarts = 0
+        self._stopping = False
+
+    def _executable_path(self) -> str:
+        """Caminho do Chromium instalado via `playwright install chromium`"""
+        with sync_playwright() as playwright:
+            return playwright.chromium.executable_path
+
+    def _command(self, executable: str) -> List[str]:
+        """Linha de comando do Chromium"""
+        args = [
+            executable,
+            f"--remote-debugging-address={self.host}",
+            f"--remote-debugging-port={self.port}",
+            f"--user-data-dir={self.user_data_dir}",
+            "--no-first-run",
+            "--no-default-browser-check",
+            "--disable-dev-shm-usage",
+            "about:blank",
+        ]
+        if self.headless:
+            args.insert(1, "--headless=new")
+        return args
+
+    def _spawn(self, executable: str):
+        """Lançar o Chromium com perfil temporário novo"""
+        if self.user_data_dir:
+            shutil.rmtree(self.user_data_dir, ignore_errors=True)
+        self.user_data_dir = tempfile.mkdtemp(prefix="browser-host-")
+        self.process = subprocess.Popen(self._command(executable))
+        logger.info(f"✅ [BrowserHost] Chromium iniciado (pid={self.process.pid}, endpoint=http://{self.host}:{self.port})")
+
+    def stop(self, *_):
+        """Encerrar o Chromium e sair do loop de supervisão"""
+        self._stopping = True
+        if self.process and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+        if self.user_data_dir:
+            shutil.rmtree(self.user_data_dir, ignore_errors=True)
+        logger.info("✅ [BrowserHost] Encerrado")
+
+    def serve_forever(self):
+        """Manter o Chromium no ar, relançando quando o processo termina"""
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+
+        executable = self._executable_path()
+        self._spawn(executable)
+
+        while not self._stopping:
+            code = self.process.wait()
+            if self._stopping:
+                break
+            self.restarts += 1
+            logger.warning(
+                f"⚠️ [BrowserHost] Chromium terminou (código {code}), "
+                f"relançando em {self.restart_delay}s (reinício #{self.restarts})"
+            )
+            time.sleep(self.restart_delay)
+            self._spawn(executable)
+
+
+def connect_to_host(
+    playwright: Playwright,
+    endpoint: Optional[str] = None,
+    attempts: Optional[int] = None,
+    delay: Optional[float] = None,
+) -> Browser:
+    """
+    Conectar ao Chromium do BrowserHost, tentando novamente se o host estiver reiniciando
+
+    Args:
+        playwright: Instância Playwright (Sync API) da thread atual
+        endpoint: Endpoint CDP (None = settings.BROWSER_HOST_ENDPOINT)
+        attempts: Número de tentativas (None = settings.BROWSER_HOST_CONNECT_ATTEMPTS)
+        delay: Segundos entre tentativas (None = settings.BROWSER_HOST_CONNECT_DELAY)
+
+    Returns:
+        Browser: Navegador conectado (fechar apenas desconecta)
+
+    Raises:
+        Exception: Se todas as tentativas falharem
+    """
+    endpoint = endpoint or settings.BROWSER_HOST_ENDPOINT
+    attempts = attempts or settings.BROWSER_HOST_CONNECT_ATTEMPTS
+    delay = settings.BROWSER_HOST_CONNECT_DELAY if delay is None else delay
+
+    last_error: Optional[Exception] = None
+    for attempt in range(1, attempts + 1):
+        try:
+            browser = playwright.chromium.connect_over_cdp(endpoint)
+            logger.info(f"✅ [BrowserHost] Conectado a {endpoint}")
+            return browser
+        except Exception as e:
+            last_error = e
+            logger.warning(f"⚠️ [BrowserHost] Falha ao conectar ({attempt}/{attempts}): {str(e)}")
+            if attempt < attempts:
+                time.sleep(delay)
+
+    raise Exception(f"BrowserHost indisponível em {endpoint}: {str(last_error)}")
+
+
+def main():
+    """Ponto de entrada: python -m app.core.browser_host"""
+    parser = argparse.ArgumentParser(description="Processo host do Chromium compartilhado")
+    parser.add_argument("--host", default=settings.BROWSER_HOST_BIND)
+    parser.add_argument("--port", type=int, default=settings.BROWSER_HOST_PORT)
+    parser.add_argument("--headed", action="store_true", help="Executar com interface gráfica")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    BrowserHost(host=args.host, port=args.port, headless=not args.headed).serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+"""
+Checkpoint Store - Progresso durável dos lotes de channel_links (SQLite)
+
+Cada canal concluído de um lote de `/scrape-channel` é gravado em SQLite com
+o job_id e a posição do link. Se o processo reiniciar ou o job falhar no
+meio, a retomada (na inicialização ou via endpoint) pula os links já
+concluídos e produz um único resultado, com o mesmo job_id.
+
+As gravações de canais vão para uma thread escritora única (em ordem), então
+quem grava (inclusive as abas no loop do engine async) não espera o SQLite.
+
+A request é salva sem a senha: a retomada usa a senha enviada ao endpoint de
+retomada ou, se a conta for a do .env, a senha do .env.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS batch_jobs (
+    job_id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    request_json TEXT NOT NULL,
+    status TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS batch_items (
+    job_id TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    channel_link TEXT NOT NULL,
+    data_json TEXT NOT NULL,
+    finished_at REAL NOT NULL,
+    PRIMARY KEY (job_id, idx)
+);
+"""
+
+
+class CheckpointStore:
+    """
+    Store SQLite de checkpoints de lotes
+
+    Responsável por:
+    - Registrar o job (request sem senha) quando o lote começa
+    - Gravar cada canal concluído
+    - Listar os jobs interrompidos e os links já concluídos de um job
+    """
+
+    def __init__(self, path: str = ".crawl_state/checkpoints.db", enabled: bool = True):
+        """
+        Args:
+            path: Arquivo do banco SQLite
+            enabled: Se False, nada é gravado e não há retomada
+        """
+        self.path = path
+        self.enabled = enabled
+        self.lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        # Thread única de escrita: mantém a ordem e tira o SQLite de quem grava
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="checkpoint")
+
+    def _connection(self) -> sqlite3.Connection:
+        """Conexão única (sem lock - usar apenas dentro de lock), criada sob demanda"""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    def start_job(self, job_id: str, kind: str, request: Dict[str, Any]):
+        """
+        Registrar um lote (ou reativar um já registrado, na retomada), sem bloquear
+
+        Args:
+            job_id: ID do job
+            kind: Tipo do job (ex.: "scrape-channel")
+            request: Request do job; o campo password nunca é salvo
+        """
+        if not self.enabled:
+            return
+        request = {k: v for k, v in request.items() if k != "password"}
+        # Thread escritora (sem esperar): quem registra costuma estar no event loop da API,
+        # e os canais gravados depois entram na mesma fila, já com o lote registrado
+        self._writer.submit(self._write_job, job_id, kind, json.dumps(request), time.time())
+
+    def _write_job(self, job_id: str, kind: str, request_json: str, now: float):
+        """INSERT/reativação do lote (executado na thread escritora)"""
+        try:
+            with self.lock:
+                conn = self._connection()
+                with conn:
+                    conn.execute(
+                        "INSERT INTO batch_jobs (job_id, kind, request_json, status, created_at, updated_at) "
+                        "VALUES (?, ?, ?, 'running', ?, ?) "
+                        "ON CONFLICT(job_id) DO UPDATE SET status = 'running', updated_at = excluded.updated_at",
+                        (job_id, kind, request_json, now, now),
+                    )
+        except Exception as e:
+            logger.error(f"❌ [Checkpoint] Falha ao registrar o lote {job_id}: {str(e)}")
+
+    def record(self, job_id: str, idx: int, channel_link: str, data: Dict[str, Any]):
+        """
+        Gravar um canal concluído (enfileirado na thread escritora, sem bloquear)
+
+        Args:
+            job_id: ID do job
+            idx: Posição do link no lote
+            channel_link: URL do canal
+            data: Dados extraídos (ChannelDetailedData.model_dump())
+        """
+        if not self.enabled:
+            return
+        self._writer.submit(self._write_item, job_id, idx, channel_link, json.dumps(data), time.time())
+
+    def _write_item(self, job_id: str, idx: int, channel_link: str, data_json: str, finished_at: float):
+        """INSERT do canal (executado na thread escritora)"""
+        try:
+            with self.lock:
+                conn = self._connection()
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO batch_items (job_id, idx, channel_link, data_json, finished_at) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        (job_id, idx, channel_link, data_json, finished_at),
+                    )
+        except Exception as e:
+            logger.error(f"❌ [Checkpoint] Falha ao gravar canal {channel_link} do job {job_id}: {str(e)}")
+
+    def done_items(self, job_id: str) -> Dict[int, Dict[str, Any]]:
+        """
+        Canais já concluídos de um job
+
+        Returns:
+            Dicionário posição -> {"channel_link", "data"}
+        """
+        if not self.enabled:
+            return {}
+        with self.lock:
+            rows = self._connection().execute(
+                "SELECT idx, channel_link, data_json FROM batch_items WHERE job_id = ?", (job_id,)
+            ).fetchall()
+        return {idx: {"channel_link": link, "data": json.loads(data)} for idx, link, data in rows}
+
+    def finish(self, job_id: str, status: str):
+        """
+        Marcar o fim do lote ("completed" ou "failed")
+
+        Lotes "failed" continuam disponíveis para retomada pelo endpoint; só os
+        "running" (interrompidos por reinício) são retomados na inicialização.
+        Passa pela thread escritora e aguarda, então os canais enfileirados antes
+        já estão gravados quando retorna (no engine async, chamar via asyncio.to_thread).
+        """
+        if not self.enabled:
+            return
+        self._writer.submit(self._write_finish, job_id, status).result()
+
+    def _write_finish(self, job_id: str, status: str):
+        """UPDATE do status do lote (executado na thread escritora)"""
+        with self.lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "UPDATE batch_jobs SET status = ?, updated_at = ? WHERE job_id = ?",
+                    (status, time.time(), job_id),
+                )
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Registro de um lote (None se não existe)"""
+        if not self.enabled:
+            return None
+        with self.lock:
+            row = self._connection().execute(
+                "SELECT job_id, kind, request_json, status, created_at, updated_at FROM batch_jobs WHERE job_id = ?",
+                (job_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            "job_id": row[0],
+            "kind": row[1],
+            "request": json.loads(row[2]),
+            "status": row[3],
+            "created_at": row[4],
+            "updated_at": row[5],
+        }
+
+    def interrupted_jobs(self) -> List[Dict[str, Any]]:
+        """Lotes que estavam em execução quando o processo parou"""
+        if not self.enabled:
+            return []
+        with self.lock:
+            job_ids = [row[0] for row in self._connection().execute(
+                "SELECT job_id FROM batch_jobs WHERE status = 'running' ORDER BY created_at"
+            ).fetchall()]
+        return [job for job in (self.get_job(job_id) for job_id in job_ids) if job]
+
+    def cleanup(self, retention_hours: int):
+        """Remover lotes concluídos há mais de retention_hours"""
+        if not self.enabled:
+            return
+        cutoff = time.time() - retention_hours * 3600
+        with self.lock:
+            conn = self._connection()
+            with conn:
+                old = [row[0] for row in conn.execute(
+                    "SELECT job_id FROM batch_jobs WHERE status != 'running' AND updated_at < ?", (cutoff,)
+                ).fetchall()]
+                for job_id in old:
+                    conn.execute("DELETE FROM batch_items WHERE job_id = ?", (job_id,))
+                    conn.execute("DELETE FROM batch_jobs WHERE job_id = ?", (job_id,))
+        if old:
+            logger.info(f"♻️ [Checkpoint] {len(old)} lotes antigos removidos")
+
+
+# Instância global do store de checkpoints
+checkpoint_store = CheckpointStore(
+    path=settings.CHECKPOINT_DB,
+    enabled=settings.CHECKPOINT_ENABLED,
+)
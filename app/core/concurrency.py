@@ -0,0 +1,237 @@
+"""
+Concurrency Controller - Concorrência adaptativa (AIMD) das páginas de canal
+
+Uma janela compartilhada por todos os jobs limita quantas páginas de canal
+são extraídas ao mesmo tempo no processo. Cada extração devolve uma amostra
+(latência, sucesso, respostas 429/5xx vistas pela página): amostras boas
+aumentam a janela de forma aditiva (+1 a cada janela completa de sucessos);
+throttling, timeouts/falhas ou latência acima do alvo cortam a janela de forma
+multiplicativa. Assim o processo converge para a maior vazão que o site tolera.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Tipos de requisição cujo status indica throttling do próprio TubeHunt
+_THROTTLE_RESOURCE_TYPES = ("document", "xhr", "fetch")
+
+
+class Sample:
+    """Resultado de uma extração, preenchido por quem usa o slot"""
+
+    def __init__(self):
+        self.ok = True
+        self.throttled_status: Optional[int] = None
+
+
+@contextmanager
+def watch_responses(page, sample: Sample):
+    """
+    Marcar a amostra quando a página receber 429/5xx do site (Sync e Async API)
+
+    Args:
+        page: Página Playwright usada na extração
+        sample: Amostra do slot atual
+    """
+    def on_response(response):
+        status = response.status
+        if (status == 429 or status >= 500) and response.request.resource_type in _THROTTLE_RESOURCE_TYPES:
+            sample.throttled_status = status
+
+    page.on("response", on_response)
+    try:
+        yield sample
+    finally:
+        try:
+            page.remove_listener("response", on_response)
+        except Exception:
+            pass
+
+
+class AIMDController:
+    """
+    Janela de concorrência AIMD compartilhada
+
+    Responsável por:
+    - Limitar as extrações simultâneas (threads do engine sync e tarefas do engine async)
+    - Aumentar a janela aditivamente com amostras boas
+    - Cortar a janela multiplicativamente com throttling, falhas ou latência alta
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        min_window: int = 1,
+        max_window: int = 16,
+        initial_window: int = 4,
+        decrease_factor: float = 0.5,
+        latency_target_seconds: float = 20.0,
+        decrease_cooldown_seconds: float = 5.0,
+    ):
+        """
+        Args:
+            enabled: Se False, os slots nunca bloqueiam (apenas as estatísticas são registradas)
+            min_window: Janela mínima
+            max_window: Janela máxima
+            initial_window: Janela inicial
+            decrease_factor: Fator do corte multiplicativo
+            latency_target_seconds: Latência por canal acima da qual a janela é cortada
+            decrease_cooldown_seconds: Intervalo mínimo entre cortes (as falhas em voo
+                do mesmo episódio de throttling contam como um corte só)
+        """
+        self.enabled = enabled
+        self.min_window = min_window
+        self.max_window = max_window
+        self.decrease_factor = decrease_factor
+        self.latency_target_seconds = latency_target_seconds
+        self.decrease_cooldown_seconds = decrease_cooldown_seconds
+        self.window = float(max(min_window, min(initial_window, max_window)))
+        self.in_flight = 0
+        self.lock = threading.Lock()
+        self._available = threading.Condition(self.lock)
+        self._last_decrease = 0.0
+        self._latency_ewma: Optional[float] = None
+        self._stats = {
+            "samples": 0,
+            "failures": 0,
+            "throttled": 0,
+            "slow": 0,
+            "increases": 0,
+            "decreases": 0,
+        }
+
+    def _has_room(self) -> bool:
+        """Há vaga na janela (sem lock - usar apenas dentro de lock)"""
+        return not self.enabled or self.in_flight < int(self.window)
+
+    def acquire(self):
+        """Aguardar vaga na janela (bloqueante, engine sync)"""
+        with self._available:
+            self._available.wait_for(self._has_room)
+            self.in_flight += 1
+
+    def try_acquire(self) -> bool:
+        """Ocupar uma vaga se houver (não bloqueia)"""
+        with self.lock:
+            if not self._has_room():
+                return False
+            self.in_flight += 1
+            return True
+
+    async def acquire_async(self, poll_seconds: float = 0.05):
+        """Aguardar vaga na janela sem bloquear o event loop"""
+        while not self.try_acquire():
+            await asyncio.sleep(poll_seconds)
+
+    def release(self, sample: Sample, latency_seconds: float):
+        """
+        Liberar a vaga e ajustar a janela com a amostra
+
+        Args:
+            sample: Resultado da extração
+            latency_seconds: Duração da extração
+        """
+        with self._available:
+            self.in_flight -= 1
+            self._stats["samples"] += 1
+            self._latency_ewma = (
+                latency_seconds if self._latency_ewma is None
+                else 0.8 * self._latency_ewma + 0.2 * latency_seconds
+            )
+
+            reason = None
+            if sample.throttled_status is not None:
+                self._stats["throttled"] += 1
+                reason = f"HTTP {sample.throttled_status}"
+            elif not sample.ok:
+                self._stats["failures"] += 1
+                reason = "falha/timeout"
+            elif latency_seconds > self.latency_target_seconds:
+                self._stats["slow"] += 1
+                reason = f"latência {latency_seconds:.1f}s"
+
+            if reason is None:
+                self._increase()
+            else:
+                self._decrease(reason)
+            self._available.notify_all()
+
+    def _increase(self):
+        """Aumento aditivo: +1 a cada janela completa de amostras boas (sem lock)"""
+        if self.window < self.max_window:
+            before = int(self.window)
+            self.window = min(self.max_window, self.window + 1.0 / self.window)
+            if int(self.window) > before:
+                self._stats["increases"] += 1
+
+    def _decrease(self, reason: str):
+        """Corte multiplicativo, no máximo um por cooldown (sem lock)"""
+        now = time.time()
+        if now - self._last_decrease < self.decrease_cooldown_seconds:
+            return
+        self._last_decrease = now
+        before = self.window
+        self.window = max(float(self.min_window), self.window * self.decrease_factor)
+        self._stats["decreases"] += 1
+        logger.warning(f"⚠️ [AIMD] Janela {before:.1f} → {self.window:.1f} ({reason})")
+
+    @contextmanager
+    def slot(self):
+        """Ocupar uma vaga durante uma extração (engine sync); exceções contam como falha"""
+        self.acquire()
+        sample = Sample()
+        started = time.time()
+        try:
+            yield sample
+        except Exception:
+            sample.ok = False
+            raise
+        finally:
+            self.release(sample, time.time() - started)
+
+    @asynccontextmanager
+    async def slot_async(self):
+        """Equivalente de slot() para o engine async"""
+        await self.acquire_async()
+        sample = Sample()
+        started = time.time()
+        try:
+            yield sample
+        except Exception:
+            sample.ok = False
+            raise
+        finally:
+            self.release(sample, time.time() - started)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Janela atual e contadores (job status e /metrics)"""
+        with self.lock:
+            return {
+                "enabled": self.enabled,
+                "window": round(self.window, 2),
+                "in_flight": self.in_flight,
+                "min_window": self.min_window,
+                "max_window": self.max_window,
+                "latency_ewma_seconds": round(self._latency_ewma, 2) if self._latency_ewma is not None else None,
+                **self._stats,
+            }
+
+
+# Instância global do controlador de concorrência das páginas de canal
+detail_concurrency = AIMDController(
+    enabled=settings.ADAPTIVE_CONCURRENCY_ENABLED,
+    min_window=settings.ADAPTIVE_MIN_WINDOW,
+    max_window=settings.ADAPTIVE_MAX_WINDOW,
+    initial_window=settings.ADAPTIVE_INITIAL_WINDOW,
+    decrease_factor=settings.ADAPTIVE_DECREASE_FACTOR,
+    latency_target_seconds=settings.ADAPTIVE_LATENCY_TARGET_SECONDS,
+    decrease_cooldown_seconds=settings.ADAPTIVE_DECREASE_COOLDOWN_SECONDS,
+)
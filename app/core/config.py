@@ -16,6 +16,101 @@ class Settings(BaseSettings):
     SELENIUM_HEADLESS: bool = True
     SELENIUM_TIMEOUT: int = 60
 
+    # Pool de navegadores (um navegador persistente por thread de scraping)
+    BROWSER_POOL_ENABLED: bool = True
+    BROWSER_POOL_SIZE: int = 2
+    BROWSER_POOL_THREAD_PREFIX: str = "scraper"
+    BROWSER_POOL_WARMUP: bool = True
+    BROWSER_POOL_WARMUP_TIMEOUT: int = 120
+    BROWSER_POOL_HEALTH_CHECK_INTERVAL: int = 60
+
+    # Browser host: um Chromium compartilhado (python -m app.core.browser_host)
+    # ao qual as threads se conectam via CDP em vez de lançar navegadores próprios
+    BROWSER_HOST_ENABLED: bool = False
+    BROWSER_HOST_ENDPOINT: str = "http://127.0.0.1:9222"
+    BROWSER_HOST_BIND: str = "127.0.0.1"
+    BROWSER_HOST_PORT: int = 9222
+    BROWSER_HOST_CONNECT_ATTEMPTS: int = 5
+    BROWSER_HOST_CONNECT_DELAY: float = 2.0
+
+    # Reciclagem de página/contexto/navegador em batches longos (0 = desativado)
+    RECYCLE_PAGE_AFTER_NAVIGATIONS: int = 50
+    RECYCLE_CONTEXT_AFTER_NAVIGATIONS: int = 200
+    RECYCLE_BROWSER_RSS_MB: int = 1500
+    RECYCLE_RSS_CHECK_EVERY: int = 10
+
+    # Engine de scraping: "sync" (threads + Sync API) ou "async" (loop dedicado + Async API)
+    SCRAPER_ENGINE: str = "sync"
+    ASYNC_MAX_CONCURRENT_PAGES: int = 20
+
+    # Extração: "live" (consultas ao DOM no navegador) ou "offline"
+    # (page.content() + parser lxml em um pool de processos; 0 = número de CPUs)
+    EXTRACTION_MODE: str = "live"
+    PARSER_PROCESSES: int = 0
+    # Diretório para salvar o HTML das páginas extraídas ("" = não salvar)
+    HTML_SNAPSHOT_DIR: str = ""
+    # Cards por evaluate na extração em streaming da listagem
+    LISTING_BATCH_SIZE: int = 50
+    # Crawl de várias páginas da listagem: contextos em paralelo (engine async)
+    # e limite de páginas no modo "até página vazia"
+    CRAWL_CONCURRENCY: int = 4
+    CRAWL_MAX_PAGES: int = 100
+    # Crawl incremental: últimos canais vistos por listagem (para no primeiro já visto)
+    HIGH_WATER_FILE: str = ".crawl_state/high_water.json"
+    HIGH_WATER_KEEP: int = 200
+    # Pipeline listagem → detalhes: workers de detalhes por job e tamanho da fila entre eles
+    # (no engine sync o executor dos workers tem PIPELINE_DETAIL_CONCURRENCY × BROWSER_POOL_SIZE threads)
+    PIPELINE_DETAIL_CONCURRENCY: int = 4
+    PIPELINE_QUEUE_SIZE: int = 50
+    # Lotes de channel_links: abas em paralelo no mesmo contexto (padrão por request e teto global)
+    BATCH_TABS_DEFAULT: int = 4
+    BATCH_TABS_MAX: int = 8
+    # Retentativas nos lotes: tentativas por canal, orçamento do job (fração do lote,
+    # com mínimo) e backoff exponencial antes de o canal voltar ao fim da fila
+    RETRY_MAX_ATTEMPTS: int = 3
+    RETRY_JOB_BUDGET_RATIO: float = 0.25
+    RETRY_JOB_BUDGET_MIN: int = 5
+    RETRY_BACKOFF_BASE_SECONDS: float = 2.0
+    RETRY_BACKOFF_MAX_SECONDS: float = 30.0
+    # Checkpoint dos lotes de /scrape-channel (SQLite) e retomada na inicialização
+    CHECKPOINT_ENABLED: bool = True
+    CHECKPOINT_DB: str = ".crawl_state/checkpoints.db"
+    CHECKPOINT_RESUME_ON_STARTUP: bool = True
+    CHECKPOINT_RETENTION_HOURS: int = 72
+    # Concorrência adaptativa (AIMD) das páginas de canal, compartilhada por todos os jobs;
+    # com ela ativa, os lotes do engine async abrem BATCH_TABS_MAX abas e a janela decide quantas trabalham
+    ADAPTIVE_CONCURRENCY_ENABLED: bool = True
+    ADAPTIVE_MIN_WINDOW: int = 1
+    ADAPTIVE_MAX_WINDOW: int = 16
+    ADAPTIVE_INITIAL_WINDOW: int = 4
+    ADAPTIVE_DECREASE_FACTOR: float = 0.5
+    ADAPTIVE_LATENCY_TARGET_SECONDS: float = 20.0
+    ADAPTIVE_DECREASE_COOLDOWN_SECONDS: float = 5.0
+
+    # Rate limit por host (token bucket compartilhado pelo processo):
+    # requisições por segundo e rajada máxima para cada site
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_TUBEHUNT_PER_SECOND: float = 3.0
+    RATE_LIMIT_TUBEHUNT_BURST: int = 6
+    RATE_LIMIT_NOTION_PER_SECOND: float = 1.0
+    RATE_LIMIT_NOTION_BURST: int = 3
+    RATE_LIMIT_DEFAULT_PER_SECOND: float = 5.0
+    RATE_LIMIT_DEFAULT_BURST: int = 10
+
+    # Detalhes do canal: modo rápido (domcontentloaded + espera só pela seção do canal
+    # + um único evaluate); se falhar, usa o caminho lento (networkidle + XPaths)
+    DETAIL_FAST_MODE: bool = True
+    DETAIL_FAST_TIMEOUT_SECONDS: int = 15
+
+    # Bloqueio de requisições (imagens, fontes, mídia e trackers)
+    REQUEST_BLOCKING_ENABLED: bool = True
+
+    # Webhook "partial" a cada N resultados publicados pelo job (0 = apenas o webhook final)
+    WEBHOOK_PARTIAL_BATCH_SIZE: int = 0
+    # Resultados publicados mantidos em memória por job; os mais antigos vão para disco (JSONL)
+    JOB_RESULTS_BUFFER_SIZE: int = 500
+    JOB_RESULTS_SPILL_DIR: str = ".crawl_state/job_results"
+
     # API
     API_HOST: str = "0.0.0.0"
     API_PORT: int = 8000
@@ -25,6 +120,36 @@ class Settings(BaseSettings):
     url_scrape_channels: str = "https://app.tubehunt.io/long/?page=1&OrderBy=DateDESC&ChangePerPage=50"
     user: str = ""
     password: str = ""
+    url_auth_probe: str = "https://app.tubehunt.io/"
+
+    # Cache de sessão autenticada (storage_state do Playwright)
+    AUTH_STATE_CACHE_ENABLED: bool = True
+    AUTH_STATE_DIR: str = ".auth_state"
+    AUTH_STATE_TTL_SECONDS: int = 21600
+
+    # Login single-flight por conta + renovação proativa da sessão em cache
+    LOGIN_COORDINATOR_ENABLED: bool = True
+    LOGIN_WAIT_TIMEOUT_SECONDS: int = 120
+    LOGIN_REFRESH_MARGIN_SECONDS: int = 1800
+    LOGIN_REFRESH_CHECK_INTERVAL: int = 60
+    # Falhas seguidas de renovação: backoff exponencial até o teto e, no limite, desiste da conta
+    LOGIN_REFRESH_MAX_FAILURES: int = 5
+    LOGIN_REFRESH_BACKOFF_MAX_SECONDS: int = 3600
+
+    # Login e fetch por HTTP (httpx), sem navegador
+    HTTP_LOGIN_ENABLED: bool = False
+    HTTP_TIMEOUT_SECONDS: int = 30
+    HTTP_USER_AGENT: str = (
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
+    )
+
+    # Lotes de channel_links por HTTP (httpx.AsyncClient + parser offline);
+    # páginas que precisarem de JS são extraídas pelo navegador
+    HTTP_FETCH_ENABLED: bool = False
+    HTTP_FETCH_CONCURRENCY: int = 16
+    HTTP_FETCH_MIN_BATCH: int = 5
+    HTTP2_ENABLED: bool = True
 
     class Config:
         env_file = ".env"
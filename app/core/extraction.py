@@ -0,0 +1,418 @@
+"""
+Extraction Spec - Especificação declarativa de extração.
+
+Uma `Spec` descreve os campos de uma página (seletor CSS ou XPath,
+atributo, subcampos, seletores alternativos e pós-processadores) e é
+compilada uma vez por processo em dois extratores equivalentes:
+
+- `compile_js(spec)`: função JS para um único `page.evaluate` no navegador
+- `compile_offline(spec)`: função Python que extrai do HTML com lxml
+
+Specs com `root` também podem ser consumidas item a item (`iter_page`,
+`aiter_page`, `iter_html`), sem montar a lista inteira de uma vez.
+
+Os dois devolvem os mesmos dados brutos e os pós-processadores rodam em
+Python (`apply_post`), então trocar um seletor é só editar a spec.
+"""
+
+import json
+import logging
+import re
+from dataclasses import dataclass, field as dc_field
+from functools import lru_cache
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple
+
+from lxml import html as lxml_html
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Field:
+    """
+    Campo extraído de um item (ou do documento)
+
+    Attributes:
+        name: Chave no resultado
+        selector: Seletor relativo ao item (None = o próprio item)
+        xpath: Se True, selector/fallbacks são XPath (senão CSS)
+        attr: "text" (textContent), "inner_text" (texto com espaços colapsados),
+              "exists" (bool) ou nome de um atributo HTML
+        many: Se True, retorna lista com todos os elementos (senão o primeiro ou None)
+        fields: Subcampos; cada elemento encontrado vira um dicionário
+        fallbacks: Seletores tentados em ordem se o principal não encontrar nada
+        post: Nomes de pós-processadores (POST_PROCESSORS) aplicados em ordem
+    """
+    name: str
+    selector: Optional[str] = None
+    xpath: bool = False
+    attr: str = "text"
+    many: bool = False
+    fields: Tuple["Field", ...] = ()
+    fallbacks: Tuple[str, ...] = ()
+    post: Tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class Spec:
+    """
+    Especificação de extração de uma página
+
+    Attributes:
+        name: Nome da spec (chave do registro)
+        fields: Campos de cada item
+        root: Seletor CSS dos itens (None = documento inteiro, resultado único)
+        root_fallbacks: Seletores CSS alternativos dos itens
+    """
+    name: str
+    fields: Tuple[Field, ...]
+    root: Optional[str] = None
+    root_fallbacks: Tuple[str, ...] = dc_field(default=())
+
+
+def _compact(value):
+    """Remover itens vazios/None de uma lista"""
+    return [v for v in value if v] if isinstance(value, list) else value
+
+
+def _strip(value):
+    """strip() de um texto ou de cada texto de uma lista"""
+    if isinstance(value, list):
+        return [v.strip() if isinstance(v, str) else v for v in value]
+    return value.strip() if isinstance(value, str) else value
+
+
+def _first(value):
+    """Primeiro item de uma lista (None se vazia)"""
+    if isinstance(value, list):
+        return value[0] if value else None
+    return value
+
+
+# Pós-processadores por nome (usados em Field.post)
+POST_PROCESSORS: Dict[str, Callable[[Any], Any]] = {
+    "compact": _compact,
+    "strip": _strip,
+    "first": _first,
+}
+
+# Registro global de specs por nome
+_registry: Dict[str, Spec] = {}
+
+
+def register(spec: Spec) -> Spec:
+    """Registrar uma spec (retorna a própria spec para uso em constantes)"""
+    _registry[spec.name] = spec
+    return spec
+
+
+def get_spec(name: str) -> Spec:
+    """Obter uma spec registrada pelo nome"""
+    try:
+        return _registry[name]
+    except KeyError:
+        raise KeyError(f"Spec de extração não registrada: {name}")
+
+
+def _fields_post(fields: Tuple[Field, ...], raw: Dict[str, Any]) -> Dict[str, Any]:
+    """Aplicar os pós-processadores de cada campo (recursivo nos subcampos)"""
+    out = dict(raw)
+    for f in fields:
+        value = out.get(f.name)
+        if f.fields:
+            if isinstance(value, list):
+                value = [_fields_post(f.fields, v) for v in value]
+            elif isinstance(value, dict):
+                value = _fields_post(f.fields, value)
+        for name in f.post:
+            value = POST_PROCESSORS[name](value)
+        out[f.name] = value
+    return out
+
+
+def apply_post(spec: Spec, raw: Any) -> Any:
+    """
+    Aplicar os pós-processadores da spec ao resultado bruto de qualquer extrator
+
+    Args:
+        spec: Spec usada na extração
+        raw: Lista de itens (spec com root) ou dicionário (sem root)
+    """
+    if isinstance(raw, list):
+        return [_fields_post(spec.fields, item) for item in raw]
+    return _fields_post(spec.fields, raw or {})
+
+
+# ---------------------------------------------------------------------------
+# CSS -> XPath (subconjunto usado nas specs)
+# ---------------------------------------------------------------------------
+
+# Seletor CSS composto: tag opcional seguida de .classe, #id e [atributo]
+_COMPOUND_RE = re.compile(
+    r"(?P<tag>[a-zA-Z][\w-]*|\*)?"
+    r"(?P<rest>(?:\.[\w-]+|#[\w-]+|\[[^\]]+\])*)$"
+)
+_PART_RE = re.compile(r"\.([\w-]+)|#([\w-]+)|\[([\w-]+)\s*(?:([*^$]?=)\s*['\"]?([^'\"\]]*)['\"]?)?\]")
+
+
+def _compound_to_xpath(compound: str) -> str:
+    """Converter um seletor composto (ex.: span.badge.mt-2) em passo XPath"""
+    match = _COMPOUND_RE.match(compound)
+    if not match:
+        raise ValueError(f"Seletor CSS não suportado: {compound}")
+
+    tag = match.group("tag") or "*"
+    predicates = []
+    for cls, id_, attr, op, value in _PART_RE.findall(match.group("rest")):
+        if cls:
+            predicates.append(f"contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')")
+        elif id_:
+            predicates.append(f"@id='{id_}'")
+        elif not op:
+            predicates.append(f"@{attr}")
+        elif op == "=":
+            predicates.append(f"@{attr}='{value}'")
+        elif op == "*=":
+            predicates.append(f"contains(@{attr}, '{value}')")
+        elif op == "^=":
+            predicates.append(f"starts-with(@{attr}, '{value}')")
+        else:
+            predicates.append(f"substring(@{attr}, string-length(@{attr}) - {len(value) - 1}) = '{value}'")
+
+    return tag + "".join(f"[{p}]" for p in predicates)
+
+
+@lru_cache(maxsize=256)
+def css_to_xpath(selector: str) -> str:
+    """
+    Traduzir o subconjunto de CSS usado nas specs para XPath relativo
+
+    Suporta listas (","), combinador descendente (espaço), tag, .classe,
+    #id e [attr], [attr=v], [attr*=v], [attr^=v], [attr$=v].
+    """
+    alternatives = []
+    for group in selector.split(","):
+        steps = [_compound_to_xpath(part) for part in group.split()]
+        alternatives.append(".//" + "//".join(steps))
+    return " | ".join(alternatives)
+
+
+# ---------------------------------------------------------------------------
+# Compilação para o navegador (JS)
+# ---------------------------------------------------------------------------
+
+# Interpretador da spec (recebe a spec serializada em JSON); o argumento
+# opcional {start, end} limita os itens extraídos (extração em lotes)
+_JS_RUNTIME = """
+(range) => {
+    const spec = %s;
+    const query = (root, sel, xpath, many) => {
+        if (xpath) {
+            const r = document.evaluate(sel, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            const out = [];
+            for (let i = 0; i < r.snapshotLength; i++) out.push(r.snapshotItem(i));
+            return out;
+        }
+        if (many) return Array.from(root.querySelectorAll(sel));
+        const el = root.querySelector(sel);
+        return el ? [el] : [];
+    };
+    const find = (root, f) => {
+        if (f.selector === null) return [root];
+        for (const sel of [f.selector, ...f.fallbacks]) {
+            const found = query(root, sel, f.xpath, f.many || f.attr === "exists");
+            if (found.length) return found;
+        }
+        return [];
+    };
+    const value = (el, f) => {
+        if (f.fields.length) return item(el, f.fields);
+        if (f.attr === "text") return el.textContent;
+        if (f.attr === "inner_text") return (el.innerText || el.textContent || "").split(/\\s+/).join(" ").trim();
+        return el.getAttribute(f.attr);
+    };
+    const item = (root, fields) => {
+        const out = {};
+        for (const f of fields) {
+            const found = find(root, f);
+            if (f.attr === "exists") out[f.name] = found.length > 0;
+            else if (f.many) out[f.name] = found.map((el) => value(el, f));
+            else out[f.name] = found.length ? value(found[0], f) : null;
+        }
+        return out;
+    };
+    if (spec.root === null) return item(document, spec.fields);
+    for (const sel of [spec.root, ...spec.root_fallbacks]) {
+        const items = document.querySelectorAll(sel);
+        if (items.length) {
+            const start = (range && range.start) || 0;
+            const end = range && range.end !== undefined ? range.end : items.length;
+            return Array.from(items).slice(start, end).map((el) => item(el, spec.fields));
+        }
+    }
+    return [];
+}
+"""
+
+
+def _field_json(f: Field) -> Dict[str, Any]:
+    """Serializar um campo para o runtime JS"""
+    return {
+        "name": f.name,
+        "selector": f.selector,
+        "xpath": f.xpath,
+        "attr": f.attr,
+        "many": f.many,
+        "fields": [_field_json(sub) for sub in f.fields],
+        "fallbacks": list(f.fallbacks),
+    }
+
+
+@lru_cache(maxsize=None)
+def compile_js(spec: Spec) -> str:
+    """
+    Compilar a spec em uma função JS para page.evaluate (cacheado por processo)
+
+    Returns:
+        Código da função; o resultado bruto deve passar por apply_post()
+    """
+    payload = {
+        "root": spec.root,
+        "root_fallbacks": list(spec.root_fallbacks),
+        "fields": [_field_json(f) for f in spec.fields],
+    }
+    return _JS_RUNTIME % json.dumps(payload, ensure_ascii=False)
+
+
+# ---------------------------------------------------------------------------
+# Compilação offline (lxml)
+# ---------------------------------------------------------------------------
+
+def _compile_field(f: Field) -> Callable[[Any], Any]:
+    """Compilar um campo em função (elemento lxml -> valor bruto)"""
+    queries = [
+        None if sel is None else (sel if f.xpath else css_to_xpath(sel))
+        for sel in (f.selector, *f.fallbacks)
+    ]
+    subfields = [(sub.name, _compile_field(sub)) for sub in f.fields]
+
+    def find(root) -> List[Any]:
+        if queries[0] is None:
+            return [root]
+        for query in queries:
+            found = root.xpath(query)
+            if found:
+                return found
+        return []
+
+    def value(el) -> Any:
+        if subfields:
+            return {name: fn(el) for name, fn in subfields}
+        if f.attr == "text":
+            return el.text_content()
+        if f.attr == "inner_text":
+            return " ".join(el.text_content().split())
+        return el.get(f.attr)
+
+    def extract(root) -> Any:
+        found = find(root)
+        if f.attr == "exists":
+            return bool(found)
+        if f.many:
+            return [value(el) for el in found]
+        return value(found[0]) if found else None
+
+    return extract
+
+
+@lru_cache(maxsize=None)
+def _compile_offline_parts(spec: Spec) -> Tuple[Callable[[Any], Dict[str, Any]], List[str]]:
+    """Extrator de item e XPaths dos itens (raiz + alternativas) da spec"""
+    fields = [(f.name, _compile_field(f)) for f in spec.fields]
+    roots = [css_to_xpath(sel) for sel in (spec.root, *spec.root_fallbacks) if sel is not None]
+
+    def item(root) -> Dict[str, Any]:
+        return {name: fn(root) for name, fn in fields}
+
+    return item, roots
+
+
+def _iter_offline(spec: Spec, page_html: str) -> Iterator[Dict[str, Any]]:
+    """Itens brutos da spec, um a um (spec com root)"""
+    item, roots = _compile_offline_parts(spec)
+    doc = lxml_html.document_fromstring(page_html)
+    for query in roots:
+        items = doc.xpath(query)
+        if items:
+            for el in items:
+                yield item(el)
+            return
+
+
+@lru_cache(maxsize=None)
+def compile_offline(spec: Spec) -> Callable[[str], Any]:
+    """
+    Compilar a spec em um extrator de HTML com lxml (cacheado por processo)
+
+    Returns:
+        Função (html) -> resultado bruto, idêntico ao de compile_js()
+    """
+    item, roots = _compile_offline_parts(spec)
+
+    def extract(page_html: str) -> Any:
+        if not roots:
+            return item(lxml_html.document_fromstring(page_html))
+        return list(_iter_offline(spec, page_html))
+
+    return extract
+
+
+def extract_html(spec: Spec, page_html: str) -> Any:
+    """Extrair e pós-processar um HTML com a spec (caminho offline)"""
+    return apply_post(spec, compile_offline(spec)(page_html))
+
+
+def extract_page(spec: Spec, page) -> Any:
+    """Extrair e pós-processar uma página Playwright (Sync API) em um único evaluate"""
+    return apply_post(spec, page.evaluate(compile_js(spec)))
+
+
+async def extract_page_async(spec: Spec, page) -> Any:
+    """Equivalente de extract_page() para a Async API"""
+    return apply_post(spec, await page.evaluate(compile_js(spec)))
+
+
+def iter_html(spec: Spec, page_html: str) -> Iterator[Any]:
+    """Itens pós-processados de um HTML, gerados um a um (spec com root)"""
+    for raw in _iter_offline(spec, page_html):
+        yield _fields_post(spec.fields, raw)
+
+
+def iter_page(spec: Spec, page, batch_size: int = 50) -> Iterator[Any]:
+    """
+    Itens pós-processados de uma página (Sync API), extraídos em lotes de batch_size
+
+    Cada lote é um evaluate; só um lote de itens brutos fica em memória.
+    """
+    js = compile_js(spec)
+    start = 0
+    while True:
+        batch = page.evaluate(js, {"start": start, "end": start + batch_size})
+        for raw in batch:
+            yield _fields_post(spec.fields, raw)
+        if len(batch) < batch_size:
+            return
+        start += batch_size
+
+
+async def aiter_page(spec: Spec, page, batch_size: int = 50) -> AsyncIterator[Any]:
+    """Equivalente de iter_page() para a Async API"""
+    js = compile_js(spec)
+    start = 0
+    while True:
+        batch = await page.evaluate(js, {"start": start, "end": start + batch_size})
+        for raw in batch:
+            yield _fields_post(spec.fields, raw)
+        if len(batch) < batch_size:
+            return
+        start += batch_size
@@ -0,0 +1,110 @@
+"""
+High-water mark das listagens - últimos canais vistos por URL de listagem
+
+Como a listagem padrão é ordenada por data (OrderBy=DateDESC), um refresh
+periódico só precisa ler até encontrar um canal já visto. O arquivo JSON
+guarda, por listagem (scrape_url sem o parâmetro page=), as chaves dos canais
+mais recentes vistos no último crawl incremental.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def listing_key(scrape_url: str) -> str:
+    """Identificador da listagem: URL sem page= e com os parâmetros ordenados"""
+    parsed = urlparse(scrape_url)
+    query = sorted((k, v) for k, v in parse_qsl(parsed.query, keep_blank_values=True) if k != "page")
+    return urlunparse(parsed._replace(query=urlencode(query), fragment=""))
+
+
+class HighWaterMarkStore:
+    """
+    Store em disco (JSON) dos últimos canais vistos por listagem
+
+    Responsável por:
+    - Recuperar as chaves de canais já vistos de uma listagem
+    - Registrar os canais novos no topo da marca após um crawl incremental
+    """
+
+    def __init__(self, path: str = ".crawl_state/high_water.json", keep: int = 200):
+        """
+        Args:
+            path: Arquivo JSON do store
+            keep: Quantidade de chaves mantidas por listagem
+        """
+        self.path = path
+        self.keep = keep
+        self.lock = threading.RLock()
+
+    def _read(self) -> Dict[str, Any]:
+        """Conteúdo do arquivo (sem lock - usar apenas dentro de lock)"""
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"⚠️ [HighWater] Arquivo inválido, ignorando: {str(e)}")
+            return {}
+
+    def load(self, scrape_url: str) -> List[str]:
+        """
+        Chaves dos canais já vistos na listagem (mais recentes primeiro)
+
+        Args:
+            scrape_url: URL da listagem (qualquer página)
+
+        Returns:
+            Lista de chaves (vazia se a listagem nunca foi lida)
+        """
+        with self.lock:
+            entry = self._read().get(listing_key(scrape_url)) or {}
+        return entry.get("channels", [])
+
+    def update(self, scrape_url: str, new_keys: List[str]) -> Optional[Dict[str, Any]]:
+        """
+        Colocar os canais novos no topo da marca da listagem
+
+        Args:
+            scrape_url: URL da listagem
+            new_keys: Chaves dos canais novos, na ordem da listagem
+
+        Returns:
+            Entrada salva, ou None se não houve canais novos
+        """
+        if not new_keys:
+            return None
+
+        key = listing_key(scrape_url)
+        with self.lock:
+            data = self._read()
+            previous = (data.get(key) or {}).get("channels", [])
+            merged = list(dict.fromkeys(new_keys + previous))[: self.keep]
+            entry = {"channels": merged, "updated_at": time.time()}
+            data[key] = entry
+
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+
+        logger.info(f"✅ [HighWater] {len(new_keys)} canais novos registrados para {key}")
+        return entry
+
+
+# Instância global do store de high-water marks
+high_water_store = HighWaterMarkStore(
+    path=settings.HIGH_WATER_FILE,
+    keep=settings.HIGH_WATER_KEEP,
+)
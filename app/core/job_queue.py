@@ -5,13 +5,18 @@ Este módulo implementa um gerenciador de jobs em memória com thread-safety
 para executar tarefas de scraping em background e rastrear seu status.
 """
 
+import json
+import os
 import uuid
 import time
 import threading
-from typing import Dict, Optional, Any
+from typing import Any, Dict, Iterator, List, Optional
 from datetime import datetime
 from enum import Enum
 
+from app.core.config import settings
+from app.core.concurrency import detail_concurrency
+
 
 class JobStatus(str, Enum):
     """Estados possíveis de um job"""
@@ -33,6 +38,13 @@ class Job:
         self.result: Optional[Dict[str, Any]] = None
         self.error: Optional[str] = None
         self.progress: int = 0  # 0-100
+        # Resultados publicados durante a execução (append_job_results): só uma
+        # janela fica em memória; os mais antigos vão para o arquivo de spill
+        self.results: List[Any] = []
+        self.results_offset: int = 0   # índice (global) do primeiro item da janela
+        self.spill_path: Optional[str] = None
+        # Tempo total aguardando o rate limiter (app.core.rate_limit)
+        self.rate_limit_wait_seconds: float = 0.0
         self.execution_time_seconds: float = 0.0
         self._start_time: Optional[float] = None
 
@@ -75,8 +87,15 @@ class Job:
         if self.started_at:
             data["started_at"] = self.started_at
 
+        if self.results_offset + len(self.results):
+            data["results_available"] = self.results_offset + len(self.results)
+
+        if self.rate_limit_wait_seconds:
+            data["rate_limit_wait_seconds"] = round(self.rate_limit_wait_seconds, 2)
+
         if self.status == JobStatus.PROCESSING:
             data["message"] = f"Job em processamento... {self.progress}% completo"
+            data["concurrency"] = detail_concurrency.get_stats()
         elif self.status == JobStatus.COMPLETED:
             data["result"] = self.result
             data["completed_at"] = self.completed_at
@@ -102,25 +121,33 @@ class JobManager:
     - Limpeza automática de jobs antigos
     """
 
-    def __init__(self, cleanup_hours: int = 24):
+    def __init__(self, cleanup_hours: int = 24, results_buffer_size: int = 500,
+                 results_spill_dir: str = ".crawl_state/job_results"):
         """
         Inicializa o gerenciador de jobs
 
         Args:
             cleanup_hours: Horas após as quais um job será removido
+            results_buffer_size: Resultados publicados mantidos em memória por job
+            results_spill_dir: Diretório dos resultados que saíram da janela (JSONL por job)
         """
         self.jobs: Dict[str, Job] = {}
         self.lock = threading.RLock()
         self.cleanup_hours = cleanup_hours
+        self.results_buffer_size = results_buffer_size
+        self.results_spill_dir = results_spill_dir
 
-    def create_job(self) -> str:
+    def create_job(self, job_id: Optional[str] = None) -> str:
         """
         Cria um novo job e retorna seu ID
 
+        Args:
+            job_id: ID a reutilizar (retomada de checkpoint); None = novo UUID
+
         Returns:
             ID único do job (UUID)
         """
-        job_id = str(uuid.uuid4())
+        job_id = job_id or str(uuid.uuid4())
         job = Job(job_id)
 
         with self.lock:
@@ -202,6 +229,135 @@ class JobManager:
             if job:
                 job.update_progress(progress)
 
+    def add_rate_limit_wait(self, job_id: str, seconds: float):
+        """
+        Somar uma espera do rate limiter ao job
+
+        Args:
+            job_id: ID do job
+            seconds: Segundos aguardados
+        """
+        with self.lock:
+            job = self.jobs.get(job_id)
+            if job:
+                job.rate_limit_wait_seconds += seconds
+
+    def _spill(self, job: Job):
+        """Gravar no arquivo do job os itens que passaram da janela em memória (sem lock)"""
+        overflow = len(job.results) - self.results_buffer_size
+        if overflow <= 0:
+            return
+        # Primeiro spill do job: arquivo novo (um job retomado com o mesmo id não herda o antigo)
+        mode = "a"
+        if job.spill_path is None:
+            os.makedirs(self.results_spill_dir, exist_ok=True)
+            job.spill_path = os.path.join(self.results_spill_dir, f"{job.job_id}.jsonl")
+            mode = "w"
+        with open(job.spill_path, mode, encoding="utf-8") as f:
+            for item in job.results[:overflow]:
+                f.write(json.dumps(item, ensure_ascii=False) + "\n")
+        del job.results[:overflow]
+        job.results_offset += overflow
+
+    def _read_results(self, job: Job, start: int, end: Optional[int]) -> List[Any]:
+        """Itens [start, end) do job: do arquivo de spill e/ou da janela em memória (sem lock)"""
+        total = job.results_offset + len(job.results)
+        end = total if end is None else min(end, total)
+        items: List[Any] = []
+        if start < job.results_offset and job.spill_path:
+            with open(job.spill_path, encoding="utf-8") as f:
+                for i, line in enumerate(f):
+                    if i >= min(end, job.results_offset):
+                        break
+                    if i >= start:
+                        items.append(json.loads(line))
+        window_start = max(start, job.results_offset) - job.results_offset
+        window_end = end - job.results_offset
+        if window_end > window_start:
+            items.extend(job.results[window_start:window_end])
+        return items
+
+    def _remove_spill(self, job: Job):
+        """Apagar o arquivo de spill do job (sem lock)"""
+        if job.spill_path:
+            try:
+                os.remove(job.spill_path)
+            except OSError:
+                pass
+
+    def append_job_results(self, job_id: str, items: List[Any]) -> int:
+        """
+        Publicar resultados parciais enquanto o job executa
+
+        Só os últimos results_buffer_size itens ficam em memória; os anteriores
+        são gravados no arquivo de spill do job e continuam legíveis.
+
+        Args:
+            job_id: ID do job
+            items: Itens extraídos desde a última publicação
+
+        Returns:
+            Total de itens publicados no job (0 se não encontrado)
+        """
+        with self.lock:
+            job = self.jobs.get(job_id)
+            if not job:
+                return 0
+            job.results.extend(items)
+            self._spill(job)
+            return job.results_offset + len(job.results)
+
+    def count_job_results(self, job_id: str) -> int:
+        """Total de itens publicados no job (0 se não encontrado)"""
+        with self.lock:
+            job = self.jobs.get(job_id)
+            return job.results_offset + len(job.results) if job else 0
+
+    def get_job_results(self, job_id: str, offset: int = 0, limit: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        Ler os resultados publicados de um job a partir de offset
+
+        Args:
+            job_id: ID do job
+            offset: Índice do primeiro item
+            limit: Máximo de itens (None = todos a partir de offset)
+
+        Returns:
+            Dicionário com status, total e itens, ou None se não encontrado
+        """
+        with self.lock:
+            job = self.jobs.get(job_id)
+            if not job:
+                return None
+            end = None if limit is None else offset + limit
+            return {
+                "job_id": job.job_id,
+                "status": job.status.value,
+                "offset": offset,
+                "total": job.results_offset + len(job.results),
+                "items": self._read_results(job, offset, end),
+            }
+
+    def iter_job_results(self, job_id: str) -> Iterator[Any]:
+        """
+        Percorrer todos os resultados publicados do job, um item por vez
+
+        Lê o arquivo de spill linha a linha e depois a janela em memória, sem
+        montar a lista completa (ex.: totais do resultado final de um job concluído).
+        """
+        with self.lock:
+            job = self.jobs.get(job_id)
+            if not job:
+                return
+            spilled, spill_path, window = job.results_offset, job.spill_path, list(job.results)
+        if spilled and spill_path:
+            with open(spill_path, encoding="utf-8") as f:
+                for i, line in enumerate(f):
+                    if i >= spilled:
+                        break
+                    yield json.loads(line)
+        yield from window
+
     def get_job_dict(self, job_id: str) -> Optional[Dict[str, Any]]:
         """
         Recupera um job como dicionário
@@ -247,7 +403,7 @@ class JobManager:
                     job_ids_to_delete.append(job_id)
 
             for job_id in job_ids_to_delete:
-                del self.jobs[job_id]
+                self._remove_spill(self.jobs.pop(job_id))
 
     def delete_job(self, job_id: str) -> bool:
         """
@@ -261,10 +417,13 @@ class JobManager:
         """
         with self.lock:
             if job_id in self.jobs:
-                del self.jobs[job_id]
+                self._remove_spill(self.jobs.pop(job_id))
                 return True
             return False
 
 
 # Instância global do gerenciador de jobs
-job_manager = JobManager()
+job_manager = JobManager(
+    results_buffer_size=settings.JOB_RESULTS_BUFFER_SIZE,
+    results_spill_dir=settings.JOB_RESULTS_SPILL_DIR,
+)
@@ -0,0 +1,330 @@
+"""
+Login Coordinator - Login single-flight por conta
+
+Quando vários jobs da mesma conta precisam logar ao mesmo tempo, apenas o
+primeiro executa o login no navegador; os demais aguardam o resultado e
+reutilizam o storage_state obtido. Contas em uso têm a sessão renovada
+em segundo plano antes de o estado em cache expirar.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from app.core.auth_state import auth_state_cache
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+StorageState = Optional[Dict[str, Any]]
+
+
+class _Flight:
+    """Login em andamento de uma conta"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.storage_state: StorageState = None
+        self.error: Optional[BaseException] = None
+
+
+class LoginCoordinator:
+    """
+    Coordenador de logins por conta (username + URL de login)
+
+    Responsável por:
+    - Garantir no máximo um login simultâneo por conta (single-flight)
+    - Entregar o storage_state do login aos jobs que aguardavam
+    - Salvar o estado no AuthStateCache
+    - Renovar proativamente a sessão de contas em uso antes de expirar
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        wait_timeout: int = 120,
+        refresh_margin_seconds: int = 1800,
+        refresh_check_interval: int = 60,
+        refresh_max_failures: int = 5,
+        refresh_backoff_max_seconds: int = 3600,
+    ):
+        """
+        Inicializa o coordenador
+
+        Args:
+            enabled: Se False, cada chamada executa seu próprio login
+            wait_timeout: Segundos máximos aguardando o login de outro job
+            refresh_margin_seconds: Antecedência (antes do TTL) para renovar a sessão
+                                    (0 = sem renovação proativa)
+            refresh_check_interval: Segundos entre verificações de renovação
+            refresh_max_failures: Renovações seguidas com falha até a conta sair da renovação proativa
+            refresh_backoff_max_seconds: Espera máxima entre renovações com falha (backoff exponencial)
+        """
+        self.enabled = enabled
+        self.wait_timeout = wait_timeout
+        self.refresh_margin_seconds = refresh_margin_seconds
+        self.refresh_check_interval = refresh_check_interval
+        self.refresh_max_failures = refresh_max_failures
+        self.refresh_backoff_max_seconds = refresh_backoff_max_seconds
+        self.lock = threading.RLock()
+        self._flights: Dict[Tuple[str, str], _Flight] = {}
+        # Contas com renovação proativa: chave -> {refresh, obtained_at, last_used, failures, next_attempt_at}
+        self._accounts: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._refresher: Optional[threading.Thread] = None
+        self._stats = {
+            "logins": 0,
+            "logins_shared": 0,
+            "logins_failed": 0,
+            "refreshes": 0,
+            "refreshes_failed": 0,
+        }
+
+    def _begin(self, key: Tuple[str, str]) -> Tuple[_Flight, bool]:
+        """Entrar no voo da conta; retorna (voo, True se este chamador é o líder)"""
+        with self.lock:
+            flight = self._flights.get(key)
+            if flight is not None and self.enabled:
+                self._stats["logins_shared"] += 1
+                return flight, False
+
+            flight = _Flight()
+            self._flights[key] = flight
+            return flight, True
+
+    def _finish(self, key: Tuple[str, str], flight: _Flight, storage_state: StorageState, error: Optional[BaseException]):
+        """Publicar o resultado do líder, salvar no cache e liberar quem aguarda"""
+        login_url, username = key
+        flight.storage_state = storage_state
+        flight.error = error
+
+        if error is None and storage_state:
+            if settings.AUTH_STATE_CACHE_ENABLED:
+                try:
+                    auth_state_cache.save(username, login_url, storage_state)
+                except Exception as e:
+                    logger.warning(f"⚠️ [Login] Não foi possível salvar sessão em cache: {str(e)}")
+
+        with self.lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+            if error is None and storage_state:
+                self._stats["logins"] += 1
+                account = self._accounts.get(key)
+                if account is not None:
+                    account["obtained_at"] = time.time()
+                    account["failures"] = 0
+                    account["next_attempt_at"] = 0.0
+            else:
+                self._stats["logins_failed"] += 1
+
+        flight.done.set()
+
+    def _follower_result(self, flight: _Flight, username: str) -> StorageState:
+        """Resultado do líder para um job que aguardou"""
+        if flight.error is not None:
+            raise flight.error
+        if not flight.storage_state:
+            raise Exception(f"Login compartilhado da conta {username} não autenticou")
+        return flight.storage_state
+
+    def login(
+        self,
+        username: str,
+        login_url: str,
+        login_fn: Callable[[], StorageState],
+        refresh_fn: Optional[Callable[[], StorageState]] = None,
+    ) -> Tuple[StorageState, bool]:
+        """
+        Obter storage_state autenticado, executando login_fn apenas se nenhum outro job já estiver logando
+
+        Args:
+            username: Email/username da conta
+            login_url: URL de login
+            login_fn: Executa o login no navegador do chamador e retorna o storage_state
+                      (None se o login não autenticou)
+            refresh_fn: Login independente (navegador próprio) usado na renovação proativa
+
+        Returns:
+            (storage_state, True se o login foi executado por este chamador)
+        """
+        key = (login_url, username)
+        self._touch(key, refresh_fn)
+        flight, leader = self._begin(key)
+
+        if not leader:
+            logger.info(f"[Login] Aguardando login em andamento da conta {username}...")
+            if not flight.done.wait(timeout=self.wait_timeout):
+                raise TimeoutError(f"Login da conta {username} não terminou em {self.wait_timeout}s")
+            return self._follower_result(flight, username), False
+
+        storage_state: StorageState = None
+        error: Optional[BaseException] = None
+        try:
+            storage_state = login_fn()
+            return storage_state, True
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            self._finish(key, flight, storage_state, error)
+
+    async def login_async(
+        self,
+        username: str,
+        login_url: str,
+        login_fn: Callable[[], Awaitable[StorageState]],
+        refresh_fn: Optional[Callable[[], StorageState]] = None,
+    ) -> Tuple[StorageState, bool]:
+        """
+        Equivalente async de login(): o líder aguarda login_fn no loop e os
+        demais aguardam o evento em uma thread, sem bloquear o loop.
+        """
+        key = (login_url, username)
+        self._touch(key, refresh_fn)
+        flight, leader = self._begin(key)
+
+        if not leader:
+            logger.info(f"[Login] [async] Aguardando login em andamento da conta {username}...")
+            finished = await asyncio.get_running_loop().run_in_executor(
+                None, flight.done.wait, self.wait_timeout
+            )
+            if not finished:
+                raise TimeoutError(f"Login da conta {username} não terminou em {self.wait_timeout}s")
+            return self._follower_result(flight, username), False
+
+        storage_state: StorageState = None
+        error: Optional[BaseException] = None
+        try:
+            storage_state = await login_fn()
+            return storage_state, True
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            self._finish(key, flight, storage_state, error)
+
+    def report_rejected(self, username: str, login_url: str, storage_state: StorageState):
+        """
+        Invalidar o estado em cache rejeitado pelo site
+
+        Só remove se o cache ainda contém esse mesmo estado: outro job pode
+        já ter salvo um estado novo depois do login.
+        """
+        with auth_state_cache.lock:
+            if auth_state_cache.load(username, login_url) == storage_state:
+                auth_state_cache.invalidate(username, login_url)
+
+    def touch(self, username: str, login_url: str, refresh_fn: Optional[Callable[[], StorageState]] = None):
+        """
+        Registrar uso da conta sem passar por login()
+
+        Chamado a cada authenticate(), inclusive quando a sessão em cache é
+        reutilizada: sem isso a conta em uso sairia da renovação após um TTL.
+        """
+        self._touch((login_url, username), refresh_fn)
+
+    def _touch(self, key: Tuple[str, str], refresh_fn: Optional[Callable[[], StorageState]]):
+        """Registrar uso da conta (e a função de renovação, se houver)"""
+        if refresh_fn is None or self.refresh_margin_seconds <= 0 or not settings.AUTH_STATE_CACHE_ENABLED:
+            return
+
+        with self.lock:
+            account = self._accounts.setdefault(key, {"obtained_at": None, "failures": 0, "next_attempt_at": 0.0})
+            account["refresh"] = refresh_fn
+            account["last_used"] = time.time()
+
+            if self._refresher is None or not self._refresher.is_alive():
+                self._refresher = threading.Thread(
+                    target=self._refresh_loop, name="login-refresher", daemon=True
+                )
+                self._refresher.start()
+
+    def _due_refreshes(self) -> Dict[Tuple[str, str], Callable[[], StorageState]]:
+        """Contas cujo estado está perto de expirar (e que ainda estão em uso)"""
+        now = time.time()
+        ttl = settings.AUTH_STATE_TTL_SECONDS
+        due = {}
+        with self.lock:
+            for key, account in list(self._accounts.items()):
+                # Conta sem uso há mais de um TTL: parar de renovar
+                if now - account["last_used"] > ttl:
+                    del self._accounts[key]
+                    continue
+                obtained_at = account["obtained_at"]
+                if obtained_at is None or key in self._flights or now < account["next_attempt_at"]:
+                    continue
+                if now - obtained_at >= ttl - self.refresh_margin_seconds:
+                    due[key] = account["refresh"]
+        return due
+
+    def _refresh_failed(self, key: Tuple[str, str]):
+        """
+        Adiar a próxima renovação da conta (backoff exponencial) após uma falha
+
+        Depois de refresh_max_failures falhas seguidas a conta sai da renovação
+        proativa; ela volta quando um job usar a conta e logar de novo.
+        """
+        login_url, username = key
+        with self.lock:
+            self._stats["refreshes_failed"] += 1
+            account = self._accounts.get(key)
+            if account is None:
+                return
+            account["failures"] += 1
+            if account["failures"] >= self.refresh_max_failures:
+                del self._accounts[key]
+                logger.warning(
+                    f"⚠️ [Login] Renovação da conta {username} desativada após {account['failures']} falhas seguidas"
+                )
+                return
+            delay = min(self.refresh_backoff_max_seconds, self.refresh_check_interval * 2 ** account["failures"])
+            account["next_attempt_at"] = time.time() + delay
+        logger.info(f"ℹ️ [Login] Próxima renovação da conta {username} em {delay}s")
+
+    def _refresh_loop(self):
+        """Thread de renovação proativa"""
+        while True:
+            time.sleep(self.refresh_check_interval)
+            for key, refresh_fn in self._due_refreshes().items():
+                login_url, username = key
+                flight, leader = self._begin(key)
+                if not leader:
+                    continue
+
+                logger.info(f"♻️ [Login] Renovando sessão da conta {username} antes de expirar")
+                storage_state: StorageState = None
+                error: Optional[BaseException] = None
+                try:
+                    storage_state = refresh_fn()
+                    with self.lock:
+                        self._stats["refreshes"] += 1
+                except Exception as e:
+                    error = e
+                    logger.warning(f"⚠️ [Login] Falha ao renovar sessão da conta {username}: {str(e)}")
+                finally:
+                    self._finish(key, flight, storage_state, error)
+                if error is not None or not storage_state:
+                    self._refresh_failed(key)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retornar estatísticas do coordenador"""
+        with self.lock:
+            return {
+                **self._stats,
+                "enabled": self.enabled,
+                "logins_in_flight": len(self._flights),
+                "accounts_refreshing": len(self._accounts),
+            }
+
+
+# Instância global do coordenador de login
+login_coordinator = LoginCoordinator(
+    enabled=settings.LOGIN_COORDINATOR_ENABLED,
+    wait_timeout=settings.LOGIN_WAIT_TIMEOUT_SECONDS,
+    refresh_margin_seconds=settings.LOGIN_REFRESH_MARGIN_SECONDS,
+    refresh_check_interval=settings.LOGIN_REFRESH_CHECK_INTERVAL,
+    refresh_max_failures=settings.LOGIN_REFRESH_MAX_FAILURES,
+    refresh_backoff_max_seconds=settings.LOGIN_REFRESH_BACKOFF_MAX_SECONDS,
+)
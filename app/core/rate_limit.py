@@ -0,0 +1,190 @@
+"""
+Rate Limiter - Token bucket por host para navegações e requisições HTTP
+
+Todos os `page.goto` (TubeHunt e Notion, engines sync e async) e as
+requisições httpx passam por um bucket do host de destino: até `burst`
+requisições imediatas e depois `rate` por segundo, compartilhado por todos os
+jobs do processo (executor, threads avulsas, engine async). O tempo de espera
+é somado ao job atual (contextvar definido com bind_job) e exposto no status.
+"""
+
+import asyncio
+import contextvars
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+from app.core.config import settings
+from app.core.job_queue import job_manager
+
+logger = logging.getLogger(__name__)
+
+# Job em execução no contexto atual (thread ou tarefa async), para registrar a espera
+current_job_id: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("current_job_id", default=None)
+
+
+def bind_job(job_id: str):
+    """Associar as esperas do contexto atual (thread/tarefa do job) ao job"""
+    current_job_id.set(job_id)
+
+
+class TokenBucket:
+    """Token bucket com reserva: quem chega reserva um token e recebe quanto deve esperar"""
+
+    def __init__(self, rate: float, burst: int):
+        """
+        Args:
+            rate: Tokens repostos por segundo
+            burst: Capacidade do bucket (requisições imediatas após ociosidade)
+        """
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Reservar um token
+
+        Returns:
+            Segundos a esperar antes de usar o token (0 = imediato)
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(float(self.burst), self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1.0
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+
+class HostRateLimiter:
+    """
+    Buckets por host (ou grupo de hosts) compartilhados pelo processo
+
+    Responsável por:
+    - Mapear a URL de destino para o bucket do site (TubeHunt, Notion ou host avulso)
+    - Fazer quem chega esperar a vez (bloqueante ou async)
+    - Registrar o tempo de espera por job e por host
+    """
+
+    def __init__(self, enabled: bool = True, groups: Optional[Dict[str, Tuple[Tuple[str, ...], float, int]]] = None,
+                 default_rate: float = 5.0, default_burst: int = 10):
+        """
+        Args:
+            enabled: Se False, nenhuma requisição espera
+            groups: nome -> (sufixos de host, rate, burst); hosts do grupo dividem um bucket
+            default_rate: Rate dos demais hosts (um bucket por host)
+            default_burst: Burst dos demais hosts
+        """
+        self.enabled = enabled
+        self.groups = groups or {}
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self.lock = threading.Lock()
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    def _bucket_key(self, url: str) -> Tuple[str, float, int]:
+        """Chave, rate e burst do bucket de uma URL"""
+        host = (urlparse(url).hostname or "").lower()
+        for name, (suffixes, rate, burst) in self.groups.items():
+            if any(host == suffix or host.endswith(f".{suffix}") for suffix in suffixes):
+                return name, rate, burst
+        return host, self.default_rate, self.default_burst
+
+    def _reserve(self, url: str) -> Tuple[str, float]:
+        """Reservar um token no bucket da URL (chave, espera)"""
+        key, rate, burst = self._bucket_key(url)
+        with self.lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(rate, burst)
+        return key, bucket.reserve()
+
+    def _record(self, key: str, waited: float):
+        """Somar a espera ao host e ao job atual"""
+        with self.lock:
+            stats = self._stats.setdefault(key, {"requests": 0, "throttled": 0, "wait_seconds": 0.0})
+            stats["requests"] += 1
+            if waited > 0:
+                stats["throttled"] += 1
+                stats["wait_seconds"] += waited
+
+        job_id = current_job_id.get()
+        if job_id and waited > 0:
+            job_manager.add_rate_limit_wait(job_id, waited)
+
+    def wait(self, url: str) -> float:
+        """
+        Aguardar a vez de requisitar a URL (bloqueante)
+
+        Returns:
+            Segundos esperados
+        """
+        if not self.enabled:
+            return 0.0
+        key, delay = self._reserve(url)
+        if delay > 0:
+            time.sleep(delay)
+        self._record(key, delay)
+        return delay
+
+    async def wait_async(self, url: str) -> float:
+        """Equivalente de wait() sem bloquear o event loop"""
+        if not self.enabled:
+            return 0.0
+        key, delay = self._reserve(url)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        self._record(key, delay)
+        return delay
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Requisições, requisições que esperaram e espera total por bucket"""
+        with self.lock:
+            return {
+                "enabled": self.enabled,
+                "buckets": {
+                    key: {**stats, "wait_seconds": round(stats["wait_seconds"], 2)}
+                    for key, stats in self._stats.items()
+                },
+            }
+
+
+# Instância global do rate limiter
+rate_limiter = HostRateLimiter(
+    enabled=settings.RATE_LIMIT_ENABLED,
+    groups={
+        "tubehunt": (("tubehunt.io",), settings.RATE_LIMIT_TUBEHUNT_PER_SECOND, settings.RATE_LIMIT_TUBEHUNT_BURST),
+        "notion": (("notion.site", "notion.so"), settings.RATE_LIMIT_NOTION_PER_SECOND, settings.RATE_LIMIT_NOTION_BURST),
+    },
+    default_rate=settings.RATE_LIMIT_DEFAULT_PER_SECOND,
+    default_burst=settings.RATE_LIMIT_DEFAULT_BURST,
+)
+
+
+def rate_limited_goto(page, url: str, **kwargs):
+    """page.goto() (Sync API) depois de aguardar o bucket do host"""
+    rate_limiter.wait(url)
+    return page.goto(url, **kwargs)
+
+
+async def rate_limited_goto_async(page, url: str, **kwargs):
+    """page.goto() (Async API) depois de aguardar o bucket do host"""
+    await rate_limiter.wait_async(url)
+    return await page.goto(url, **kwargs)
+
+
+def httpx_request_hook(request):
+    """event_hooks["request"] de httpx.Client"""
+    rate_limiter.wait(str(request.url))
+
+
+async def httpx_request_hook_async(request):
+    """event_hooks["request"] de httpx.AsyncClient"""
+    await rate_limiter.wait_async(str(request.url))
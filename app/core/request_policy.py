@@ -0,0 +1,185 @@
+"""
+Política de roteamento de requisições do Playwright.
+
+Aborta requisições que o scraping nunca usa (imagens, fontes, mídia e
+trackers) para reduzir banda, CPU e tempo de carregamento de página.
+"""
+
+import logging
+import re
+import threading
+from typing import Dict, Any, Iterable, Optional
+from playwright.sync_api import BrowserContext, Route
+from playwright.async_api import BrowserContext as AsyncBrowserContext, Route as AsyncRoute
+
+logger = logging.getLogger(__name__)
+
+# Trackers e analytics: nunca usados na extração
+TRACKER_URL_PATTERNS = [
+    r"google-analytics\.com",
+    r"googletagmanager\.com",
+    r"doubleclick\.net",
+    r"googlesyndication\.com",
+    r"facebook\.(net|com)/tr",
+    r"connect\.facebook\.net",
+    r"hotjar\.(com|io)",
+    r"clarity\.ms",
+    r"segment\.(io|com)",
+    r"intercom(cdn)?\.(io|com)",
+    r"sentry\.io",
+]
+
+# Tamanho médio aproximado por tipo de recurso, usado apenas para estimar
+# a economia de banda (o conteúdo de uma requisição abortada nunca é baixado)
+ESTIMATED_BYTES_BY_TYPE = {
+    "image": 25_000,
+    "media": 500_000,
+    "font": 40_000,
+    "script": 30_000,
+    "stylesheet": 20_000,
+}
+DEFAULT_ESTIMATED_BYTES = 5_000
+
+
+class RequestRoutingPolicy:
+    """
+    Política que decide quais requisições de um BrowserContext são abortadas.
+
+    A ordem de decisão é: allowlist de URL (sempre passa) → tipo de recurso
+    bloqueado → padrão de URL bloqueado → passa.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        blocked_resource_types: Iterable[str] = (),
+        blocked_url_patterns: Iterable[str] = (),
+        allowed_url_patterns: Iterable[str] = (),
+    ):
+        """
+        Inicializar política.
+
+        Args:
+            name: Nome da política (usado em logs e métricas)
+            blocked_resource_types: Tipos de recurso do Playwright a abortar
+                                    ("image", "font", "media", ...)
+            blocked_url_patterns: Regex de URLs a abortar
+            allowed_url_patterns: Regex de URLs que nunca são abortadas
+        """
+        self.name = name
+        self.blocked_resource_types = set(blocked_resource_types)
+        self.blocked_url_regex = self._compile(blocked_url_patterns)
+        self.allowed_url_regex = self._compile(allowed_url_patterns)
+        self.lock = threading.Lock()
+        self._stats: Dict[str, Any] = {
+            "requests_allowed": 0,
+            "requests_blocked": 0,
+            "estimated_bytes_blocked": 0,
+            "blocked_by_type": {},
+        }
+
+    @staticmethod
+    def _compile(patterns: Iterable[str]) -> Optional[re.Pattern]:
+        """Combinar padrões em uma única regex."""
+        patterns = list(patterns)
+        if not patterns:
+            return None
+        return re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+
+    def should_block(self, url: str, resource_type: str) -> bool:
+        """
+        Verificar se uma requisição deve ser abortada.
+
+        Args:
+            url: URL da requisição
+            resource_type: Tipo de recurso reportado pelo Playwright
+
+        Returns:
+            bool: True se a requisição deve ser abortada
+        """
+        if self.allowed_url_regex and self.allowed_url_regex.search(url):
+            return False
+        if resource_type in self.blocked_resource_types:
+            return True
+        if self.blocked_url_regex and self.blocked_url_regex.search(url):
+            return True
+        return False
+
+    def _record(self, blocked: bool, resource_type: str):
+        """Atualizar contadores."""
+        with self.lock:
+            if not blocked:
+                self._stats["requests_allowed"] += 1
+                return
+            self._stats["requests_blocked"] += 1
+            self._stats["estimated_bytes_blocked"] += ESTIMATED_BYTES_BY_TYPE.get(
+                resource_type, DEFAULT_ESTIMATED_BYTES
+            )
+            by_type = self._stats["blocked_by_type"]
+            by_type[resource_type] = by_type.get(resource_type, 0) + 1
+
+    def handle(self, route: Route):
+        """Handler de rota para a Sync API."""
+        request = route.request
+        blocked = self.should_block(request.url, request.resource_type)
+        self._record(blocked, request.resource_type)
+        if blocked:
+            route.abort("blockedbyclient")
+        else:
+            route.fallback()
+
+    async def handle_async(self, route: AsyncRoute):
+        """Handler de rota para a Async API."""
+        request = route.request
+        blocked = self.should_block(request.url, request.resource_type)
+        self._record(blocked, request.resource_type)
+        if blocked:
+            await route.abort("blockedbyclient")
+        else:
+            await route.fallback()
+
+    def apply(self, context: BrowserContext):
+        """
+        Instalar a política em um BrowserContext (vale para todas as páginas dele).
+
+        Args:
+            context: Contexto Playwright (Sync API)
+        """
+        context.route("**/*", self.handle)
+        logger.info(f"✅ Política de requisições '{self.name}' aplicada ao contexto")
+
+    async def apply_async(self, context: AsyncBrowserContext):
+        """
+        Instalar a política em um BrowserContext da Async API.
+
+        Args:
+            context: Contexto Playwright (Async API)
+        """
+        await context.route("**/*", self.handle_async)
+        logger.info(f"✅ Política de requisições '{self.name}' aplicada ao contexto async")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retornar estatísticas acumuladas da política."""
+        with self.lock:
+            return {
+                "policy": self.name,
+                **self._stats,
+                "blocked_by_type": dict(self._stats["blocked_by_type"]),
+            }
+
+
+# TubeHunt: só lemos o atributo src das thumbnails, nunca os bytes
+tubehunt_routing_policy = RequestRoutingPolicy(
+    name="tubehunt",
+    blocked_resource_types=["image", "media", "font"],
+    blocked_url_patterns=TRACKER_URL_PATTERNS,
+)
+
+# Notion: imagens continuam liberadas (o layout dos cards define a posição
+# usada para atribuir nichos) e a API interna nunca é bloqueada
+notion_routing_policy = RequestRoutingPolicy(
+    name="notion",
+    blocked_resource_types=["media", "font"],
+    blocked_url_patterns=TRACKER_URL_PATTERNS,
+    allowed_url_patterns=[r"notion\.(so|site)/api/"],
+)
@@ -1,8 +1,18 @@
 """Main FastAPI application"""
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
 from app.api.v1 import tubehunt, notion
+from app.core.browser import browser_pool, recycle_stats, sample_browser_rss_mb
+from app.core.async_browser import async_engine
+from app.services.tubehunt_parser import parser_pool
+from app.services.tubehunt_pipeline import PIPELINE_THREAD_PREFIX, pipeline_executor
+from app.core.login_coordinator import login_coordinator
+from app.core.concurrency import detail_concurrency
+from app.core.rate_limit import rate_limiter
+from app.core.request_policy import tubehunt_routing_policy, notion_routing_policy
+import asyncio
 import logging
 
 
@@ -40,12 +50,51 @@ async def startup_event():
     """Run on startup"""
     logger.info(f"Starting {settings.APP_NAME} v{settings.APP_VERSION}")
 
+    loop = asyncio.get_running_loop()
+
+    # Iniciar as threads do executor de scraping com driver Playwright e
+    # navegador já lançados; a API só aceita conexões depois disso
+    if settings.BROWSER_POOL_ENABLED and settings.BROWSER_POOL_WARMUP:
+        executors = [(tubehunt.scraping_executor, settings.BROWSER_POOL_THREAD_PREFIX)]
+        # Workers de detalhes do pipeline: só o engine sync usa essas threads
+        if settings.SCRAPER_ENGINE != "async":
+            executors.append((pipeline_executor, PIPELINE_THREAD_PREFIX))
+        threads = sum(browser_pool.group_sizes[prefix] for _, prefix in executors)
+        logger.info(f"Aquecendo pool de navegadores ({threads} threads)...")
+        await loop.run_in_executor(
+            None,
+            browser_pool.warm_up_executors,
+            executors,
+            "chromium",
+            settings.SELENIUM_HEADLESS,
+            settings.BROWSER_POOL_WARMUP_TIMEOUT,
+        )
+
+    if settings.SCRAPER_ENGINE == "async":
+        try:
+            await asyncio.wrap_future(async_engine.submit(async_engine.get_browser()))
+            logger.info("✅ Navegador do engine async pré-lançado")
+        except Exception as e:
+            logger.warning(f"⚠️ Falha ao pré-lançar navegador async: {str(e)}")
+
+    # Retomar lotes de /scrape-channel interrompidos pelo reinício (mesmo job_id)
+    if settings.CHECKPOINT_ENABLED and settings.CHECKPOINT_RESUME_ON_STARTUP:
+        try:
+            tubehunt.resume_checkpointed_jobs()
+        except Exception as e:
+            logger.warning(f"⚠️ Falha ao retomar jobs do checkpoint: {str(e)}")
+
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Run on shutdown"""
     logger.info(f"Shutting down {settings.APP_NAME}")
 
+    if settings.SCRAPER_ENGINE == "async":
+        await asyncio.get_running_loop().run_in_executor(None, async_engine.stop)
+
+    parser_pool.shutdown()
+
 
 @app.get("/")
 async def root():
@@ -58,6 +107,43 @@ async def root():
     }
 
 
+@app.get("/ready")
+async def ready():
+    """Readiness: 200 somente depois que o pool de navegadores está aquecido"""
+    warmup_required = settings.BROWSER_POOL_ENABLED and settings.BROWSER_POOL_WARMUP
+    is_ready = not warmup_required or browser_pool.warmup_state == "ready"
+    return JSONResponse(
+        status_code=200 if is_ready else 503,
+        content={
+            "ready": is_ready,
+            "browser_pool": browser_pool.warmup_state,
+            "warmup_seconds": browser_pool.warmup_seconds,
+        },
+    )
+
+
+@app.get("/metrics")
+async def metrics():
+    """Métricas de recursos de scraping (pool de navegadores, requisições bloqueadas)"""
+    return {
+        "browser_pool": browser_pool.get_stats(),
+        "browser_recycling": {
+            **recycle_stats,
+            "browser_rss_mb": sample_browser_rss_mb(),
+        },
+        "login_coordinator": login_coordinator.get_stats(),
+        "detail_concurrency": detail_concurrency.get_stats(),
+        "rate_limit": rate_limiter.get_stats(),
+        "request_blocking": {
+            "enabled": settings.REQUEST_BLOCKING_ENABLED,
+            "policies": [
+                tubehunt_routing_policy.get_stats(),
+                notion_routing_policy.get_stats(),
+            ],
+        },
+    }
+
+
 if __name__ == "__main__":
     import uvicorn
 
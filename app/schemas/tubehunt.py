@@ -234,6 +234,8 @@ class JobStatusResponse(BaseModel):
     progress: int = Field(..., description="Progresso em % (0-100)")
     message: str = Field(..., description="Mensagem descritiva do status")
     started_at: Optional[datetime] = Field(None, description="Timestamp de início")
+    concurrency: Optional[dict] = Field(None, description="Janela AIMD de páginas de canal (compartilhada pelos jobs)")
+    rate_limit_wait_seconds: Optional[float] = Field(None, description="Tempo total aguardando o rate limiter por host")
 
     class Config:
         json_schema_extra = {
@@ -242,7 +244,8 @@ class JobStatusResponse(BaseModel):
                 "status": "processing",
                 "progress": 45,
                 "message": "Extraindo dados de canais... 45/50 concluído",
-                "started_at": "2026-01-01T20:01:00.000000"
+                "started_at": "2026-01-01T20:01:00.000000",
+                "concurrency": {"window": 6.5, "in_flight": 6, "throttled": 1, "decreases": 1}
             }
         }
 
@@ -251,7 +254,7 @@ class JobResultResponse(BaseModel):
     """Response com resultado completo de um job"""
     job_id: str = Field(..., description="ID do job")
     status: str = Field(..., description="Status final: completed")
-    result: Optional[dict] = Field(None, description="Resultado do scraping (ChannelsListResponse)")
+    result: Optional[dict] = Field(None, description="Resumo do scraping; os itens ficam em results_url (GET /jobs/{job_id}/results)")
     execution_time_seconds: Optional[float] = Field(None, description="Tempo total de execução")
     completed_at: Optional[datetime] = Field(None, description="Timestamp de conclusão")
 
@@ -262,8 +265,9 @@ class JobResultResponse(BaseModel):
                 "status": "completed",
                 "result": {
                     "success": True,
-                    "channels": [],
                     "total_channels": 50,
+                    "results_total": 50,
+                    "results_url": "/api/v1/tubehunt/jobs/550e8400-e29b-41d4-a716-446655440000/results",
                     "timestamp": "2026-01-01T20:15:30.000000",
                     "error": None
                 },
@@ -273,6 +277,26 @@ class JobResultResponse(BaseModel):
         }
 
 
+class JobPartialResultsResponse(BaseModel):
+    """Response com os resultados já publicados por um job (em execução ou finalizado)"""
+    job_id: str = Field(..., description="ID do job")
+    status: str = Field(..., description="Status: pending, processing, completed, failed")
+    offset: int = Field(..., description="Índice do primeiro item retornado")
+    total: int = Field(..., description="Total de itens publicados até agora")
+    items: list[dict] = Field(default_factory=list, description="Itens a partir de offset")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "job_id": "550e8400-e29b-41d4-a716-446655440000",
+                "status": "processing",
+                "offset": 0,
+                "total": 12,
+                "items": []
+            }
+        }
+
+
 class JobErrorResponse(BaseModel):
     """Response quando um job falha"""
     job_id: str = Field(..., description="ID do job")
@@ -308,6 +332,18 @@ class ScrapeChannelsRequest(BaseModel):
     wait_time: int = Field(default=15, ge=5, le=600, description="Tempo de espera em segundos (máximo 10 minutos)")
     extract_selector: str = Field(default="h1", description="Seletor CSS para extrair (default: h1)")
 
+    # Crawl de várias páginas (ativo com page_end, until_empty ou incremental)
+    page_start: Optional[int] = Field(None, ge=1, description="Primeira página (default: page= da scrape_url ou 1)")
+    page_end: Optional[int] = Field(None, ge=1, description="Última página do crawl")
+    until_empty: bool = Field(default=False, description="Seguir até a primeira página sem canais")
+    crawl_concurrency: Optional[int] = Field(None, ge=1, le=20, description="Páginas em paralelo (fallback: CRAWL_CONCURRENCY)")
+    incremental: bool = Field(default=False, description="Parar no primeiro canal já visto em crawls anteriores da listagem")
+
+    @property
+    def is_crawl(self) -> bool:
+        """Se a request pede várias páginas"""
+        return self.page_end is not None or self.until_empty or self.incremental
+
     class Config:
         json_schema_extra = {
             "example": {
@@ -322,6 +358,11 @@ class ScrapeChannelsRequest(BaseModel):
         }
 
 
+class ScrapePipelineRequest(ScrapeChannelsRequest):
+    """Request model para listagem + detalhes dos canais em um único job"""
+    detail_concurrency: Optional[int] = Field(None, ge=1, le=20, description="Workers de detalhes (fallback: PIPELINE_DETAIL_CONCURRENCY)")
+
+
 class NichoData(BaseModel):
     """Dados de um nicho extraído da página Notion"""
     name: str = Field(..., description="Nome do nicho")
@@ -420,7 +461,7 @@ class WebhookPayload(BaseModel):
     """Payload enviado para webhook quando job termina"""
     job_id: str = Field(..., description="ID do job")
     status: str = Field(..., description="Status final: 'completed' ou 'failed'")
-    result: Optional[dict] = Field(None, description="Resultado do scraping (ChannelsListResponse)")
+    result: Optional[dict] = Field(None, description="Resumo no webhook final (itens em results_url); offset + items nos webhooks partial")
     execution_time_seconds: Optional[float] = Field(None, description="Tempo total de execução")
     error: Optional[str] = Field(None, description="Mensagem de erro se falhou")
     timestamp: datetime = Field(default_factory=datetime.utcnow, description="Timestamp do webhook")
@@ -432,8 +473,9 @@ class WebhookPayload(BaseModel):
                 "status": "completed",
                 "result": {
                     "success": True,
-                    "channels": [],
                     "total_channels": 50,
+                    "results_total": 50,
+                    "results_url": "/api/v1/tubehunt/jobs/550e8400-e29b-41d4-a716-446655440000/results",
                     "timestamp": "2026-01-01T20:15:30.000000",
                     "error": None
                 },
@@ -493,6 +535,7 @@ class ChannelDetailedData(BaseModel):
     niches: list[str] = Field(default_factory=list, description="Lista de nichos/categorias")
     views_30_days: Optional[str] = Field(None, description="Visualizações dos últimos 30 dias (ex: 357.96k)")
     revenue_30_days: Optional[str] = Field(None, description="Estimativa de receita dos últimos 30 dias (ex: $239,00 - $781,00)")
+    attempts: Optional[int] = Field(None, description="Tentativas de extração no lote (channel_links)")
 
     class Config:
         json_schema_extra = {
@@ -532,6 +575,7 @@ class ScrapeChannelRequest(BaseModel):
     # Opções
     wait_time: int = Field(default=15, ge=5, le=600, description="Tempo de espera em segundos (máximo 10 minutos)")
     webhook_url: Optional[str] = Field(None, description="URL do webhook para notificação ao terminar o scraping (opcional)")
+    tabs: Optional[int] = Field(None, ge=1, le=20, description="Abas em paralelo no lote (fallback: BATCH_TABS_DEFAULT no engine async, 1 no sync; teto: BATCH_TABS_MAX)")
 
     class Config:
         json_schema_extra = {
@@ -568,6 +612,13 @@ class ScrapeChannelRequest(BaseModel):
         return True
 
 
+class ScrapeChannelResumeRequest(BaseModel):
+    """Request model para retomar um lote de /scrape-channel a partir do checkpoint"""
+    # A senha nunca é gravada no checkpoint: informe-a se a sessão em cache expirou
+    password: Optional[str] = Field(None, description="Senha da conta do job (fallback: sessão em cache / .env)")
+    webhook_url: Optional[str] = Field(None, description="Substitui o webhook da request original (opcional)")
+
+
 class ScrapeChannelsListResponse(BaseModel):
     """Response model para scraping de múltiplos canais"""
     total_scraped: int = Field(..., description="Número total de canais extraídos com sucesso")
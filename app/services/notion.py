@@ -5,9 +5,25 @@ import json
 from typing import Optional, Dict, Any, List
 from playwright.sync_api import Page, sync_playwright
 from app.core.browser import PlaywrightBrowserManager
+from app.core.config import settings
+from app.core.extraction import Field, Spec, extract_page, register
+from app.core.rate_limit import rate_limited_goto
+from app.core.request_policy import notion_routing_policy
 
 logger = logging.getLogger(__name__)
 
+# Cards da tabela de nichos (montados por NotionNichosService._extract_card_details)
+NOTION_CARD_SPEC = register(Spec(
+    name="notion.card",
+    root="div.notion-collection-item",
+    fields=(
+        Field("spans", "span", many=True, post=("strip",)),
+        Field("name", "span.notion-enable-hover", post=("strip",)),
+        Field("image_url", "img", attr="src"),
+        Field("url", "a", attr="href"),
+    ),
+))
+
 
 class NotionNichosServiceAPI:
     """Serviço melhorado que usa API interception para extrair dados (baseado em test_ext.py)"""
@@ -121,6 +137,8 @@ class NotionNichosServiceAPI:
 
                 browser = p.chromium.launch(headless=self.headless)
                 ctx = browser.new_context(viewport=self.viewport)
+                if settings.REQUEST_BLOCKING_ENABLED:
+                    notion_routing_policy.apply(ctx)
                 page = ctx.new_page()
 
                 # Handler para respostas
@@ -139,7 +157,7 @@ class NotionNichosServiceAPI:
 
                 # Abrir página
                 logger.info(f"Navegando para: {notion_url}")
-                page.goto(notion_url, timeout=120_000)
+                rate_limited_goto(page, notion_url, timeout=120_000)
                 logger.info(f"▶ Aguardando render inicial ({wait_time}s)...")
                 time.sleep(wait_time)
 
@@ -192,8 +210,10 @@ class NotionNichosServiceAPI:
             with sync_playwright() as p:
                 browser = p.chromium.launch(headless=True)
                 ctx = browser.new_context(viewport=self.viewport)
+                if settings.REQUEST_BLOCKING_ENABLED:
+                    notion_routing_policy.apply(ctx)
                 page = ctx.new_page()
-                page.goto(notion_url, timeout=120_000)
+                rate_limited_goto(page, notion_url, timeout=120_000)
                 time.sleep(20)
 
                 rows = self._assign_niche_by_position(rows, self.niches, page)
@@ -281,7 +301,8 @@ class NotionNichosService:
             self.browser_manager = PlaywrightBrowserManager(
                 headless=self.headless,
                 browser_type="chromium",
-                viewport=self.viewport
+                viewport=self.viewport,
+                routing_policy=notion_routing_policy if settings.REQUEST_BLOCKING_ENABLED else None
             )
             self.page = self.browser_manager.launch()
             logger.info("✅ Navegador Playwright criado")
@@ -310,83 +331,61 @@ class NotionNichosService:
                 self.browser_manager = None
                 self.page = None
 
-    def _extract_card_details(self, card_element) -> Dict[str, Any]:
-        """Extrair detalhes do card tratando estruturas variáveis"""
+    def _extract_card_details(self, raw: Dict[str, Any]) -> Dict[str, Any]:
+        """Montar os detalhes do card (NOTION_CARD_SPEC) tratando estruturas variáveis"""
         try:
-            page = self.get_page()
-
             name = "N/A"
             rpm = "N/A"
             sub_niche = "N/A"
-            image_url = "N/A"
-            url = "N/A"
 
-            # 1. Extrair spans do card
-            spans = card_element.query_selector_all("span")
+            # Textos dos spans do card
+            spans = raw.get("spans") or []
 
             # Tratamento de estruturas variáveis:
             # Estrutura 1 (com notion-enable-hover): [nome, RPM, sub-niche]
             # Estrutura 2 (sem notion-enable-hover): [RPM, nome/categoria, ...]
 
             if spans:
-                # Procurar pelo span com class "notion-enable-hover" (é sempre o nome)
-                name_span = card_element.query_selector("span.notion-enable-hover")
-                if name_span:
+                # O span com class "notion-enable-hover" é sempre o nome
+                if raw.get("name") is not None:
                     # Encontrou estrutura 1: span com classe
-                    name = name_span.text_content().strip()
+                    name = raw["name"]
                     # RPM é o segundo span
                     if len(spans) > 1:
-                        rpm = spans[1].text_content().strip()
+                        rpm = spans[1]
                     # Sub-niche é o terceiro span
                     if len(spans) > 2:
-                        sub_niche = spans[2].text_content().strip()
+                        sub_niche = spans[2]
                 else:
                     # Estrutura 2: sem classe no nome
                     # spans[0] = RPM (contém "$X RPM")
                     # spans[1] = Nome/Categoria
                     # spans[2+] = Mais detalhes se houver
-
-                    if len(spans) > 0:
-                        first_span = spans[0].text_content().strip()
-                        # Se começa com "$", é RPM
-                        if first_span.startswith("$") and "RPM" in first_span:
-                            rpm = first_span
-                            # Nome é o segundo span
-                            if len(spans) > 1:
-                                name = spans[1].text_content().strip()
-                        else:
-                            # Se não começa com "$", assume que é nome
-                            name = first_span
-                            if len(spans) > 1:
-                                rpm = spans[1].text_content().strip()
+                    first_span = spans[0]
+                    # Se começa com "$", é RPM
+                    if first_span.startswith("$") and "RPM" in first_span:
+                        rpm = first_span
+                        # Nome é o segundo span
+                        if len(spans) > 1:
+                            name = spans[1]
+                    else:
+                        # Se não começa com "$", assume que é nome
+                        name = first_span
+                        if len(spans) > 1:
+                            rpm = spans[1]
 
                     # Sub-niche pode estar em terceiro
                     if len(spans) > 2:
-                        sub_niche = spans[2].text_content().strip()
-
-            # 2. Extrair imagem
-            img_elem = card_element.query_selector("img")
-            if img_elem:
-                src = img_elem.get_attribute("src")
-                if src:
-                    image_url = src
-
-            # 3. Extrair URL do link
-            link = card_element.query_selector("a")
-            if link:
-                href = link.get_attribute("href")
-                if href:
-                    url = href
-
-            # Retornar dados extraídos
+                        sub_niche = spans[2]
+
             return {
                 "name": name,
-                "image_url": image_url,
+                "image_url": raw.get("image_url") or "N/A",
                 "rpm": rpm,
                 "sub_niche": sub_niche,
                 "data": "N/A",  # Não conseguimos extrair sem clicar
                 "place": "N/A",  # Não conseguimos extrair sem clicar
-                "url": url
+                "url": raw.get("url") or "N/A"
             }
 
         except Exception as e:
@@ -410,7 +409,7 @@ class NotionNichosService:
 
             # 1. Acessar página
             logger.info(f"Acessando página Notion: {notion_url}")
-            page.goto(notion_url, timeout=120000)
+            rate_limited_goto(page, notion_url, timeout=120000)
             logger.info("✅ Página acessada")
 
             # 2. Aguardar carregamento completo
@@ -424,9 +423,9 @@ class NotionNichosService:
             nichos = []
             seen_urls = set()
 
-            # Extrair TODOS os cards
+            # Extrair TODOS os cards (um único evaluate com NOTION_CARD_SPEC)
             logger.info("\nProcurando por cards no DOM...")
-            cards = page.query_selector_all("div.notion-collection-item")
+            cards = extract_page(NOTION_CARD_SPEC, page)
             logger.info(f"✅ {len(cards)} cards encontrados\n")
 
             logger.info("3️⃣ EXTRAIR: Extraindo dados dos cards...")
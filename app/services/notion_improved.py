@@ -6,6 +6,9 @@ import time
 from typing import Optional, Dict, Any, List
 from playwright.sync_api import Page
 from app.core.browser import PlaywrightBrowserManager
+from app.core.rate_limit import rate_limited_goto
+from app.core.config import settings
+from app.core.request_policy import notion_routing_policy
 
 logger = logging.getLogger(__name__)
 
@@ -33,7 +36,8 @@ class NotionNichosServiceImproved:
             logger.info("Lançando navegador Playwright para Notion...")
             self.browser_manager = PlaywrightBrowserManager(
                 headless=True,
-                browser_type="chromium"
+                browser_type="chromium",
+                routing_policy=notion_routing_policy if settings.REQUEST_BLOCKING_ENABLED else None
             )
             self.page = self.browser_manager.launch()
             logger.info("✅ Navegador Playwright criado")
@@ -78,7 +82,7 @@ class NotionNichosServiceImproved:
 
             # 1. Acessar página
             logger.info(f"Acessando página Notion: {notion_url}")
-            page.goto(notion_url, timeout=120000)
+            rate_limited_goto(page, notion_url, timeout=120000)
             logger.info("✅ Página acessada")
 
             # 2. Aguardar carregamento
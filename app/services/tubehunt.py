@@ -1,14 +1,75 @@
 """Serviço de automação de login e scrape no TubeHunt usando Playwright"""
 import logging
 import time
-from typing import Optional, Dict, Any
-from playwright.sync_api import Page
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional, Dict, Any
+from playwright.sync_api import Page, Response
 from app.core.browser import PlaywrightBrowserManager
 from app.core.config import settings
+from app.core.auth_state import auth_state_cache
+from app.core.extraction import extract_page
+from app.core.login_coordinator import login_coordinator
+from app.core.rate_limit import rate_limited_goto
+from app.core.request_policy import tubehunt_routing_policy
 from app.schemas.tubehunt import ChannelDetailedData
+from app.services.tubehunt_extract import (
+    DETAIL_KEYWORDS_XPATH,
+    DETAIL_NICHES_XPATH,
+    DETAIL_READY_SELECTOR,
+    DETAIL_REVENUE_XPATH,
+    DETAIL_SPEC,
+    DETAIL_SUBJECTS_XPATH,
+    DETAIL_VIEWS_XPATH,
+    iter_listing,
+)
+from app.services.tubehunt_parser import parser_pool, save_snapshot
 
 logger = logging.getLogger(__name__)
 
+# Mensagem de erro exibida no formulário de login (credenciais inválidas, bloqueio...)
+LOGIN_ERROR_SELECTOR = ".alert-danger, .invalid-feedback, .text-danger, [role='alert']"
+# Tempo máximo (ms) para o site responder ao submit e redirecionar
+LOGIN_RESPONSE_TIMEOUT_MS = 30000
+
+
+class TubeHuntLoginError(Exception):
+    """Login recusado pelo TubeHunt (mensagem de erro no formulário ou resposta de erro)"""
+
+
+def is_login_response(response) -> bool:
+    """Predicado da resposta ao POST do formulário de login (Sync e Async API)"""
+    request = response.request
+    return request.method == "POST" and request.resource_type in ("document", "xhr", "fetch")
+
+
+def make_login_refresher(username: str, password: str, login_url: str) -> Callable[[], Optional[Dict[str, Any]]]:
+    """
+    Criar função de login independente (HTTP ou navegador próprio) para a
+    renovação proativa de sessão do login_coordinator.
+    """
+    def refresh() -> Optional[Dict[str, Any]]:
+        if settings.HTTP_LOGIN_ENABLED:
+            from app.services.tubehunt_http import http_login_storage_state
+            try:
+                storage_state = http_login_storage_state(username, password, login_url)
+                if storage_state:
+                    return storage_state
+            except TubeHuntLoginError:
+                raise
+            except Exception as e:
+                logger.warning(f"⚠️ Login HTTP falhou na renovação, usando navegador: {str(e)}")
+
+        service = TubeHuntService()
+        service.username = username
+        service.password = password
+        service.login_url = login_url
+        try:
+            return service._login_with_form()
+        finally:
+            service.close()
+
+    return refresh
+
 
 class TubeHuntService:
     """Serviço para automatizar login e extração de dados do TubeHunt com Playwright"""
@@ -21,6 +82,10 @@ class TubeHuntService:
         self.timeout = settings.SELENIUM_TIMEOUT
         self.browser_manager: Optional[PlaywrightBrowserManager] = None
         self.page: Optional[Page] = None
+        # True depois de authenticate() bem-sucedido no contexto atual
+        self.authenticated = False
+        # Duração (s) de cada fase da última autenticação
+        self.login_timings: Dict[str, float] = {}
 
     def __enter__(self):
         """Context manager entry"""
@@ -37,7 +102,8 @@ class TubeHuntService:
             logger.info("Lançando navegador Playwright...")
             self.browser_manager = PlaywrightBrowserManager(
                 headless=settings.SELENIUM_HEADLESS,
-                browser_type="chromium"
+                browser_type="chromium",
+                routing_policy=tubehunt_routing_policy if settings.REQUEST_BLOCKING_ENABLED else None
             )
             self.page = self.browser_manager.launch()
             logger.info("✅ Navegador Playwright criado")
@@ -65,18 +131,42 @@ class TubeHuntService:
             finally:
                 self.browser_manager = None
                 self.page = None
+                self.authenticated = False
+
+    def _maybe_recycle(self, page: Page) -> Page:
+        """
+        Aplicar a política de reciclagem do browser manager à página do serviço
+
+        Páginas externas (não criadas por este serviço) são devolvidas intactas;
+        uma página já reciclada (fechada) é substituída pela atual.
+        """
+        if self.browser_manager is None:
+            return page
+        if page is not self.page and not page.is_closed():
+            return page
+
+        self.page = self.browser_manager.maybe_recycle()
+        return self.page
+
+    @contextmanager
+    def _phase(self, name: str):
+        """Registrar a duração de uma fase da autenticação em login_timings"""
+        started = time.time()
+        try:
+            yield
+        finally:
+            self.login_timings[name] = round(time.time() - started, 3)
 
     def _access_login_page(self):
         """1. Acessar página de login"""
         logger.info(f"Acessando página de login: {self.login_url}")
         page = self.get_page()
-        page.goto(self.login_url, timeout=120000)
+        rate_limited_goto(page, self.login_url, timeout=120000, wait_until="domcontentloaded")
         # Esperar formulário de login carregar
         try:
-            page.wait_for_selector("input[type='email']", timeout=30000)
-        except:
+            page.wait_for_selector("input[type='email']", state="visible", timeout=30000)
+        except Exception:
             logger.warning("⚠️ Formulário não carregou no tempo esperado, continuando...")
-        time.sleep(3)
         logger.info("✅ Página de login carregada")
 
     def _find_email_field(self) -> Any:
@@ -128,18 +218,14 @@ class TubeHuntService:
     def _fill_credentials(self):
         """4. Preencher email e password"""
         logger.info("Preenchendo credenciais...")
-        page = self.get_page()
 
-        # Preencher email
+        # fill() já aguarda o campo ficar visível e editável
         email_field = self._find_email_field()
         email_field.fill(self.username)
-        time.sleep(2)
         logger.info(f"✅ Email preenchido: {self.username}")
 
-        # Preencher password
         password_field = self._find_password_field()
         password_field.fill(self.password)
-        time.sleep(2)
         logger.info("✅ Password preenchido")
 
     def _find_submit_button(self) -> Any:
@@ -166,8 +252,13 @@ class TubeHuntService:
         logger.error("❌ Botão de submit não encontrado")
         raise Exception("Botão de submit não encontrado")
 
-    def _submit_form(self):
-        """6. Submeter formulário"""
+    def _submit_form(self) -> Optional[Response]:
+        """
+        6. Submeter formulário
+
+        Returns:
+            Resposta ao POST do login (None se o site não fez POST no tempo esperado)
+        """
         logger.info("Submetendo formulário...")
         page = self.get_page()
         submit_button = self._find_submit_button()
@@ -175,56 +266,223 @@ class TubeHuntService:
         # Esperar botão estar visível e interativo antes de clicar
         try:
             page.wait_for_selector("button[type='submit']:enabled", timeout=10000)
-        except:
+        except Exception:
             logger.warning("⚠️ Botão não ficou habilitado, tentando mesmo assim...")
 
-        # Clicar no botão SEM aguardar navegação
-        # Usar no_wait_after=True para não aguardar a navegação que pode levar muito tempo
+        # Clicar sem aguardar navegação; o que interessa é a resposta do POST
         logger.info("Clicando no botão de login...")
-        submit_button.click(no_wait_after=True)
-        logger.info("✅ Formulário submetido (aguardando redirecionamento...)")
-
-        # Aguardar um pouco para navegação ser iniciada
-        time.sleep(3)
+        try:
+            with page.expect_response(is_login_response, timeout=LOGIN_RESPONSE_TIMEOUT_MS) as response_info:
+                submit_button.click(no_wait_after=True)
+            response = response_info.value
+            logger.info(f"✅ Formulário submetido (HTTP {response.status})")
+            return response
+        except Exception as e:
+            logger.warning(f"⚠️ Resposta do login não observada: {str(e)}")
+            return None
 
-    def _wait_for_redirect(self):
-        """7. Aguardar redirecionamento - verificar se login foi bem-sucedido"""
-        logger.info(f"Aguardando redirecionamento do login...")
+    def _login_error_message(self) -> Optional[str]:
+        """Texto da mensagem de erro visível no formulário de login (None se não houver)"""
         page = self.get_page()
+        for element in page.query_selector_all(LOGIN_ERROR_SELECTOR):
+            try:
+                if element.is_visible():
+                    text = (element.text_content() or "").strip()
+                    if text:
+                        return text
+            except Exception:
+                continue
+        return None
+
+    def _wait_for_redirect(self, response: Optional[Response] = None) -> str:
+        """
+        7. Aguardar o resultado do login
 
-        # Aguardar a página mudar de URL (sinal de que login foi processado)
-        max_wait = 30  # segundos (reducido pois o click já esperou)
-        start_time = time.time()
-        login_url_initial = page.url
+        Após a resposta do POST: se a URL já saiu do login, terminou; se o
+        formulário exibe erro, falha na hora; senão aguarda a mudança de URL
+        (redirecionamento feito pelo JavaScript da página).
 
-        while time.time() - start_time < max_wait:
-            current_url = page.url
-            logger.info(f"URL atual: {current_url}")
+        Raises:
+            TubeHuntLoginError: Se o site recusou as credenciais
+        """
+        logger.info("Aguardando redirecionamento do login...")
+        page = self.get_page()
 
-            # Se saiu da página de login E não tem erro, login foi bem-sucedido
-            if "login" not in current_url.lower() and "error" not in current_url.lower():
-                logger.info(f"✅ Login realizado com sucesso! Redirecionado para: {current_url}")
-                time.sleep(2)
-                return current_url
+        if response is not None:
+            try:
+                page.wait_for_load_state("domcontentloaded", timeout=LOGIN_RESPONSE_TIMEOUT_MS)
+            except Exception:
+                pass
 
-            # Se tem erro na URL, login falhou
-            if "error" in current_url.lower():
-                logger.error(f"❌ Erro detectado na URL: {current_url}")
-                return current_url
+            if not self._is_logged_in_url(page.url):
+                error_message = self._login_error_message()
+                if error_message or response.status in (401, 403, 422, 429):
+                    message = error_message or f"HTTP {response.status}"
+                    logger.error(f"❌ Login recusado: {message}")
+                    raise TubeHuntLoginError(f"Login recusado pelo TubeHunt: {message}")
 
-            time.sleep(1)
+        try:
+            page.wait_for_url(
+                lambda url: self._is_logged_in_url(url) or "error" in url.lower(),
+                timeout=LOGIN_RESPONSE_TIMEOUT_MS,
+                wait_until="commit",
+            )
+        except Exception:
+            error_message = self._login_error_message()
+            if error_message:
+                logger.error(f"❌ Login recusado: {error_message}")
+                raise TubeHuntLoginError(f"Login recusado pelo TubeHunt: {error_message}")
+            logger.warning(f"⚠️ URL não mudou após {LOGIN_RESPONSE_TIMEOUT_MS // 1000}s")
 
-        # Se chegou aqui e ainda está em login, tenta aguardar page load mesmo assim
         current_url = page.url
-        logger.warning(f"⚠️ URL não mudou após 30s. Tentando esperar page load...")
+        if self._is_logged_in_url(current_url):
+            logger.info(f"✅ Login realizado com sucesso! Redirecionado para: {current_url}")
+        elif "error" in current_url.lower():
+            logger.error(f"❌ Erro detectado na URL: {current_url}")
+
+        return current_url
+
+    def _is_logged_in_url(self, url: str) -> bool:
+        """Verificar se a URL indica sessão autenticada (fora da página de login)"""
+        return "login" not in url.lower() and "error" not in url.lower()
 
+    def _probe_session(self) -> bool:
+        """
+        Verificar de forma barata se a sessão atual está autenticada
+
+        Acessa uma página protegida e confere se o site não redirecionou para o login.
+        """
+        page = self.get_page()
         try:
-            page.wait_for_load_state("domcontentloaded", timeout=10000)
-            logger.info("✅ DOM carregou mesmo com URL em /login")
+            rate_limited_goto(page, settings.url_auth_probe, timeout=30000, wait_until="domcontentloaded")
         except Exception as e:
-            logger.warning(f"⚠️ Timeout no wait_for_load_state: {e}")
+            logger.warning(f"⚠️ Falha ao verificar sessão: {str(e)}")
+            return False
 
-        return current_url
+        if not self._is_logged_in_url(page.url):
+            return False
+
+        return page.query_selector("input[type='password']") is None
+
+    def _login_with_form(self) -> Optional[Dict[str, Any]]:
+        """
+        Executar o login completo no formulário com a página deste serviço
+
+        Returns:
+            storage_state da sessão autenticada ou None se o login não autenticou
+        """
+        self.get_page()
+        with self._phase("access_login_page"):
+            self._access_login_page()
+        with self._phase("fill_credentials"):
+            self._fill_credentials()
+        with self._phase("submit"):
+            response = self._submit_form()
+        with self._phase("redirect"):
+            self._wait_for_redirect(response)
+
+        if not self._is_logged_in_url(self.page.url):
+            return None
+        return self.browser_manager.export_storage_state()
+
+    def _login_over_http(self) -> Optional[Dict[str, Any]]:
+        """
+        Login por HTTP (httpx, sem navegador) e contexto recriado com os cookies obtidos
+
+        Se o login HTTP não autenticar (ou os cookies não bastarem para o
+        navegador), cai para o login completo no formulário.
+
+        Returns:
+            storage_state da sessão autenticada ou None se o login não autenticou
+        """
+        from app.services.tubehunt_http import http_login_storage_state
+
+        storage_state = None
+        with self._phase("http_login"):
+            try:
+                storage_state = http_login_storage_state(self.username, self.password, self.login_url)
+            except TubeHuntLoginError:
+                raise
+            except Exception as e:
+                logger.warning(f"⚠️ Login HTTP falhou: {str(e)}")
+
+        if storage_state:
+            with self._phase("http_session_probe"):
+                self.page = self.browser_manager.reset_context(storage_state=storage_state)
+                session_valid = self._probe_session()
+            if session_valid:
+                logger.info("✅ Sessão HTTP aceita pelo navegador, formulário pulado")
+                return storage_state
+            self.page = self.browser_manager.reset_context()
+
+        logger.warning("⚠️ Login HTTP não autenticou, usando formulário no navegador")
+        return self._login_with_form()
+
+    def authenticate(self, force: bool = False) -> str:
+        """
+        Garantir que a página atual está autenticada no TubeHunt
+
+        Reutiliza o storage_state em cache da mesma conta quando válido (após
+        uma verificação rápida da sessão); caso contrário faz login via
+        login_coordinator: se outro job da mesma conta já está logando, aguarda
+        e reutiliza o storage_state dele em vez de logar de novo.
+
+        Idempotente: se este serviço já autenticou, retorna sem navegar
+        (a reciclagem de contexto preserva o storage_state).
+
+        Args:
+            force: Se True, refaz a autenticação mesmo já autenticado
+
+        Returns:
+            URL atual após a autenticação
+        """
+        # Todo uso conta para a renovação proativa, inclusive sessão em cache
+        login_coordinator.touch(
+            self.username, self.login_url, make_login_refresher(self.username, self.password, self.login_url)
+        )
+        if self.authenticated and self.page is not None and not force:
+            return self.page.url
+
+        self.get_page()
+        self.login_timings = {}
+        started = time.time()
+
+        try:
+            if settings.AUTH_STATE_CACHE_ENABLED and not force:
+                storage_state = auth_state_cache.load(self.username, self.login_url)
+                if storage_state:
+                    logger.info("Reutilizando sessão autenticada em cache...")
+                    with self._phase("cached_session_probe"):
+                        self.page = self.browser_manager.reset_context(storage_state=storage_state)
+                        session_valid = self._probe_session()
+                    if session_valid:
+                        logger.info(f"✅ Sessão em cache válida, login pulado: {self.page.url}")
+                        self.authenticated = True
+                        return self.page.url
+
+                    logger.warning("⚠️ Sessão em cache rejeitada, fazendo login completo")
+                    login_coordinator.report_rejected(self.username, self.login_url, storage_state)
+                    self.page = self.browser_manager.reset_context()
+
+            login_started = time.time()
+            storage_state, performed = login_coordinator.login(
+                self.username,
+                self.login_url,
+                self._login_over_http if settings.HTTP_LOGIN_ENABLED else self._login_with_form,
+                refresh_fn=make_login_refresher(self.username, self.password, self.login_url),
+            )
+
+            if not performed:
+                # Outro job logou esta conta: iniciar contexto já autenticado
+                self.login_timings["shared_login_wait"] = round(time.time() - login_started, 3)
+                self.page = self.browser_manager.reset_context(storage_state=storage_state)
+                logger.info("✅ Sessão obtida do login de outro job da mesma conta")
+        finally:
+            self.login_timings["total"] = round(time.time() - started, 3)
+            logger.info(f"Tempos de autenticação (s): {self.login_timings}")
+
+        self.authenticated = storage_state is not None
+        return self.page.url
 
     def _extract_element(self, selector: str) -> Optional[str]:
         """8. Extrair elemento selecionado"""
@@ -272,23 +530,43 @@ class TubeHuntService:
             Dicionário com informações da página de vídeos
         """
         try:
-            # Garantir que a página foi criada
-            self.get_page()
+            # 1. Fazer login (reutiliza sessão em cache quando válida)
+            self.authenticate()
+        except Exception as e:
+            logger.error(f"❌ Erro no login: {str(e)}", exc_info=True)
+            return {
+                "success": False,
+                "url": None,
+                "title": None,
+                "video_elements_count": 0,
+                "links_count": 0,
+                "images_count": 0,
+                "buttons_count": 0,
+                "error": str(e),
+            }
 
-            # 1. Fazer login
-            self._access_login_page()
-            self._fill_credentials()
-            self._submit_form()
-            self._wait_for_redirect()
+        return self.inspect_videos_page(self.get_page(), wait_time=wait_time)
+
+    def inspect_videos_page(self, page: Page, wait_time: int = 15) -> Dict[str, Any]:
+        """
+        Navegar até a página de vídeos e contar seus elementos
+
+        Não faz login: a página já deve estar autenticada (ver authenticate()).
 
+        Args:
+            page: Playwright Page object (deve estar logado)
+            wait_time: Tempo de espera para carregamento
+
+        Returns:
+            Dicionário com informações da página de vídeos
+        """
+        try:
             # 2. Navegar para página de vídeos
-            videos_url = "https://app.tubehunt.io/long/?page=1&OrderBy=DateDESC&ChangePerPage=50"
+            videos_url = settings.url_scrape_channels
             logger.info(f"Navegando para página de vídeos: {videos_url}")
 
-            page = self.get_page()
-
             try:
-                page.goto(videos_url, timeout=120000)
+                rate_limited_goto(page, videos_url, timeout=120000)
                 logger.info("✅ Página de vídeos acessada")
             except Exception as e:
                 logger.warning(f"⚠️ Timeout ao acessar página, continuando: {e}")
@@ -342,139 +620,9 @@ class TubeHuntService:
                 "error": str(e),
             }
 
-    def _extract_channel_data(self, channel_card) -> Dict[str, Any]:
-        """Extrair dados de um card de canal individual"""
-        try:
-            page = self.get_page()
-
-            # Informações básicas
-            channel_name_elem = channel_card.query_selector("a.fw-semibold.fs-4")
-            channel_name = channel_name_elem.text_content() if channel_name_elem else "N/A"
-            channel_link = channel_name_elem.get_attribute("href") if channel_name_elem else "N/A"
-
-            # Handle (@) do canal
-            channel_handle_elem = channel_card.query_selector(".small .fw-bold")
-            channel_handle = channel_handle_elem.text_content() if channel_handle_elem else "N/A"
-
-            # País
-            country_elem = channel_card.query_selector(".country")
-            country = country_elem.text_content().strip() if country_elem else "N/A"
-
-            # Inscritos
-            subscribers_elem = channel_card.query_selector(".small.text-secondary")
-            subscribers_text = subscribers_elem.text_content() if subscribers_elem else ""
-            subscribers = (
-                subscribers_text.split("•")[1].strip().replace("inscritos", "").strip()
-                if "•" in subscribers_text
-                else "N/A"
-            )
-
-            # Verificado (presença do ícone)
-            is_verified = bool(channel_card.query_selector("i.bi-patch-check-fill"))
-
-            # Monetizado (presença do ícone)
-            is_monetized = bool(channel_card.query_selector("i.bi-currency-dollar"))
-
-            # Categorias
-            categories = []
-            categories_elem = channel_card.query_selector("span.badge.mt-2.badge-soft.rounded-pill")
-            if categories_elem:
-                categories_text = categories_elem.text_content().strip()
-                # Split por vírgula e limpa cada categoria
-                categories = [cat.strip() for cat in categories_text.split(",")]
-
-            # Extrair stats cards
-            stat_cards = channel_card.query_selector_all(".stat-card")
-            stats = {}
-            stat_labels = [
-                "total_views",
-                "views_last_60_days",
-                "average_views_per_video",
-                "time_since_first_video",
-                "total_videos",
-                "outlier_score"
-            ]
-
-            for idx, label in enumerate(stat_labels):
-                try:
-                    if idx < len(stat_cards):
-                        stat_value_elem = stat_cards[idx].query_selector(".fs-4.fw-semibold")
-                        stat_value = stat_value_elem.text_content() if stat_value_elem else "N/A"
-                        stats[label] = stat_value
-                    else:
-                        stats[label] = "N/A"
-                except Exception:
-                    stats[label] = "N/A"
-
-            # Extrair vídeos
-            recent_videos = []
-            video_elements = channel_card.query_selector_all(".entry-video")
-
-            for video_elem in video_elements:
-                try:
-                    video_link_elem = video_elem.query_selector("a")
-                    video_link = video_link_elem.get_attribute("href") if video_link_elem else "N/A"
-
-                    thumbnail_elem = video_elem.query_selector(".video-thumb")
-                    thumbnail_url = thumbnail_elem.get_attribute("src") if thumbnail_elem else "N/A"
-
-                    # Duração
-                    duration = "N/A"
-                    duration_elem = video_elem.query_selector(".duration")
-                    if duration_elem:
-                        duration = duration_elem.text_content()
-
-                    # Título
-                    title_elem = video_elem.query_selector(".mt-2.mb-2.text-dark.fw-semibold.small")
-                    title = title_elem.text_content() if title_elem else "N/A"
-
-                    # Stats do vídeo
-                    stats_elem = video_elem.query_selector(".small.text-secondary")
-                    stats_text = stats_elem.text_content() if stats_elem else ""
-                    parts = [p.strip() for p in stats_text.split("•")]
-
-                    views = parts[0].replace("views", "").strip() if len(parts) > 0 else "N/A"
-                    comments = parts[1].replace("comentários", "").strip() if len(parts) > 1 else "N/A"
-                    uploaded_time = parts[2] if len(parts) > 2 else "N/A"
-
-                    recent_videos.append({
-                        "title": title,
-                        "video_link": video_link,
-                        "thumbnail_url": thumbnail_url,
-                        "duration": duration,
-                        "views": views,
-                        "comments": comments,
-                        "uploaded_time": uploaded_time
-                    })
-                except Exception as e:
-                    logger.warning(f"Erro ao extrair vídeo: {e}")
-                    continue
-
-            return {
-                "channel_name": channel_name,
-                "channel_link": channel_link,
-                "channel_handle": channel_handle,
-                "country": country,
-                "subscribers": subscribers,
-                "is_verified": is_verified,
-                "is_monetized": is_monetized,
-                "categories": categories,
-                "total_views": stats.get("total_views", "N/A"),
-                "views_last_60_days": stats.get("views_last_60_days", "N/A"),
-                "average_views_per_video": stats.get("average_views_per_video", "N/A"),
-                "time_since_first_video": stats.get("time_since_first_video", "N/A"),
-                "total_videos": stats.get("total_videos", "N/A"),
-                "outlier_score": stats.get("outlier_score", "N/A"),
-                "recent_videos": recent_videos[:6]
-            }
-
-        except Exception as e:
-            logger.error(f"❌ Erro ao extrair dados do canal: {str(e)}")
-            raise
-
     def scrape_channels(self, wait_time: int = 15, scrape_url: Optional[str] = None) -> Dict[str, Any]:
         """
-        Fazer login, navegar para página de canais e extrair dados detalhados
+        Fazer login (se ainda não autenticado) e extrair os canais da listagem
 
         Args:
             wait_time: Tempo de espera para carregamento
@@ -484,76 +632,90 @@ class TubeHuntService:
             Dicionário com lista de canais e informações
         """
         try:
-            # Garantir que a página foi criada
-            self.get_page()
+            self.authenticate()
+        except Exception as e:
+            logger.error(f"❌ Erro no login: {str(e)}", exc_info=True)
+            return {
+                "success": False,
+                "channels": [],
+                "total_channels": 0,
+                "url": None,
+                "error": str(e),
+            }
 
-            # 1. Fazer login
-            self._access_login_page()
-            self._fill_credentials()
-            self._submit_form()
-            self._wait_for_redirect()
+        return self.extract_channels(self.get_page(), wait_time=wait_time, scrape_url=scrape_url)
 
-            # 2. Aguardar carregamento completo da página principal
-            logger.info("Aguardando carregamento completo da página principal...")
-            page = self.get_page()
+    def _open_listing(self, page: Page, wait_time: int = 15, scrape_url: Optional[str] = None):
+        """Navegar para a página de canais e aguardar os cards (sem login)"""
+        # 1. Navegar para página de canais
+        # Usar URL customizada se fornecida, caso contrário usar padrão
+        if not scrape_url:
+            scrape_url = settings.url_scrape_channels
+        logger.info(f"Navegando para página de canais: {scrape_url}")
 
-            try:
-                page.wait_for_selector(".container, main, .page", timeout=wait_time * 1000)
-                logger.info("✅ Página principal carregada")
-            except Exception:
-                logger.warning("⚠️ Timeout aguardando página principal, continuando...")
+        try:
+            rate_limited_goto(page, scrape_url, timeout=120000)
+            logger.info("✅ Página de canais acessada")
+        except Exception as e:
+            logger.warning(f"⚠️ Timeout ao acessar página, continuando: {e}")
+            time.sleep(5)
 
-            time.sleep(2)
+        # 2. Aguardar carregamento da página de canais
+        logger.info("Aguardando carregamento da página de canais...")
 
-            # 3. Navegar para página de canais
-            # Usar URL customizada se fornecida, caso contrário usar padrão
-            if not scrape_url:
-                scrape_url = "https://app.tubehunt.io/long/?page=1&OrderBy=DateDESC&ChangePerPage=50"
-            logger.info(f"Navegando para página de canais: {scrape_url}")
+        try:
+            page.wait_for_selector(".channel-card", timeout=wait_time * 1000)
+            logger.info("✅ Elementos de canal carregados no DOM")
+        except Exception as e:
+            logger.warning(f"⚠️ Timeout aguardando .channel-card: {str(e)}")
 
-            try:
-                page.goto(scrape_url, timeout=120000)
-                logger.info("✅ Página de canais acessada")
-            except Exception as e:
-                logger.warning(f"⚠️ Timeout ao acessar página, continuando: {e}")
-                time.sleep(5)
+        # Aguardar um pouco mais para elementos ficarem visíveis
+        time.sleep(3)
 
-            # 4. Aguardar carregamento da página de canais
-            logger.info("Aguardando carregamento da página de canais...")
+    def iter_channels(self, page: Page, wait_time: int = 15, scrape_url: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Navegar para a página de canais e gerar cada canal assim que é extraído
 
-            channels_loaded = False
-            try:
-                page.wait_for_selector(".channel-card", timeout=wait_time * 1000)
-                logger.info("✅ Elementos de canal carregados no DOM")
-                channels_loaded = True
-            except Exception as e:
-                logger.warning(f"⚠️ Timeout aguardando .channel-card: {str(e)}")
-
-            # Aguardar um pouco mais para elementos ficarem visíveis
-            time.sleep(3)
-
-            # 5. Extrair dados de todos os canais
-            logger.info("Extraindo dados dos canais...")
-            channels = []
-            channel_cards = page.query_selector_all(".channel-card")
-
-            logger.info(f"Encontrados {len(channel_cards)} canais para extrair")
-
-            if len(channel_cards) == 0:
-                logger.warning("⚠️ Nenhum elemento .channel-card encontrado!")
-                logger.info("Tentando seladores alternativos...")
-                # Tentar outros seletores
-                channel_cards = page.query_selector_all("[data-testid*='channel'], .card, [class*='channel']")
-                logger.info(f"Encontrados {len(channel_cards)} elementos com seletores alternativos")
-
-            for idx, channel_card in enumerate(channel_cards):
-                try:
-                    channel_data = self._extract_channel_data(channel_card)
-                    channels.append(channel_data)
-                    logger.info(f"✅ Canal {idx + 1}/{len(channel_cards)} extraído: {channel_data['channel_name']}")
-                except Exception as e:
-                    logger.error(f"❌ Erro ao processar canal {idx + 1}: {str(e)}")
-                    continue
+        Não faz login: a página já deve estar autenticada (ver authenticate()).
+        Erros de navegação/extração são propagados para o consumidor.
+
+        Args:
+            page: Playwright Page object (deve estar logado)
+            wait_time: Tempo de espera para carregamento
+            scrape_url: URL customizada para scraping (opcional, usa padrão se não fornecida)
+
+        Yields:
+            Canal no schema da listagem
+        """
+        self._open_listing(page, wait_time, scrape_url)
+
+        # 3. Extrair os canais (lotes de cards por evaluate, ou HTML no parser offline)
+        logger.info("Extraindo dados dos canais...")
+        if settings.EXTRACTION_MODE == "offline":
+            page_html = page.content()
+            save_snapshot("listing", page.url, page_html)
+            yield from parser_pool.parse_listing(page_html)
+        else:
+            yield from iter_listing(page)
+
+    def extract_channels(self, page: Page, wait_time: int = 15, scrape_url: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Navegar para a página de canais e extrair dados de todos os cards
+
+        Não faz login: a página já deve estar autenticada (ver authenticate()).
+
+        Args:
+            page: Playwright Page object (deve estar logado)
+            wait_time: Tempo de espera para carregamento
+            scrape_url: URL customizada para scraping (opcional, usa padrão se não fornecida)
+
+        Returns:
+            Dicionário com lista de canais e informações
+        """
+        try:
+            started = time.time()
+            channels = list(self.iter_channels(page, wait_time=wait_time, scrape_url=scrape_url))
+            logger.info(f"Extração da listagem em {time.time() - started:.2f}s")
 
             logger.info(f"✅ {len(channels)} canais extraídos com sucesso")
 
@@ -575,6 +737,36 @@ class TubeHuntService:
                 "error": str(e),
             }
 
+    def _scrape_channel_details_fast(self, page: Page, channel_link: str) -> Optional[ChannelDetailedData]:
+        """
+        Modo rápido: domcontentloaded, espera apenas a seção do canal e extrai tudo em um evaluate
+
+        Returns:
+            ChannelDetailedData, ou None se a seção não apareceu ou veio vazia
+            (o chamador usa o caminho lento)
+        """
+        started = time.time()
+        try:
+            rate_limited_goto(page, channel_link, timeout=120000, wait_until="domcontentloaded")
+            page.wait_for_selector(DETAIL_READY_SELECTOR, timeout=settings.DETAIL_FAST_TIMEOUT_SECONDS * 1000)
+
+            if settings.EXTRACTION_MODE == "offline":
+                page_html = page.content()
+                save_snapshot("channel", channel_link, page_html)
+                data = parser_pool.parse_channel_details(page_html)
+            else:
+                data = extract_page(DETAIL_SPEC, page)
+        except Exception as e:
+            logger.warning(f"⚠️ Modo rápido falhou para {channel_link}, usando caminho lento: {str(e)}")
+            return None
+
+        if not (data["keywords"] or data["subjects"] or data["niches"]):
+            logger.warning(f"⚠️ Modo rápido sem dados para {channel_link}, usando caminho lento")
+            return None
+
+        logger.info(f"✅ Canal extraído (modo rápido) em {time.time() - started:.1f}s: {channel_link}")
+        return ChannelDetailedData(channel_link=channel_link, **data)
+
     def scrape_channel_details(self, page: Page, channel_link: str) -> Optional[ChannelDetailedData]:
         """
         Extrair dados detalhados de um canal individual usando XPath selectors
@@ -587,12 +779,20 @@ class TubeHuntService:
             ChannelDetailedData schema com dados extraídos, ou None em caso de erro
         """
         try:
+            # Batches longos: reciclar página/contexto/navegador se passou dos limites
+            page = self._maybe_recycle(page)
+
+            if settings.DETAIL_FAST_MODE:
+                channel_data = self._scrape_channel_details_fast(page, channel_link)
+                if channel_data is not None:
+                    return channel_data
+
             logger.info(f"Acessando canal: {channel_link}")
             logger.info(f"Page object válido: {page is not None}")
             logger.info(f"Page URL antes de goto: {page.url if page else 'N/A'}")
 
             try:
-                page.goto(channel_link, timeout=120000, wait_until="networkidle")
+                rate_limited_goto(page, channel_link, timeout=120000, wait_until="networkidle")
                 logger.info("✅ Canal carregado com sucesso")
                 logger.info(f"Page URL após goto: {page.url}")
             except Exception as e:
@@ -616,15 +816,22 @@ class TubeHuntService:
 
             time.sleep(3)  # Aumentado para 3 segundos para melhor carregamento
 
-            # Restrição: Pegar apenas a seção inicial de dados do canal (não os vídeos)
-            # A seção de canal está em: //div[@class='d-flex flex-wrap gap-1 mt-2 small']
-            channel_data_section_xpath = "//div[@class='d-flex flex-wrap gap-1 mt-2 small']"
+            # Modo offline: uma única cópia do HTML, parseada no pool de processos
+            if settings.EXTRACTION_MODE == "offline":
+                page_html = page.content()
+                save_snapshot("channel", channel_link, page_html)
+                channel_data = ChannelDetailedData(
+                    channel_link=channel_link,
+                    **parser_pool.parse_channel_details(page_html),
+                )
+                logger.info(f"✅ Dados do canal extraídos (offline): {channel_link}")
+                return channel_data
 
             # 1. Extrair Keywords do canal (apenas da seção de dados do canal, não dos vídeos)
             logger.info("Extraindo keywords do canal...")
             keywords = []
             try:
-                keyword_xpath = f"{channel_data_section_xpath}//p[contains(., 'Keywords do canal')]/following-sibling::span[@class='badge badge-soft rounded-pill']"
+                keyword_xpath = DETAIL_KEYWORDS_XPATH
                 logger.info(f"Usando XPath para keywords: {keyword_xpath}")
                 keyword_elements = page.query_selector_all(keyword_xpath)
                 logger.info(f"Elementos keywords encontrados: {len(keyword_elements)}")
@@ -640,7 +847,7 @@ class TubeHuntService:
             logger.info("Extraindo assuntos do canal...")
             subjects = []
             try:
-                subject_xpath = f"{channel_data_section_xpath}//p[contains(., 'Assuntos')]/following-sibling::span[@class='badge badge-soft rounded-pill']"
+                subject_xpath = DETAIL_SUBJECTS_XPATH
                 logger.info(f"Usando XPath para subjects: {subject_xpath}")
                 subject_elements = page.query_selector_all(subject_xpath)
                 logger.info(f"Elementos subjects encontrados: {len(subject_elements)}")
@@ -656,7 +863,7 @@ class TubeHuntService:
             logger.info("Extraindo nichos do canal...")
             niches = []
             try:
-                niche_xpath = f"{channel_data_section_xpath}//p[contains(., 'Nicho')]/following-sibling::span[@class='badge badge-soft rounded-pill']//a"
+                niche_xpath = DETAIL_NICHES_XPATH
                 logger.info(f"Usando XPath para niches: {niche_xpath}")
                 niche_elements = page.query_selector_all(niche_xpath)
                 logger.info(f"Elementos niches encontrados: {len(niche_elements)}")
@@ -672,13 +879,7 @@ class TubeHuntService:
             logger.info("Extraindo views (30 dias)...")
             views_30_days = None
             try:
-                # XPath corrigido para match exato com a estrutura HTML
-                # <div class="metric text-center">
-                #   <div class="label text-dark">Views (30 dias)</div>
-                #   <div class="value">54.91k</div>
-                # </div>
-                views_xpath = "//div[@class='metric text-center']//div[@class='label text-dark' and contains(., 'Views (30 dias)')]/following-sibling::div[@class='value']"
-                views_element = page.query_selector(views_xpath)
+                views_element = page.query_selector(DETAIL_VIEWS_XPATH)
                 if views_element:
                     views_30_days = views_element.inner_text().strip()
                     logger.info(f"✅ Views: {views_30_days}")
@@ -691,13 +892,7 @@ class TubeHuntService:
             logger.info("Extraindo receita (30 dias)...")
             revenue_30_days = None
             try:
-                # XPath corrigido para match exato com a estrutura HTML
-                # <div class="metric text-center">
-                #   <div class="label text-dark">Receita (30 dias)</div>
-                #   <div class="value">$33,00 - $110,00</div>
-                # </div>
-                revenue_xpath = "//div[@class='metric text-center']//div[@class='label text-dark' and contains(., 'Receita (30 dias)')]/following-sibling::div[@class='value']"
-                revenue_element = page.query_selector(revenue_xpath)
+                revenue_element = page.query_selector(DETAIL_REVENUE_XPATH)
                 if revenue_element:
                     revenue_30_days = revenue_element.inner_text().strip()
                     logger.info(f"✅ Receita: {revenue_30_days}")
@@ -738,15 +933,8 @@ class TubeHuntService:
             # Garantir que a página foi criada
             self.get_page()
 
-            # 1. Acessar página de login
-            self._access_login_page()
-
-            # 2-6. Preencher credenciais e submeter
-            self._fill_credentials()
-            self._submit_form()
-
-            # 7. Aguardar redirecionamento
-            current_url = self._wait_for_redirect()
+            # 1-7. Login (ou sessão em cache) e redirecionamento
+            current_url = self.authenticate()
 
             # 8. Extrair elemento
             extracted_text = self._extract_element(extract_selector)
@@ -0,0 +1,534 @@
+"""Serviço TubeHunt sobre a Playwright Async API (roda no loop do AsyncBrowserEngine)"""
+import asyncio
+import logging
+import time
+from contextlib import contextmanager
+from typing import AsyncIterator, Optional, Dict, Any, List
+from playwright.async_api import Page, Response
+from app.core.async_browser import AsyncPlaywrightBrowserManager
+from app.core.auth_state import auth_state_cache
+from app.core.extraction import extract_page_async
+from app.core.login_coordinator import login_coordinator
+from app.core.rate_limit import rate_limited_goto_async
+from app.core.config import settings
+from app.core.request_policy import tubehunt_routing_policy
+from app.schemas.tubehunt import ChannelDetailedData
+from app.services.tubehunt_extract import (
+    DETAIL_KEYWORDS_XPATH,
+    DETAIL_NICHES_XPATH,
+    DETAIL_READY_SELECTOR,
+    DETAIL_REVENUE_XPATH,
+    DETAIL_SPEC,
+    DETAIL_SUBJECTS_XPATH,
+    DETAIL_VIEWS_XPATH,
+    aiter_listing,
+)
+from app.services.tubehunt_parser import parser_pool, save_snapshot
+from app.services.tubehunt import (
+    LOGIN_ERROR_SELECTOR,
+    LOGIN_RESPONSE_TIMEOUT_MS,
+    TubeHuntLoginError,
+    is_login_response,
+    make_login_refresher,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class TubeHuntAsyncService:
+    """Variante async de TubeHuntService: mesmo fluxo de login e extração, sem ocupar uma thread por job"""
+
+    def __init__(self, username: Optional[str] = None, password: Optional[str] = None, login_url: Optional[str] = None):
+        """Inicializar serviço com configurações (fallback .env)"""
+        self.login_url = login_url or settings.url_login
+        self.username = username or settings.user
+        self.password = password or settings.password
+        self.timeout = settings.SELENIUM_TIMEOUT
+        self.browser_manager: Optional[AsyncPlaywrightBrowserManager] = None
+        self.page: Optional[Page] = None
+        # True depois de authenticate() bem-sucedido no contexto atual
+        self.authenticated = False
+        # Duração (s) de cada fase da última autenticação
+        self.login_timings: Dict[str, float] = {}
+
+    async def __aenter__(self):
+        """Context manager entry"""
+        await self._create_driver()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit"""
+        await self.close()
+
+    def _new_browser_manager(self) -> AsyncPlaywrightBrowserManager:
+        """Gerenciador de contexto/página no navegador compartilhado do engine"""
+        return AsyncPlaywrightBrowserManager(
+            routing_policy=tubehunt_routing_policy if settings.REQUEST_BLOCKING_ENABLED else None
+        )
+
+    async def try_reserve_page(self) -> bool:
+        """
+        Reservar a vaga de página no engine sem aguardar; a página criada depois usa essa vaga
+
+        Returns:
+            True se reservou; False se o engine está no limite de páginas
+        """
+        if self.browser_manager is None:
+            self.browser_manager = self._new_browser_manager()
+        return await self.browser_manager.try_reserve_slot()
+
+    async def _create_driver(self, storage_state: Optional[Dict[str, Any]] = None) -> Page:
+        """Criar contexto e página no navegador compartilhado do engine (opcionalmente já com uma sessão)"""
+        try:
+            if self.browser_manager is None:
+                self.browser_manager = self._new_browser_manager()
+            self.page = await self.browser_manager.launch(storage_state)
+            return self.page
+
+        except Exception as e:
+            logger.error(f"❌ Erro ao criar página async: {str(e)}")
+            await self.close()
+            raise
+
+    async def get_page(self) -> Page:
+        """Obter ou criar página Playwright"""
+        if self.page is None:
+            await self._create_driver()
+        return self.page
+
+    async def close(self):
+        """Fechar contexto Playwright"""
+        if self.browser_manager:
+            try:
+                await self.browser_manager.close()
+            except Exception as e:
+                logger.error(f"Erro ao fechar contexto async: {str(e)}")
+            finally:
+                self.browser_manager = None
+                self.page = None
+                self.authenticated = False
+
+    async def _maybe_recycle(self, page: Page) -> Page:
+        """Aplicar a política de reciclagem à página do serviço (páginas externas ficam intactas)"""
+        if self.browser_manager is None:
+            return page
+        if page is not self.page and not page.is_closed():
+            return page
+
+        self.page = await self.browser_manager.maybe_recycle()
+        return self.page
+
+    @contextmanager
+    def _phase(self, name: str):
+        """Registrar a duração de uma fase da autenticação em login_timings"""
+        started = time.time()
+        try:
+            yield
+        finally:
+            self.login_timings[name] = round(time.time() - started, 3)
+
+    async def _access_login_page(self):
+        """1. Acessar página de login"""
+        logger.info(f"[async] Acessando página de login: {self.login_url}")
+        page = await self.get_page()
+        await rate_limited_goto_async(page, self.login_url, timeout=120000, wait_until="domcontentloaded")
+        try:
+            await page.wait_for_selector("input[type='email']", state="visible", timeout=30000)
+        except Exception:
+            logger.warning("⚠️ [async] Formulário não carregou no tempo esperado, continuando...")
+
+    async def _find_first(self, selectors: List[str], label: str):
+        """Localizar o primeiro elemento que casa com uma lista de seletores"""
+        page = await self.get_page()
+        for selector in selectors:
+            try:
+                element = await page.query_selector(selector)
+                if element:
+                    return element
+            except Exception:
+                continue
+        logger.error(f"❌ [async] {label} não encontrado")
+        raise Exception(f"{label} não encontrado")
+
+    async def _fill_credentials(self):
+        """2-4. Preencher email e password"""
+        email_field = await self._find_first(
+            ["#email", "input[name='email']", "input[type='email']"], "Campo de email"
+        )
+        await email_field.fill(self.username)
+
+        password_field = await self._find_first(
+            ["#password", "input[name='password']", "input[type='password']"], "Campo de password"
+        )
+        await password_field.fill(self.password)
+        logger.info("✅ [async] Credenciais preenchidas")
+
+    async def _submit_form(self) -> Optional[Response]:
+        """5-6. Submeter formulário e capturar a resposta ao POST do login"""
+        page = await self.get_page()
+        submit_button = await self._find_first(
+            [
+                "button[type='submit']",
+                "button:has-text('Login')",
+                "button:has-text('login')",
+                "button:has-text('Entrar')",
+            ],
+            "Botão de submit",
+        )
+
+        try:
+            await page.wait_for_selector("button[type='submit']:enabled", timeout=10000)
+        except Exception:
+            logger.warning("⚠️ [async] Botão não ficou habilitado, tentando mesmo assim...")
+
+        try:
+            async with page.expect_response(is_login_response, timeout=LOGIN_RESPONSE_TIMEOUT_MS) as response_info:
+                await submit_button.click(no_wait_after=True)
+            return await response_info.value
+        except Exception as e:
+            logger.warning(f"⚠️ [async] Resposta do login não observada: {str(e)}")
+            return None
+
+    async def _login_error_message(self) -> Optional[str]:
+        """Texto da mensagem de erro visível no formulário de login (None se não houver)"""
+        page = await self.get_page()
+        for element in await page.query_selector_all(LOGIN_ERROR_SELECTOR):
+            try:
+                if await element.is_visible():
+                    text = ((await element.text_content()) or "").strip()
+                    if text:
+                        return text
+            except Exception:
+                continue
+        return None
+
+    async def _wait_for_redirect(self, response: Optional[Response] = None) -> str:
+        """7. Aguardar o resultado do login (mesmas regras da versão sync)"""
+        page = await self.get_page()
+
+        if response is not None:
+            try:
+                await page.wait_for_load_state("domcontentloaded", timeout=LOGIN_RESPONSE_TIMEOUT_MS)
+            except Exception:
+                pass
+
+            if not self._is_logged_in_url(page.url):
+                error_message = await self._login_error_message()
+                if error_message or response.status in (401, 403, 422, 429):
+                    message = error_message or f"HTTP {response.status}"
+                    logger.error(f"❌ [async] Login recusado: {message}")
+                    raise TubeHuntLoginError(f"Login recusado pelo TubeHunt: {message}")
+
+        try:
+            await page.wait_for_url(
+                lambda url: self._is_logged_in_url(url) or "error" in url.lower(),
+                timeout=LOGIN_RESPONSE_TIMEOUT_MS,
+                wait_until="commit",
+            )
+        except Exception:
+            error_message = await self._login_error_message()
+            if error_message:
+                logger.error(f"❌ [async] Login recusado: {error_message}")
+                raise TubeHuntLoginError(f"Login recusado pelo TubeHunt: {error_message}")
+            logger.warning(f"⚠️ [async] URL não mudou após {LOGIN_RESPONSE_TIMEOUT_MS // 1000}s")
+
+        if self._is_logged_in_url(page.url):
+            logger.info(f"✅ [async] Login realizado com sucesso! Redirecionado para: {page.url}")
+        return page.url
+
+    def _is_logged_in_url(self, url: str) -> bool:
+        """Verificar se a URL indica sessão autenticada (fora da página de login)"""
+        return "login" not in url.lower() and "error" not in url.lower()
+
+    async def _probe_session(self) -> bool:
+        """Verificar de forma barata se a sessão atual está autenticada"""
+        page = await self.get_page()
+        try:
+            await rate_limited_goto_async(page, settings.url_auth_probe, timeout=30000, wait_until="domcontentloaded")
+        except Exception as e:
+            logger.warning(f"⚠️ [async] Falha ao verificar sessão: {str(e)}")
+            return False
+
+        if not self._is_logged_in_url(page.url):
+            return False
+
+        return await page.query_selector("input[type='password']") is None
+
+    async def _login_with_form(self) -> Optional[Dict[str, Any]]:
+        """Login completo no formulário; retorna o storage_state ou None se não autenticou"""
+        await self.get_page()
+        with self._phase("access_login_page"):
+            await self._access_login_page()
+        with self._phase("fill_credentials"):
+            await self._fill_credentials()
+        with self._phase("submit"):
+            response = await self._submit_form()
+        with self._phase("redirect"):
+            await self._wait_for_redirect(response)
+
+        if not self._is_logged_in_url(self.page.url):
+            return None
+        return await self.browser_manager.export_storage_state()
+
+    async def _login_over_http(self) -> Optional[Dict[str, Any]]:
+        """Login por HTTP (em thread, httpx é síncrono) com fallback para o formulário"""
+        from app.services.tubehunt_http import http_login_storage_state
+
+        storage_state = None
+        with self._phase("http_login"):
+            try:
+                storage_state = await asyncio.get_running_loop().run_in_executor(
+                    None, http_login_storage_state, self.username, self.password, self.login_url
+                )
+            except TubeHuntLoginError:
+                raise
+            except Exception as e:
+                logger.warning(f"⚠️ [async] Login HTTP falhou: {str(e)}")
+
+        if storage_state:
+            with self._phase("http_session_probe"):
+                self.page = await self.browser_manager.reset_context(storage_state=storage_state)
+                session_valid = await self._probe_session()
+            if session_valid:
+                logger.info("✅ [async] Sessão HTTP aceita pelo navegador, formulário pulado")
+                return storage_state
+            self.page = await self.browser_manager.reset_context()
+
+        logger.warning("⚠️ [async] Login HTTP não autenticou, usando formulário no navegador")
+        return await self._login_with_form()
+
+    async def authenticate(self, force: bool = False) -> str:
+        """
+        Garantir que a página atual está autenticada no TubeHunt
+
+        Mesma estratégia de TubeHuntService.authenticate(): storage_state em
+        cache + verificação rápida, ou login single-flight via
+        login_coordinator. Idempotente.
+
+        Args:
+            force: Se True, refaz a autenticação mesmo já autenticado
+
+        Returns:
+            URL atual após a autenticação
+        """
+        # Todo uso conta para a renovação proativa, inclusive sessão em cache
+        login_coordinator.touch(
+            self.username, self.login_url, make_login_refresher(self.username, self.password, self.login_url)
+        )
+        if self.authenticated and self.page is not None and not force:
+            return self.page.url
+
+        await self.get_page()
+        self.login_timings = {}
+        started = time.time()
+
+        try:
+            if settings.AUTH_STATE_CACHE_ENABLED and not force:
+                storage_state = auth_state_cache.load(self.username, self.login_url)
+                if storage_state:
+                    with self._phase("cached_session_probe"):
+                        self.page = await self.browser_manager.reset_context(storage_state=storage_state)
+                        session_valid = await self._probe_session()
+                    if session_valid:
+                        logger.info(f"✅ [async] Sessão em cache válida, login pulado: {self.page.url}")
+                        self.authenticated = True
+                        return self.page.url
+
+                    logger.warning("⚠️ [async] Sessão em cache rejeitada, fazendo login completo")
+                    login_coordinator.report_rejected(self.username, self.login_url, storage_state)
+                    self.page = await self.browser_manager.reset_context()
+
+            login_started = time.time()
+            storage_state, performed = await login_coordinator.login_async(
+                self.username,
+                self.login_url,
+                self._login_over_http if settings.HTTP_LOGIN_ENABLED else self._login_with_form,
+                refresh_fn=make_login_refresher(self.username, self.password, self.login_url),
+            )
+
+            if not performed:
+                self.login_timings["shared_login_wait"] = round(time.time() - login_started, 3)
+                self.page = await self.browser_manager.reset_context(storage_state=storage_state)
+                logger.info("✅ [async] Sessão obtida do login de outro job da mesma conta")
+        finally:
+            self.login_timings["total"] = round(time.time() - started, 3)
+            logger.info(f"[async] Tempos de autenticação (s): {self.login_timings}")
+
+        self.authenticated = storage_state is not None
+        return self.page.url
+
+    async def scrape_channels(self, wait_time: int = 15, scrape_url: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Fazer login (se ainda não autenticado) e extrair os canais da listagem
+
+        Args:
+            wait_time: Tempo de espera para carregamento
+            scrape_url: URL customizada para scraping (opcional, usa padrão se não fornecida)
+
+        Returns:
+            Dicionário com lista de canais e informações (mesmo formato da versão sync)
+        """
+        try:
+            await self.authenticate()
+        except Exception as e:
+            logger.error(f"❌ [async] Erro no login: {str(e)}", exc_info=True)
+            return {
+                "success": False,
+                "channels": [],
+                "total_channels": 0,
+                "url": None,
+                "error": str(e),
+            }
+
+        return await self.extract_channels(await self.get_page(), wait_time=wait_time, scrape_url=scrape_url)
+
+    async def _open_listing(self, page: Page, wait_time: int = 15, scrape_url: Optional[str] = None):
+        """Navegar para a página de canais e aguardar os cards (sem login)"""
+        scrape_url = scrape_url or settings.url_scrape_channels
+        logger.info(f"[async] Navegando para página de canais: {scrape_url}")
+        try:
+            await rate_limited_goto_async(page, scrape_url, timeout=120000)
+        except Exception as e:
+            logger.warning(f"⚠️ [async] Timeout ao acessar página, continuando: {e}")
+
+        try:
+            await page.wait_for_selector(".channel-card", timeout=wait_time * 1000)
+        except Exception as e:
+            logger.warning(f"⚠️ [async] Timeout aguardando .channel-card: {str(e)}")
+
+    async def iter_channels(
+        self, page: Page, wait_time: int = 15, scrape_url: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Equivalente async de TubeHuntService.iter_channels() (gera cada canal extraído)"""
+        await self._open_listing(page, wait_time, scrape_url)
+
+        if settings.EXTRACTION_MODE == "offline":
+            page_html = await page.content()
+            save_snapshot("listing", page.url, page_html)
+            for channel in await parser_pool.parse_listing_async(page_html):
+                yield channel
+        else:
+            async for channel in aiter_listing(page):
+                yield channel
+
+    async def extract_channels(self, page: Page, wait_time: int = 15, scrape_url: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Navegar para a página de canais e extrair dados de todos os cards (sem login)
+
+        Args:
+            page: Página async já autenticada
+            wait_time: Tempo de espera para carregamento
+            scrape_url: URL customizada para scraping (opcional, usa padrão se não fornecida)
+
+        Returns:
+            Dicionário com lista de canais e informações (mesmo formato da versão sync)
+        """
+        try:
+            channels = [channel async for channel in self.iter_channels(page, wait_time, scrape_url)]
+
+            logger.info(f"✅ [async] {len(channels)} canais extraídos com sucesso")
+
+            return {
+                "success": True,
+                "channels": channels,
+                "total_channels": len(channels),
+                "url": page.url,
+                "error": None,
+            }
+
+        except Exception as e:
+            logger.error(f"❌ [async] Erro no scraping de canais: {str(e)}", exc_info=True)
+            return {
+                "success": False,
+                "channels": [],
+                "total_channels": 0,
+                "url": None,
+                "error": str(e),
+            }
+
+    async def _texts(self, page: Page, xpath: str) -> List[str]:
+        """inner_text() não vazio de todos os elementos que casam com o XPath"""
+        texts = []
+        for elem in await page.query_selector_all(xpath):
+            text = (await elem.inner_text()).strip()
+            if text:
+                texts.append(text)
+        return texts
+
+    async def _scrape_channel_details_fast(self, page: Page, channel_link: str) -> Optional[ChannelDetailedData]:
+        """Modo rápido (mesmo da versão sync); None = usar o caminho lento"""
+        started = time.time()
+        try:
+            await rate_limited_goto_async(page, channel_link, timeout=120000, wait_until="domcontentloaded")
+            await page.wait_for_selector(DETAIL_READY_SELECTOR, timeout=settings.DETAIL_FAST_TIMEOUT_SECONDS * 1000)
+
+            if settings.EXTRACTION_MODE == "offline":
+                page_html = await page.content()
+                save_snapshot("channel", channel_link, page_html)
+                data = await parser_pool.parse_channel_details_async(page_html)
+            else:
+                data = await extract_page_async(DETAIL_SPEC, page)
+        except Exception as e:
+            logger.warning(f"⚠️ [async] Modo rápido falhou para {channel_link}, usando caminho lento: {str(e)}")
+            return None
+
+        if not (data["keywords"] or data["subjects"] or data["niches"]):
+            logger.warning(f"⚠️ [async] Modo rápido sem dados para {channel_link}, usando caminho lento")
+            return None
+
+        logger.info(f"✅ [async] Canal extraído (modo rápido) em {time.time() - started:.1f}s: {channel_link}")
+        return ChannelDetailedData(channel_link=channel_link, **data)
+
+    async def scrape_channel_details(self, page: Page, channel_link: str) -> Optional[ChannelDetailedData]:
+        """
+        Extrair dados detalhados de um canal individual (mesmos XPaths da versão sync)
+
+        Args:
+            page: Página async autenticada
+            channel_link: URL completa do canal
+
+        Returns:
+            ChannelDetailedData ou None em caso de erro
+        """
+        try:
+            page = await self._maybe_recycle(page)
+
+            if settings.DETAIL_FAST_MODE:
+                channel_data = await self._scrape_channel_details_fast(page, channel_link)
+                if channel_data is not None:
+                    return channel_data
+
+            started = time.time()
+            await rate_limited_goto_async(page, channel_link, timeout=120000, wait_until="networkidle")
+
+            try:
+                await page.wait_for_selector("span.badge", timeout=30000)
+            except Exception as e:
+                logger.warning(f"⚠️ [async] Timeout aguardando elementos: {e}")
+
+            if settings.EXTRACTION_MODE == "offline":
+                page_html = await page.content()
+                save_snapshot("channel", channel_link, page_html)
+                data = await parser_pool.parse_channel_details_async(page_html)
+                logger.info(f"✅ [async] Canal extraído (offline) em {time.time() - started:.1f}s: {channel_link}")
+                return ChannelDetailedData(channel_link=channel_link, **data)
+
+            keywords = await self._texts(page, DETAIL_KEYWORDS_XPATH)
+            subjects = await self._texts(page, DETAIL_SUBJECTS_XPATH)
+            niches = await self._texts(page, DETAIL_NICHES_XPATH)
+            views = await self._texts(page, DETAIL_VIEWS_XPATH)
+            revenue = await self._texts(page, DETAIL_REVENUE_XPATH)
+
+            logger.info(f"✅ [async] Canal extraído em {time.time() - started:.1f}s: {channel_link}")
+            return ChannelDetailedData(
+                channel_link=channel_link,
+                keywords=keywords,
+                subjects=subjects,
+                niches=niches,
+                views_30_days=views[0] if views else None,
+                revenue_30_days=revenue[0] if revenue else None
+            )
+
+        except Exception as e:
+            logger.error(f"❌ [async] Erro ao scrape_channel_details: {str(e)}", exc_info=True)
+            return None
@@ -0,0 +1,415 @@
+"""
+Executor de lotes de detalhes de canal (channel_links).
+
+Concentra o loop de lote usado pelos jobs de `/scrape-channel` e
+`/scrape-channel-async/{session_id}`: primeiro o fetcher HTTP (quando se
+aplica), depois o navegador com N abas no mesmo contexto autenticado. As abas
+consomem uma fila comum de links, então a espera de rede de um canal se
+sobrepõe à dos outros. Os canais são entregues só via on_result,
+na ordem de conclusão e com `link_index` (posição do link); o lote não guarda
+a lista e retorna o total extraído e o relatório de `failed_channels`.
+
+A Sync API não navega em várias abas ao mesmo tempo a partir de uma thread,
+então no engine sync as abas (só quando a request pede `tabs` > 1) são abertas
+no engine async com o storage_state da sessão do job; por padrão o lote segue
+na página do próprio job, no navegador do pool.
+
+Canais que falham voltam para o fim da fila do lote após um backoff
+exponencial, até RETRY_MAX_ATTEMPTS tentativas por canal e enquanto houver
+orçamento de retentativas do job; o número de tentativas sai em cada canal
+(`attempts`) e em `failed_channels`.
+
+Com checkpoint_job_id, cada canal extraído é gravado no checkpoint_store e os
+canais já gravados (retomada do job) entram no resultado sem nova extração.
+"""
+
+import asyncio
+import collections
+import logging
+import random
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.async_browser import async_engine
+from app.core.checkpoint import checkpoint_store
+from app.core.concurrency import detail_concurrency, watch_responses
+from app.schemas.tubehunt import ChannelDetailedData
+from app.services.tubehunt_fetcher import (
+    fetch_channel_details,
+    fetch_channel_details_async,
+    http_fetch_applies,
+)
+
+logger = logging.getLogger(__name__)
+
+OnResult = Callable[[Dict[str, Any]], None]
+OnProgress = Callable[[int, int], None]
+BatchResult = Tuple[int, List[Dict[str, Any]]]
+
+FAILED_MESSAGE = "Falha ao extrair dados do canal"
+
+# Espera máxima entre consultas à fila quando só há canais aguardando backoff
+RETRY_POLL_SECONDS = 0.5
+
+
+def batch_tabs(requested: Optional[int], total: int) -> int:
+    """
+    Número de abas do lote: pedido (ou o padrão), limitado por BATCH_TABS_MAX e pelo lote
+
+    Com a concorrência adaptativa o padrão é BATCH_TABS_MAX: as abas são o teto
+    do job e a janela AIMD (detail_concurrency) decide quantas trabalham ao mesmo tempo.
+    """
+    default = settings.BATCH_TABS_MAX if settings.ADAPTIVE_CONCURRENCY_ENABLED else settings.BATCH_TABS_DEFAULT
+    return max(1, min(requested or default, settings.BATCH_TABS_MAX, total))
+
+
+class _BatchState:
+    """
+    Andamento do lote por posição do link
+
+    Guarda só as posições já extraídas: cada canal é entregue a on_result (e ao
+    checkpoint) e não fica retido no lote.
+    """
+
+    def __init__(self, channel_links: List[str], on_result: Optional[OnResult], on_progress: Optional[OnProgress],
+                 checkpoint_job_id: Optional[str] = None, done_items: Optional[Dict[int, Dict[str, Any]]] = None):
+        self.channel_links = channel_links
+        self.on_result = on_result
+        self.on_progress = on_progress
+        self.checkpoint_job_id = checkpoint_job_id
+        self.extracted: set = set()
+        self.errors: Dict[int, str] = {}
+        self.attempts: Dict[int, int] = {}
+        self.done = 0
+        # Orçamento de retentativas do job inteiro (fração do lote, com mínimo)
+        self.retries_left = max(
+            settings.RETRY_JOB_BUDGET_MIN, int(len(channel_links) * settings.RETRY_JOB_BUDGET_RATIO)
+        )
+        self.retries_used = 0
+        if checkpoint_job_id:
+            if done_items is None:
+                done_items = checkpoint_store.done_items(checkpoint_job_id)
+            self._restore(done_items)
+
+    def _restore(self, done_items: Dict[int, Dict[str, Any]]):
+        """Reaproveitar os canais já gravados no checkpoint (mesma posição e mesmo link)"""
+        for idx in sorted(done_items):
+            item = done_items[idx]
+            if idx < len(self.channel_links) and item["channel_link"] == self.channel_links[idx]:
+                self.extracted.add(idx)
+                self.done += 1
+                if self.on_result:
+                    self.on_result({**item["data"], "link_index": idx})
+        if self.done:
+            logger.info(f"♻️ [Lote] Retomando do checkpoint: {self.done}/{len(self.channel_links)} canais já extraídos")
+            if self.on_progress:
+                self.on_progress(self.done, len(self.channel_links))
+
+    def record(self, idx: int, channel_data: Optional[ChannelDetailedData], error: Optional[str] = None):
+        """Registrar o resultado de um link (publica o canal assim que extraído)"""
+        total = len(self.channel_links)
+        self.done += 1
+        if channel_data is not None:
+            self.extracted.add(idx)
+            data = channel_data.model_dump()
+            data["attempts"] = self.attempts.get(idx, 1)
+            data["link_index"] = idx
+            if self.checkpoint_job_id:
+                checkpoint_store.record(self.checkpoint_job_id, idx, self.channel_links[idx], data)
+            if self.on_result:
+                self.on_result(data)
+            logger.info(f"[{self.done}/{total}] ✅ {self.channel_links[idx]}")
+        else:
+            self.errors[idx] = error or FAILED_MESSAGE
+            logger.error(f"[{self.done}/{total}] ❌ {self.channel_links[idx]}: {self.errors[idx]}")
+        if self.on_progress:
+            self.on_progress(self.done, total)
+
+    def record_fetched(self, fetched: Dict[str, ChannelDetailedData], throttled: Dict[str, str]):
+        """
+        Registrar o que o fetcher HTTP resolveu
+
+        Links que falharam com o site congestionado (429/5xx) já gastaram as
+        tentativas por HTTP e não vão para o navegador.
+        """
+        for idx in self.pending():
+            link = self.channel_links[idx]
+            if link in fetched:
+                self.record(idx, fetched[link])
+            elif link in throttled:
+                self.attempts[idx] = max(1, settings.RETRY_MAX_ATTEMPTS)
+                self.record(idx, None, throttled[link])
+
+    def attempt(self, idx: int) -> int:
+        """Contar uma chamada a scrape_channel_details para o link (retorna o número da tentativa)"""
+        self.attempts[idx] = self.attempts.get(idx, 0) + 1
+        return self.attempts[idx]
+
+    def fail(self, idx: int, error: Optional[str] = None) -> Optional[float]:
+        """
+        Tratar a falha de uma tentativa
+
+        Returns:
+            Backoff em segundos se o link deve voltar ao fim da fila; None se a
+            falha é definitiva (tentativas do canal ou orçamento do job esgotados)
+        """
+        attempts = self.attempts.get(idx, 1)
+        if attempts >= settings.RETRY_MAX_ATTEMPTS or self.retries_left <= 0:
+            self.record(idx, None, error)
+            return None
+
+        self.retries_left -= 1
+        self.retries_used += 1
+        delay = min(settings.RETRY_BACKOFF_MAX_SECONDS, settings.RETRY_BACKOFF_BASE_SECONDS * 2 ** (attempts - 1))
+        delay *= random.uniform(0.5, 1.0)
+        logger.warning(
+            f"⚠️ [Lote] {self.channel_links[idx]} falhou (tentativa {attempts}/{settings.RETRY_MAX_ATTEMPTS}): "
+            f"{error or FAILED_MESSAGE}; de volta à fila em {delay:.1f}s"
+        )
+        return delay
+
+    def pending(self) -> List[int]:
+        """Posições ainda sem resultado"""
+        return [idx for idx in range(len(self.channel_links)) if idx not in self.extracted and idx not in self.errors]
+
+    def outcome(self) -> BatchResult:
+        """(total de canais extraídos, failed_channels na ordem dos links)"""
+        failed = [
+            {"channel_link": self.channel_links[idx], "error": self.errors[idx], "attempts": self.attempts.get(idx, 0)}
+            for idx in sorted(self.errors)
+        ]
+        return len(self.extracted), failed
+
+
+async def _scrape_in_tabs(service, state: _BatchState, indexes: List[int], tabs: int):
+    """
+    Extrair os links em N abas do contexto autenticado do serviço async
+
+    A primeira aba usa a vaga do próprio serviço; as demais só são abertas se
+    houver vaga livre no engine (nunca aguardam, para não travar com o engine cheio).
+    """
+    engine = service.browser_manager.engine
+    context = service.browser_manager.context
+    # Itens (pronto_em, posição): falhas voltam ao fim da fila com o backoff
+    queue: asyncio.Queue = asyncio.Queue()
+    for idx in indexes:
+        queue.put_nowait((0.0, idx))
+
+    extra_slots = 0
+    for _ in range(tabs - 1):
+        if engine.page_slots.locked():
+            break
+        await engine.page_slots.acquire()
+        extra_slots += 1
+    tabs = extra_slots + 1
+    if tabs > 1:
+        logger.info(f"ℹ️ [Lote] {len(indexes)} canais em {tabs} abas")
+
+    # Links ainda sem resultado definitivo (na fila ou em extração em alguma aba):
+    # uma aba só termina quando chega a zero, não quando a fila fica vazia por um
+    # instante enquanto outra aba está para devolver um link com backoff
+    outstanding = len(indexes)
+
+    async def tab_worker():
+        nonlocal outstanding
+        page = await context.new_page()
+        navigations = 0
+        try:
+            while outstanding > 0:
+                try:
+                    ready_at, idx = await asyncio.wait_for(queue.get(), RETRY_POLL_SECONDS)
+                except asyncio.TimeoutError:
+                    continue
+                wait = ready_at - time.monotonic()
+                if wait > 0:
+                    queue.put_nowait((ready_at, idx))
+                    await asyncio.sleep(min(wait, RETRY_POLL_SECONDS))
+                    continue
+                page_limit = settings.RECYCLE_PAGE_AFTER_NAVIGATIONS
+                if page_limit > 0 and navigations >= page_limit:
+                    try:
+                        await page.close()
+                        page = await context.new_page()
+                    except Exception:
+                        # Aba perdida: o link volta para as outras abas
+                        queue.put_nowait((ready_at, idx))
+                        raise
+                    navigations = 0
+                navigations += 1
+                state.attempt(idx)
+                error = None
+                try:
+                    async with detail_concurrency.slot_async() as sample:
+                        with watch_responses(page, sample):
+                            channel_data = await service.scrape_channel_details(page, state.channel_links[idx])
+                        sample.ok = channel_data is not None
+                except Exception as e:
+                    channel_data, error = None, str(e)
+                if channel_data is not None:
+                    state.record(idx, channel_data)
+                    outstanding -= 1
+                else:
+                    delay = state.fail(idx, error)
+                    if delay is not None:
+                        queue.put_nowait((time.monotonic() + delay, idx))
+                    else:
+                        outstanding -= 1
+        finally:
+            await page.close()
+
+    try:
+        results = await asyncio.gather(*(tab_worker() for _ in range(tabs)), return_exceptions=True)
+        for error in [r for r in results if isinstance(r, BaseException)]:
+            logger.warning(f"⚠️ [Lote] Aba encerrada com erro: {str(error)}")
+    finally:
+        for _ in range(extra_slots):
+            engine.page_slots.release()
+
+    # Links que ficaram para trás (todas as abas falharam)
+    for idx in state.pending():
+        state.record(idx, None, "Aba do navegador encerrada antes de extrair o canal")
+
+
+async def run_detail_batch_async(
+    service,
+    channel_links: List[str],
+    tabs: Optional[int] = None,
+    on_result: Optional[OnResult] = None,
+    on_progress: Optional[OnProgress] = None,
+    checkpoint_job_id: Optional[str] = None,
+) -> BatchResult:
+    """
+    Lote de detalhes no engine async
+
+    Args:
+        service: TubeHuntAsyncService autenticado
+        channel_links: URLs completas dos canais
+        tabs: Abas em paralelo (None = padrão de batch_tabs(); limitado por BATCH_TABS_MAX)
+        on_result: Chamado com cada canal extraído, assim que extraído
+        on_progress: Chamado com (concluídos, total) a cada canal
+        checkpoint_job_id: Job do checkpoint (grava cada canal e pula os já gravados)
+
+    Returns:
+        (total de canais extraídos, failed_channels na ordem de channel_links)
+    """
+    started = time.time()
+    # Leitura do checkpoint fora do loop do engine (SQLite é bloqueante)
+    done_items = await asyncio.to_thread(checkpoint_store.done_items, checkpoint_job_id) if checkpoint_job_id else None
+    state = _BatchState(channel_links, on_result, on_progress, checkpoint_job_id, done_items)
+
+    # Lotes grandes: primeiro por HTTP; o navegador fica com o que faltar
+    pending_links = [channel_links[idx] for idx in state.pending()]
+    if http_fetch_applies(pending_links):
+        fetched, throttled = await fetch_channel_details_async(
+            await service.browser_manager.export_storage_state(), pending_links
+        )
+        state.record_fetched(fetched, throttled)
+
+    indexes = state.pending()
+    if indexes:
+        await service.get_page()
+        await _scrape_in_tabs(service, state, indexes, batch_tabs(tabs, len(indexes)))
+
+    logger.info(
+        f"✅ [Lote] {len(state.extracted)}/{len(channel_links)} canais em {time.time() - started:.1f}s "
+        f"({state.retries_used} retentativas)"
+    )
+    return state.outcome()
+
+
+async def _run_tabs_with_storage_state(
+    storage_state: Optional[Dict[str, Any]],
+    username: str,
+    password: str,
+    state: _BatchState,
+    indexes: List[int],
+    tabs: int,
+):
+    """Abrir um contexto no engine async com a sessão do job sync e extrair em abas"""
+    from app.services.tubehunt_async import TubeHuntAsyncService
+
+    service = TubeHuntAsyncService(username=username, password=password)
+    try:
+        await service._create_driver(storage_state)
+        service.authenticated = True
+        await _scrape_in_tabs(service, state, indexes, tabs)
+    finally:
+        await service.close()
+
+
+def run_detail_batch(
+    service,
+    channel_links: List[str],
+    tabs: Optional[int] = None,
+    on_result: Optional[OnResult] = None,
+    on_progress: Optional[OnProgress] = None,
+    checkpoint_job_id: Optional[str] = None,
+) -> BatchResult:
+    """
+    Lote de detalhes no engine sync (mesmo contrato de run_detail_batch_async)
+
+    Args:
+        service: TubeHuntService autenticado
+        channel_links: URLs completas dos canais
+        tabs: Abas em paralelo (None/1 = sequencial na página do job; >1 abre as
+            abas no engine async com a sessão do job)
+        on_result: Chamado com cada canal extraído, assim que extraído
+        on_progress: Chamado com (concluídos, total) a cada canal
+        checkpoint_job_id: Job do checkpoint (grava cada canal e pula os já gravados)
+    """
+    started = time.time()
+    state = _BatchState(channel_links, on_result, on_progress, checkpoint_job_id)
+    storage_state = None
+
+    pending_links = [channel_links[idx] for idx in state.pending()]
+    if http_fetch_applies(pending_links):
+        storage_state = service.browser_manager.export_storage_state()
+        fetched, throttled = fetch_channel_details(storage_state, pending_links)
+        state.record_fetched(fetched, throttled)
+
+    # Abas extras no engine sync só quando a request pede: elas abrem um contexto no
+    # navegador do engine async (fora do pool e da reciclagem) enquanto o do job fica ocioso
+    indexes = state.pending()
+    tabs = batch_tabs(tabs, len(indexes)) if tabs else 1
+    if indexes and tabs > 1:
+        try:
+            if storage_state is None:
+                storage_state = service.browser_manager.export_storage_state()
+            async_engine.run(_run_tabs_with_storage_state(
+                storage_state, service.username, service.password, state, indexes, tabs
+            ))
+        except Exception as e:
+            logger.error(f"❌ [Lote] Abas no engine async falharam, seguindo na página do job: {str(e)}", exc_info=True)
+        indexes = state.pending()
+
+    queue = collections.deque((0.0, idx) for idx in indexes)
+    while queue:
+        ready_at, idx = queue.popleft()
+        wait = ready_at - time.monotonic()
+        if wait > 0:
+            queue.append((ready_at, idx))
+            time.sleep(min(wait, RETRY_POLL_SECONDS))
+            continue
+        state.attempt(idx)
+        error = None
+        try:
+            with detail_concurrency.slot() as sample:
+                page = service.get_page()
+                with watch_responses(page, sample):
+                    channel_data = service.scrape_channel_details(page, channel_links[idx])
+                sample.ok = channel_data is not None
+        except Exception as e:
+            channel_data, error = None, str(e)
+        if channel_data is not None:
+            state.record(idx, channel_data)
+        else:
+            delay = state.fail(idx, error)
+            if delay is not None:
+                queue.append((time.monotonic() + delay, idx))
+
+    logger.info(
+        f"✅ [Lote] {len(state.extracted)}/{len(channel_links)} canais em {time.time() - started:.1f}s "
+        f"({state.retries_used} retentativas)"
+    )
+    return state.outcome()
@@ -0,0 +1,296 @@
+"""
+Crawl de várias páginas da listagem de canais do TubeHunt.
+
+Reescreve o parâmetro `page=` da scrape_url para um intervalo de páginas (ou
+até encontrar uma página vazia), remove canais repetidos entre páginas e
+entrega os canais na ordem das páginas. No modo incremental o crawl para no
+primeiro canal já visto (app.core.high_water). No engine async as páginas são
+buscadas em paralelo, cada worker com seu próprio contexto; no engine sync
+são buscadas em sequência pela página do job.
+"""
+
+import asyncio
+import inspect
+import logging
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+OnChannel = Callable[[Dict[str, Any]], Any]
+
+
+def page_url(scrape_url: str, page_number: int) -> str:
+    """URL da listagem com o parâmetro page= trocado (demais parâmetros preservados)"""
+    parsed = urlparse(scrape_url)
+    query = [(k, v) for k, v in parse_qsl(parsed.query, keep_blank_values=True) if k != "page"]
+    query.insert(0, ("page", str(page_number)))
+    return urlunparse(parsed._replace(query=urlencode(query)))
+
+
+def page_number_of(scrape_url: str) -> int:
+    """Número da página na scrape_url (1 se ausente ou inválido)"""
+    value = dict(parse_qsl(urlparse(scrape_url).query)).get("page", "1")
+    return int(value) if value.isdigit() and int(value) > 0 else 1
+
+
+def channel_key(channel: Dict[str, Any]) -> str:
+    """Chave de deduplicação: handle do canal, ou o ID no link se não houver handle"""
+    handle = channel.get("channel_handle")
+    if handle and handle != "N/A":
+        return handle.strip().lower()
+    return (channel.get("channel_link") or "").rstrip("/").rsplit("/", 1)[-1]
+
+
+class ListingCrawl:
+    """
+    Estado de um crawl de listagem
+
+    Responsável por:
+    - Distribuir os números de página (intervalo ou "até vazia")
+    - Reordenar páginas concluídas fora de ordem
+    - Remover canais repetidos entre páginas
+    - No modo incremental, parar no primeiro canal já visto
+    """
+
+    def __init__(
+        self,
+        scrape_url: str,
+        page_start: Optional[int] = None,
+        page_end: Optional[int] = None,
+        until_empty: bool = False,
+        max_pages: Optional[int] = None,
+        known: Optional[Iterable[str]] = None,
+    ):
+        """
+        Args:
+            scrape_url: URL base da listagem (o parâmetro page= é reescrito)
+            page_start: Primeira página (None = page= da scrape_url)
+            page_end: Última página (None = até a primeira página vazia)
+            until_empty: Parar na primeira página sem canais
+            max_pages: Limite de páginas (None = settings.CRAWL_MAX_PAGES)
+            known: Chaves de canais já vistos (modo incremental; high_water_store)
+        """
+        page_start = page_start or page_number_of(scrape_url)
+        page_limit = page_start + (max_pages or settings.CRAWL_MAX_PAGES) - 1
+        self.scrape_url = scrape_url
+        self.page_start = page_start
+        self.until_empty = until_empty or page_end is None
+        self.page_end = min(page_end, page_limit) if page_end is not None else page_limit
+        self.stop_at: Optional[int] = None
+        self.incremental = known is not None
+        self.known = set(known or ())
+        self.stopped_at: Optional[Dict[str, Any]] = None
+        self.new_keys: List[str] = []
+        self._next_page = page_start
+        self._next_emit = page_start
+        self._done: Dict[int, Optional[List[Dict[str, Any]]]] = {}
+        self._seen: set = set()
+        self.failed_pages: List[int] = []
+        self.pages_crawled = 0
+        self.duplicates = 0
+
+    @property
+    def total_pages(self) -> int:
+        """Páginas no intervalo (limite superior quando until_empty)"""
+        return self.page_end - self.page_start + 1
+
+    def _last_page(self) -> int:
+        """Última página que ainda pode ter canais"""
+        return self.page_end if self.stop_at is None else min(self.page_end, self.stop_at - 1)
+
+    def next_page(self) -> Optional[int]:
+        """Próxima página a buscar (None = não há mais páginas)"""
+        if self._next_page > self._last_page():
+            return None
+        page_number = self._next_page
+        self._next_page += 1
+        return page_number
+
+    def complete(self, page_number: int, channels: Optional[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Registrar o resultado de uma página
+
+        Args:
+            page_number: Número da página
+            channels: Canais extraídos (None = a página falhou)
+
+        Returns:
+            Canais novos, já na ordem das páginas, prontos para publicar
+        """
+        self.pages_crawled += 1
+        if channels is None:
+            self.failed_pages.append(page_number)
+        elif not channels and self.until_empty:
+            if self.stop_at is None or page_number < self.stop_at:
+                self.stop_at = page_number
+                logger.info(f"ℹ️ [Crawl] Página {page_number} vazia, encerrando crawl")
+        self._done[page_number] = channels
+
+        ready = []
+        while self._next_emit in self._done and self._next_emit <= self._last_page():
+            emit_page = self._next_emit
+            self._next_emit += 1
+            for position, channel in enumerate(self._done.pop(emit_page) or []):
+                key = channel_key(channel)
+                if key in self.known:
+                    self._stop_at_known(emit_page, position, key)
+                    break
+                if key in self._seen:
+                    self.duplicates += 1
+                    continue
+                self._seen.add(key)
+                self.new_keys.append(key)
+                ready.append(channel)
+        return ready
+
+    def _stop_at_known(self, page_number: int, position: int, key: str):
+        """Encerrar o crawl incremental no primeiro canal já visto"""
+        self.stopped_at = {"page": page_number, "position": position, "channel": key}
+        self.stop_at = page_number + 1
+        self._done.clear()
+        logger.info(f"ℹ️ [Crawl] Canal já visto ({key}) na página {page_number}, encerrando crawl incremental")
+
+    def update_high_water(self, store, error: Optional[str] = None) -> bool:
+        """
+        Avançar a marca da listagem (high_water_store) após um crawl incremental
+
+        Só avança se o job terminou sem erro e nenhuma página falhou: os canais de
+        uma página com falha ficariam de fora em todos os crawls seguintes, que
+        param nos canais já vistos das primeiras páginas.
+
+        Args:
+            store: HighWaterMarkStore
+            error: Erro do job (None = sucesso)
+
+        Returns:
+            True se a marca foi atualizada
+        """
+        if not self.incremental or error is not None:
+            return False
+        if self.failed_pages:
+            logger.warning(
+                f"⚠️ [Crawl] Páginas com falha {sorted(self.failed_pages)}, marca da listagem não avançada"
+            )
+            return False
+        store.update(self.scrape_url, self.new_keys)
+        return True
+
+    def summary(self) -> Dict[str, Any]:
+        """Resumo do crawl para o resultado do job"""
+        return {
+            "page_start": self.page_start,
+            "last_page": self._last_page(),
+            "pages_crawled": self.pages_crawled,
+            "failed_pages": sorted(self.failed_pages),
+            "duplicates_removed": self.duplicates,
+            "incremental": self.incremental,
+            "stopped_at": self.stopped_at,
+        }
+
+
+def crawl_listing(service, crawl: ListingCrawl, wait_time: int, on_channel: OnChannel) -> ListingCrawl:
+    """
+    Crawl sequencial na página de um TubeHuntService já autenticado (engine sync)
+
+    Args:
+        service: TubeHuntService autenticado
+        crawl: Estado do crawl
+        wait_time: Tempo de espera por página
+        on_channel: Chamado para cada canal novo, na ordem das páginas
+    """
+    started = time.time()
+    while (page_number := crawl.next_page()) is not None:
+        result = service.extract_channels(service.get_page(), wait_time=wait_time,
+                                          scrape_url=page_url(crawl.scrape_url, page_number))
+        for channel in crawl.complete(page_number, result["channels"] if result["success"] else None):
+            on_channel(channel)
+
+    logger.info(f"✅ [Crawl] {crawl.pages_crawled} páginas em {time.time() - started:.1f}s")
+    return crawl
+
+
+async def crawl_listing_async(
+    username: str,
+    password: str,
+    crawl: ListingCrawl,
+    wait_time: int,
+    on_channel: OnChannel,
+    concurrency: Optional[int] = None,
+    service=None,
+) -> ListingCrawl:
+    """
+    Crawl paralelo no engine async: cada worker tem seu contexto autenticado
+
+    A sessão vem do cache/coordenador de login, então os workers não repetem o
+    login do job. Os workers extras só são abertos se houver vaga de página livre
+    no engine (sem aguardar): com o engine cheio (ex.: workers de detalhes do
+    pipeline segurando vagas) o crawl segue na página do job em vez de travar.
+
+    Args:
+        username: Usuário da conta (sessão compartilhada via cache)
+        password: Senha da conta
+        crawl: Estado do crawl
+        wait_time: Tempo de espera por página
+        on_channel: Chamado para cada canal novo, na ordem das páginas (pode
+            ser uma corrotina, ex.: put de uma fila limitada)
+        concurrency: Contextos em paralelo (None = settings.CRAWL_CONCURRENCY)
+        service: TubeHuntAsyncService já autenticado do job, usado como primeiro
+            worker (não é fechado aqui)
+    """
+    from app.services.tubehunt_async import TubeHuntAsyncService
+
+    requested = max(1, min(concurrency or settings.CRAWL_CONCURRENCY, crawl.total_pages))
+    started = time.time()
+
+    # (serviço, fechado ao final?) de cada worker; o primeiro é o do job, se houver
+    if service is not None:
+        workers = [(service, False)]
+    else:
+        workers = [(TubeHuntAsyncService(username=username, password=password), True)]
+    while len(workers) < requested:
+        extra = TubeHuntAsyncService(username=username, password=password)
+        if not await extra.try_reserve_page():
+            await extra.close()
+            logger.info(f"ℹ️ [Crawl] Engine sem vagas de página: {len(workers)}/{requested} contextos")
+            break
+        workers.append((extra, True))
+    concurrency = len(workers)
+
+    async def worker(worker_service, owned: bool):
+        try:
+            if owned:
+                await worker_service.authenticate()
+            while (page_number := crawl.next_page()) is not None:
+                try:
+                    result = await worker_service.extract_channels(
+                        await worker_service.get_page(),
+                        wait_time=wait_time,
+                        scrape_url=page_url(crawl.scrape_url, page_number),
+                    )
+                except Exception as e:
+                    # A página precisa ser concluída mesmo com erro, senão as seguintes ficam retidas
+                    logger.error(f"❌ [Crawl] Erro na página {page_number}: {str(e)}")
+                    result = {"success": False}
+                for channel in crawl.complete(page_number, result["channels"] if result["success"] else None):
+                    if inspect.isawaitable(published := on_channel(channel)):
+                        await published
+        finally:
+            if owned:
+                await worker_service.close()
+
+    results = await asyncio.gather(*(worker(*w) for w in workers), return_exceptions=True)
+    errors = [r for r in results if isinstance(r, BaseException)]
+    if len(errors) == concurrency:
+        raise errors[0]
+    for error in errors:
+        logger.warning(f"⚠️ [Crawl] Worker encerrado com erro: {str(error)}")
+
+    logger.info(
+        f"✅ [Crawl] {crawl.pages_crawled} páginas em {time.time() - started:.1f}s "
+        f"({concurrency} contextos em paralelo)"
+    )
+    return crawl
@@ -0,0 +1,215 @@
+"""
+Specs de extração do TubeHunt (listagem e detalhes do canal).
+
+As specs declaram seletores e campos; `app.core.extraction` as compila em um
+único `page.evaluate` (ao vivo) e em um extrator lxml (parser offline). A
+normalização da listagem (split de "•", limpeza de "inscritos", etc.) é feita
+em Python, com as mesmas regras e o mesmo schema para os dois caminhos.
+"""
+
+import logging
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional
+
+from app.core.config import settings
+from app.core.extraction import (
+    Field,
+    Spec,
+    aiter_page,
+    extract_page,
+    extract_page_async,
+    iter_page,
+    register,
+)
+
+logger = logging.getLogger(__name__)
+
+CHANNEL_CARD_SELECTOR = ".channel-card"
+CHANNEL_CARD_FALLBACK_SELECTOR = "[data-testid*='channel'], .card, [class*='channel']"
+
+STAT_LABELS = [
+    "total_views",
+    "views_last_60_days",
+    "average_views_per_video",
+    "time_since_first_video",
+    "total_videos",
+    "outlier_score",
+]
+
+# Página de detalhes: apenas a seção inicial de dados do canal (não os vídeos)
+DETAIL_SECTION_XPATH = "//div[@class='d-flex flex-wrap gap-1 mt-2 small']"
+# Seletor Playwright que indica que a seção de dados do canal já foi renderizada
+DETAIL_READY_SELECTOR = f"xpath={DETAIL_SECTION_XPATH}//span[@class='badge badge-soft rounded-pill']"
+_DETAIL_BADGE = "span[@class='badge badge-soft rounded-pill']"
+DETAIL_KEYWORDS_XPATH = f"{DETAIL_SECTION_XPATH}//p[contains(., 'Keywords do canal')]/following-sibling::{_DETAIL_BADGE}"
+DETAIL_SUBJECTS_XPATH = f"{DETAIL_SECTION_XPATH}//p[contains(., 'Assuntos')]/following-sibling::{_DETAIL_BADGE}"
+DETAIL_NICHES_XPATH = f"{DETAIL_SECTION_XPATH}//p[contains(., 'Nicho')]/following-sibling::{_DETAIL_BADGE}//a"
+# <div class="metric text-center">
+#   <div class="label text-dark">Views (30 dias)</div>
+#   <div class="value">54.91k</div>
+# </div>
+_DETAIL_METRIC = (
+    "//div[@class='metric text-center']"
+    "//div[@class='label text-dark' and contains(., '{label}')]"
+    "/following-sibling::div[@class='value']"
+)
+DETAIL_VIEWS_XPATH = _DETAIL_METRIC.format(label="Views (30 dias)")
+DETAIL_REVENUE_XPATH = _DETAIL_METRIC.format(label="Receita (30 dias)")
+
+# Listagem: um item por card (mesmos campos brutos usados por normalize_channel_card)
+LISTING_SPEC = register(Spec(
+    name="tubehunt.listing",
+    root=CHANNEL_CARD_SELECTOR,
+    root_fallbacks=(CHANNEL_CARD_FALLBACK_SELECTOR,),
+    fields=(
+        Field("name", "a.fw-semibold.fs-4"),
+        Field("link", "a.fw-semibold.fs-4", attr="href"),
+        Field("handle", ".small .fw-bold"),
+        Field("country", ".country"),
+        Field("subscribers", ".small.text-secondary"),
+        Field("verified", "i.bi-patch-check-fill", attr="exists"),
+        Field("monetized", "i.bi-currency-dollar", attr="exists"),
+        Field("categories", "span.badge.mt-2.badge-soft.rounded-pill"),
+        Field("stats", ".stat-card", many=True, fields=(Field("value", ".fs-4.fw-semibold"),)),
+        Field("videos", ".entry-video", many=True, fields=(
+            Field("link", "a", attr="href"),
+            Field("thumbnail", ".video-thumb", attr="src"),
+            Field("duration", ".duration"),
+            Field("title", ".mt-2.mb-2.text-dark.fw-semibold.small"),
+            Field("stats", ".small.text-secondary"),
+        )),
+    ),
+))
+
+# Detalhes do canal: documento inteiro, campos no schema de ChannelDetailedData
+DETAIL_SPEC = register(Spec(
+    name="tubehunt.channel",
+    fields=(
+        Field("keywords", DETAIL_KEYWORDS_XPATH, xpath=True, attr="inner_text", many=True, post=("compact",)),
+        Field("subjects", DETAIL_SUBJECTS_XPATH, xpath=True, attr="inner_text", many=True, post=("compact",)),
+        Field("niches", DETAIL_NICHES_XPATH, xpath=True, attr="inner_text", many=True, post=("compact",)),
+        Field("views_30_days", DETAIL_VIEWS_XPATH, xpath=True, attr="inner_text", many=True, post=("compact", "first")),
+        Field("revenue_30_days", DETAIL_REVENUE_XPATH, xpath=True, attr="inner_text", many=True, post=("compact", "first")),
+    ),
+))
+
+
+def _or_na(value: Optional[str]) -> str:
+    """Valor ausente (elemento não encontrado) vira "N/A" """
+    return value if value is not None else "N/A"
+
+
+def normalize_video(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """Converter os campos brutos de um vídeo no schema de recent_videos"""
+    parts = [p.strip() for p in (raw.get("stats") or "").split("•")]
+    return {
+        "title": _or_na(raw.get("title")),
+        "video_link": _or_na(raw.get("link")),
+        "thumbnail_url": _or_na(raw.get("thumbnail")),
+        "duration": _or_na(raw.get("duration")),
+        "views": parts[0].replace("views", "").strip() if len(parts) > 0 else "N/A",
+        "comments": parts[1].replace("comentários", "").strip() if len(parts) > 1 else "N/A",
+        "uploaded_time": parts[2] if len(parts) > 2 else "N/A",
+    }
+
+
+def normalize_channel_card(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Converter os campos brutos de um card no schema de canal da listagem
+
+    Args:
+        raw: Campos brutos de um card (LISTING_SPEC)
+
+    Returns:
+        Dicionário com os mesmos campos de TubeHuntService.extract_channels()
+    """
+    subscribers_text = raw.get("subscribers") or ""
+    subscribers = (
+        subscribers_text.split("•")[1].strip().replace("inscritos", "").strip()
+        if "•" in subscribers_text
+        else "N/A"
+    )
+
+    categories: List[str] = []
+    if raw.get("categories") is not None:
+        categories = [cat.strip() for cat in raw["categories"].strip().split(",")]
+
+    stat_values = [stat.get("value") for stat in raw.get("stats") or []]
+    stats = {
+        label: _or_na(stat_values[idx]) if idx < len(stat_values) else "N/A"
+        for idx, label in enumerate(STAT_LABELS)
+    }
+
+    country = raw.get("country")
+
+    return {
+        "channel_name": _or_na(raw.get("name")),
+        "channel_link": _or_na(raw.get("link")),
+        "channel_handle": _or_na(raw.get("handle")),
+        "country": country.strip() if country is not None else "N/A",
+        "subscribers": subscribers,
+        "is_verified": bool(raw.get("verified")),
+        "is_monetized": bool(raw.get("monetized")),
+        "categories": categories,
+        **stats,
+        "recent_videos": [normalize_video(v) for v in (raw.get("videos") or [])][:6],
+    }
+
+
+def iter_normalized(raw_cards: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Normalizar os cards um a um, descartando (com log) os que falharem"""
+    for idx, raw in enumerate(raw_cards):
+        try:
+            yield normalize_channel_card(raw)
+        except Exception as e:
+            logger.error(f"❌ Erro ao processar canal {idx + 1}: {str(e)}")
+
+
+def normalize_listing(raw_cards: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Normalizar todos os cards, descartando (com log) os que falharem"""
+    return list(iter_normalized(raw_cards))
+
+
+def extract_listing(page) -> List[Dict[str, Any]]:
+    """
+    Extrair todos os canais da página de listagem (Sync API, um único evaluate)
+
+    Args:
+        page: Página Playwright (Sync API) já na listagem
+
+    Returns:
+        Lista de canais no schema da listagem
+    """
+    raw_cards = extract_page(LISTING_SPEC, page)
+    if not raw_cards:
+        logger.warning("⚠️ Nenhum card de canal encontrado (seletores principal e alternativos)")
+    return normalize_listing(raw_cards)
+
+
+async def extract_listing_async(page) -> List[Dict[str, Any]]:
+    """Equivalente de extract_listing() para a Async API"""
+    raw_cards = await extract_page_async(LISTING_SPEC, page)
+    if not raw_cards:
+        logger.warning("⚠️ [async] Nenhum card de canal encontrado (seletores principal e alternativos)")
+    return normalize_listing(raw_cards)
+
+
+def iter_listing(page, batch_size: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Gerar os canais da listagem um a um (Sync API, um evaluate por lote de cards)
+
+    Args:
+        page: Página Playwright (Sync API) já na listagem
+        batch_size: Cards por evaluate (None = settings.LISTING_BATCH_SIZE)
+    """
+    return iter_normalized(iter_page(LISTING_SPEC, page, batch_size or settings.LISTING_BATCH_SIZE))
+
+
+async def aiter_listing(page, batch_size: Optional[int] = None) -> AsyncIterator[Dict[str, Any]]:
+    """Equivalente de iter_listing() para a Async API"""
+    idx = 0
+    async for raw in aiter_page(LISTING_SPEC, page, batch_size or settings.LISTING_BATCH_SIZE):
+        idx += 1
+        try:
+            yield normalize_channel_card(raw)
+        except Exception as e:
+            logger.error(f"❌ [async] Erro ao processar canal {idx}: {str(e)}")
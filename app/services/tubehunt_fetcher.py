@@ -0,0 +1,226 @@
+"""
+Fetcher HTTP assíncrono das páginas de detalhes de canal.
+
+Para lotes grandes de `channel_links`, busca as páginas com um
+`httpx.AsyncClient` (HTTP/2 via httpx[http2], conexões
+keep-alive reaproveitadas) usando os cookies da sessão autenticada, com
+concorrência limitada por HTTP_FETCH_CONCURRENCY, e extrai os dados com o
+parser offline (tubehunt_parser). Páginas que não trazem a seção do canal
+no HTML (renderização via JS, sessão expirada, erro de rede) ficam para o
+navegador.
+
+Respostas 429/5xx indicam site congestionado: viram amostra de throttling na
+janela AIMD (detail_concurrency), pausam o fetcher inteiro (Retry-After ou
+backoff exponencial) e o mesmo link é tentado de novo por HTTP; esgotadas as
+tentativas, o link falha em vez de ir para o navegador.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import httpx
+
+from app.core.concurrency import detail_concurrency
+from app.core.config import settings
+from app.core.rate_limit import httpx_request_hook_async
+from app.schemas.tubehunt import ChannelDetailedData
+from app.services.tubehunt_parser import parser_pool
+
+logger = logging.getLogger(__name__)
+
+# (canais extraídos por HTTP, links que falharam com o site congestionado -> erro)
+FetchResult = Tuple[Dict[str, ChannelDetailedData], Dict[str, str]]
+
+# Aviso de HTTP/2 indisponível já registrado
+_http2_warned = False
+
+
+def _http2_available() -> bool:
+    """
+    HTTP/2 no httpx exige o pacote h2 (declarado como httpx[http2] nas dependências)
+
+    Sem ele (instalação incompleta) o fetcher segue em HTTP/1.1 e avisa uma única vez.
+    """
+    global _http2_warned
+    if not settings.HTTP2_ENABLED:
+        return False
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        if not _http2_warned:
+            _http2_warned = True
+            logger.warning("⚠️ [HTTP] Pacote h2 não instalado (pip install 'httpx[http2]'); fetcher em HTTP/1.1")
+        return False
+
+
+def http_fetch_applies(channel_links: List[str]) -> bool:
+    """Se o lote deve passar primeiro pelo fetcher HTTP"""
+    return settings.HTTP_FETCH_ENABLED and len(channel_links) >= settings.HTTP_FETCH_MIN_BATCH
+
+
+class ChannelDetailFetcher:
+    """
+    Busca concorrente de páginas de canal por HTTP
+
+    Responsável por:
+    - Reaproveitar os cookies do storage_state do navegador
+    - Limitar a concorrência de requisições (semáforo local e janela AIMD compartilhada)
+    - Recuar diante de 429/5xx (pausa do fetcher e nova tentativa por HTTP)
+    - Parsear o HTML no pool de processos do parser offline
+    - Separar as páginas que precisam do navegador
+    """
+
+    def __init__(self, storage_state: Optional[Dict[str, Any]], concurrency: Optional[int] = None):
+        """
+        Args:
+            storage_state: Sessão autenticada (BrowserContext.storage_state())
+            concurrency: Requisições simultâneas (None = settings.HTTP_FETCH_CONCURRENCY)
+        """
+        self.storage_state = storage_state or {"cookies": []}
+        self.concurrency = concurrency or settings.HTTP_FETCH_CONCURRENCY
+        # Instante (loop.time()) até o qual nenhuma requisição sai, após um 429/5xx
+        self._paused_until = 0.0
+
+    def _build_client(self) -> httpx.AsyncClient:
+        """AsyncClient com pool keep-alive dimensionado pela concorrência e cookies da sessão"""
+        cookies = httpx.Cookies()
+        for cookie in self.storage_state.get("cookies", []):
+            cookies.set(cookie["name"], cookie["value"], domain=cookie.get("domain", ""), path=cookie.get("path", "/"))
+
+        return httpx.AsyncClient(
+            http2=_http2_available(),
+            follow_redirects=True,
+            event_hooks={"request": [httpx_request_hook_async]},
+            timeout=settings.HTTP_TIMEOUT_SECONDS,
+            limits=httpx.Limits(
+                max_connections=self.concurrency,
+                max_keepalive_connections=self.concurrency,
+            ),
+            cookies=cookies,
+            headers={
+                "User-Agent": settings.HTTP_USER_AGENT,
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                "Accept-Language": "pt-BR,pt;q=0.9,en;q=0.8",
+            },
+        )
+
+    async def _wait_backoff(self):
+        """Aguardar a pausa em curso do fetcher (se houver)"""
+        loop = asyncio.get_running_loop()
+        while self._paused_until > loop.time():
+            await asyncio.sleep(self._paused_until - loop.time())
+
+    def _back_off(self, response: httpx.Response, attempt: int) -> float:
+        """Pausar o fetcher após um 429/5xx: backoff exponencial, no mínimo o Retry-After (em segundos)"""
+        delay = min(settings.RETRY_BACKOFF_MAX_SECONDS, settings.RETRY_BACKOFF_BASE_SECONDS * 2 ** (attempt - 1))
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            delay = max(delay, min(settings.RETRY_BACKOFF_MAX_SECONDS, float(retry_after)))
+        self._paused_until = max(self._paused_until, asyncio.get_running_loop().time() + delay)
+        return delay
+
+    async def _fetch_one(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        channel_link: str,
+    ) -> Tuple[Optional[ChannelDetailedData], Optional[str]]:
+        """
+        Buscar e parsear uma página
+
+        Returns:
+            (dados, None) se extraída; (None, None) para usar o navegador;
+            (None, erro) se o site seguiu congestionado em todas as tentativas
+        """
+        max_attempts = max(1, settings.RETRY_MAX_ATTEMPTS)
+        for attempt in range(1, max_attempts + 1):
+            await self._wait_backoff()
+            async with semaphore:
+                async with detail_concurrency.slot_async() as sample:
+                    try:
+                        response = await client.get(channel_link)
+                    except httpx.HTTPError as e:
+                        sample.ok = False
+                        logger.warning(f"⚠️ [HTTP] Falha ao buscar {channel_link}: {str(e)}")
+                        return None, None
+                    if response.status_code == 429 or response.status_code >= 500:
+                        sample.throttled_status = response.status_code
+
+            if sample.throttled_status is None:
+                break
+            if attempt == max_attempts:
+                return None, f"HTTP {response.status_code} do site após {attempt} tentativas por HTTP"
+            delay = self._back_off(response, attempt)
+            logger.warning(
+                f"⚠️ [HTTP] {channel_link} respondeu HTTP {response.status_code} "
+                f"(tentativa {attempt}/{max_attempts}); fetcher pausado por {delay:.1f}s"
+            )
+
+        if "login" in urlparse(str(response.url)).path.lower():
+            logger.warning(f"⚠️ [HTTP] Sessão não aceita em {channel_link} (redirecionou para login)")
+            return None, None
+        if response.status_code != 200:
+            logger.warning(f"⚠️ [HTTP] {channel_link} respondeu HTTP {response.status_code}")
+            return None, None
+
+        data = await parser_pool.parse_channel_details_async(response.text)
+        if not (data["keywords"] or data["subjects"] or data["niches"]):
+            # Seção do canal ausente no HTML: página renderizada via JS
+            logger.info(f"ℹ️ [HTTP] {channel_link} sem dados no HTML, será extraído pelo navegador")
+            return None, None
+
+        return ChannelDetailedData(channel_link=channel_link, **data), None
+
+    async def fetch_all(self, channel_links: List[str]) -> FetchResult:
+        """
+        Buscar todas as páginas do lote
+
+        Args:
+            channel_links: URLs dos canais
+
+        Returns:
+            (channel_link -> dados das páginas extraídas por HTTP, channel_link -> erro
+            dos links que falharam com o site congestionado); os links ausentes dos
+            dois devem ser extraídos pelo navegador
+        """
+        started = time.time()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        async with self._build_client() as client:
+            results = await asyncio.gather(
+                *(self._fetch_one(client, semaphore, link) for link in channel_links)
+            )
+
+        fetched = {link: data for link, (data, _) in zip(channel_links, results) if data is not None}
+        throttled = {link: error for link, (_, error) in zip(channel_links, results) if error is not None}
+        logger.info(
+            f"✅ [HTTP] {len(fetched)}/{len(channel_links)} canais extraídos em "
+            f"{time.time() - started:.1f}s (concorrência {self.concurrency}, http2={_http2_available()})"
+        )
+        if throttled:
+            logger.warning(f"⚠️ [HTTP] {len(throttled)} canais falharam com o site congestionado (429/5xx)")
+        return fetched, throttled
+
+
+def fetch_channel_details(storage_state: Optional[Dict[str, Any]], channel_links: List[str]) -> FetchResult:
+    """fetch_all() para jobs sync (threads sem event loop); falhas gerais voltam ao navegador"""
+    try:
+        return asyncio.run(ChannelDetailFetcher(storage_state).fetch_all(channel_links))
+    except Exception as e:
+        logger.error(f"❌ [HTTP] Fetcher falhou, usando apenas o navegador: {str(e)}", exc_info=True)
+        return {}, {}
+
+
+async def fetch_channel_details_async(
+    storage_state: Optional[Dict[str, Any]],
+    channel_links: List[str],
+) -> FetchResult:
+    """Equivalente de fetch_channel_details() para o engine async"""
+    try:
+        return await ChannelDetailFetcher(storage_state).fetch_all(channel_links)
+    except Exception as e:
+        logger.error(f"❌ [HTTP] Fetcher falhou, usando apenas o navegador: {str(e)}", exc_info=True)
+        return {}, {}
@@ -0,0 +1,293 @@
+"""Cliente HTTP do TubeHunt (httpx): login pelo formulário e fetch de páginas sem navegador"""
+import logging
+import time
+from html.parser import HTMLParser
+from typing import Optional, Dict, Any, List
+from urllib.parse import urljoin, urlparse
+
+import httpx
+
+from app.core.config import settings
+from app.core.rate_limit import httpx_request_hook
+from app.services.tubehunt import TubeHuntLoginError
+
+logger = logging.getLogger(__name__)
+
+# Classes usadas nas mensagens de erro do formulário (mesmas de LOGIN_ERROR_SELECTOR)
+LOGIN_ERROR_CLASSES = {"alert-danger", "invalid-feedback", "text-danger"}
+# Elementos sem tag de fechamento (não alteram a profundidade)
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+
+
+class LoginFormParser(HTMLParser):
+    """
+    Extrai o formulário de login de uma página HTML
+
+    Guarda action/method do formulário que contém o campo de password, todos
+    os seus inputs (inclusive hidden, como o token CSRF), a meta csrf-token e
+    o texto de mensagens de erro exibidas na página.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.forms: List[Dict[str, Any]] = []
+        self.csrf_meta: Optional[str] = None
+        self.error_messages: List[str] = []
+        self._current_form: Optional[Dict[str, Any]] = None
+        # Profundidade dentro de um elemento de erro (0 = fora)
+        self._error_depth = 0
+        self._error_text: List[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+
+        if tag == "meta" and attrs.get("name", "").lower() in ("csrf-token", "_csrf", "csrf"):
+            self.csrf_meta = attrs.get("content")
+
+        if tag == "form":
+            self._current_form = {
+                "action": attrs.get("action") or "",
+                "method": (attrs.get("method") or "post").lower(),
+                "inputs": [],
+            }
+            self.forms.append(self._current_form)
+
+        if tag == "input" and self._current_form is not None:
+            self._current_form["inputs"].append({
+                "name": attrs.get("name"),
+                "type": (attrs.get("type") or "text").lower(),
+                "value": attrs.get("value") or "",
+                "id": attrs.get("id"),
+            })
+
+        if tag in VOID_TAGS:
+            return
+
+        classes = set((attrs.get("class") or "").split())
+        if self._error_depth:
+            self._error_depth += 1
+        elif classes & LOGIN_ERROR_CLASSES or attrs.get("role") == "alert":
+            self._error_depth = 1
+            self._error_text = []
+
+    def handle_endtag(self, tag):
+        if tag == "form":
+            self._current_form = None
+
+        if self._error_depth and tag not in VOID_TAGS:
+            self._error_depth -= 1
+            if self._error_depth == 0:
+                text = " ".join("".join(self._error_text).split())
+                if text:
+                    self.error_messages.append(text)
+
+    def handle_data(self, data):
+        if self._error_depth:
+            self._error_text.append(data)
+
+    def login_form(self) -> Optional[Dict[str, Any]]:
+        """Formulário que contém um campo de password (None se não houver)"""
+        for form in self.forms:
+            if any(i["type"] == "password" for i in form["inputs"]):
+                return form
+        return None
+
+
+class TubeHuntHttpClient:
+    """
+    Sessão HTTP autenticada no TubeHunt, sem navegador
+
+    O cookie jar do httpx.Client é compartilhado por todas as requisições e
+    pode ser exportado como storage_state do Playwright (e vice-versa), então
+    uma sessão obtida aqui serve para os navegadores e vice-versa.
+    """
+
+    def __init__(
+        self,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        login_url: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ):
+        """Inicializar cliente com configurações (fallback .env)"""
+        self.login_url = login_url or settings.url_login
+        self.username = username or settings.user
+        self.password = password or settings.password
+        self.client = httpx.Client(
+            follow_redirects=True,
+            event_hooks={"request": [httpx_request_hook]},
+            timeout=timeout or settings.HTTP_TIMEOUT_SECONDS,
+            headers={
+                "User-Agent": settings.HTTP_USER_AGENT,
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                "Accept-Language": "pt-BR,pt;q=0.9,en;q=0.8",
+            },
+        )
+        self.authenticated = False
+
+    def __enter__(self):
+        """Context manager entry"""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit"""
+        self.close()
+
+    def close(self):
+        """Fechar conexões do cliente"""
+        self.client.close()
+
+    def _is_logged_in_response(self, response: httpx.Response) -> bool:
+        """Resposta final fora do login e sem formulário de password"""
+        url = str(response.url).lower()
+        if "login" in url or "error" in url:
+            return False
+        return 'type="password"' not in response.text and "type='password'" not in response.text
+
+    def _build_login_payload(self, form: Dict[str, Any]) -> Dict[str, str]:
+        """Campos do formulário: hidden/CSRF preservados, email e password preenchidos"""
+        payload: Dict[str, str] = {}
+        email_filled = False
+
+        for field in form["inputs"]:
+            name = field["name"]
+            if not name:
+                continue
+            if field["type"] == "password":
+                payload[name] = self.password
+            elif not email_filled and (field["type"] == "email" or name.lower() in ("email", "username", "login")):
+                payload[name] = self.username
+                email_filled = True
+            elif field["type"] in ("checkbox", "radio"):
+                continue
+            else:
+                payload[name] = field["value"]
+
+        if not email_filled:
+            raise TubeHuntLoginError("Campo de email não encontrado no formulário de login")
+        return payload
+
+    def login(self) -> bool:
+        """
+        Fazer login submetendo o formulário por HTTP
+
+        Returns:
+            bool: True se a sessão ficou autenticada
+
+        Raises:
+            TubeHuntLoginError: Se o site exibiu erro de login (credenciais recusadas)
+        """
+        started = time.time()
+        logger.info(f"[HTTP] Acessando página de login: {self.login_url}")
+        page = self.client.get(self.login_url)
+
+        parser = LoginFormParser()
+        parser.feed(page.text)
+        form = parser.login_form()
+        if form is None:
+            if self._is_logged_in_response(page):
+                # Cookies carregados já eram de uma sessão válida
+                self.authenticated = True
+                return True
+            logger.warning("⚠️ [HTTP] Formulário de login não encontrado (página renderizada no cliente?)")
+            return False
+
+        action = urljoin(str(page.url), form["action"] or str(page.url))
+        headers = {"Referer": str(page.url), "Origin": f"{page.url.scheme}://{page.url.host}"}
+        if parser.csrf_meta:
+            headers["X-CSRF-TOKEN"] = parser.csrf_meta
+
+        payload = self._build_login_payload(form)
+        if form["method"] == "get":
+            response = self.client.get(action, params=payload, headers=headers)
+        else:
+            response = self.client.post(action, data=payload, headers=headers)
+
+        self.authenticated = self._is_logged_in_response(response)
+        elapsed = time.time() - started
+
+        if self.authenticated:
+            logger.info(f"✅ [HTTP] Login realizado em {elapsed:.2f}s: {response.url}")
+            return True
+
+        result = LoginFormParser()
+        result.feed(response.text)
+        if result.error_messages or response.status_code in (401, 403, 422, 429):
+            message = result.error_messages[0] if result.error_messages else f"HTTP {response.status_code}"
+            logger.error(f"❌ [HTTP] Login recusado: {message}")
+            raise TubeHuntLoginError(f"Login recusado pelo TubeHunt: {message}")
+
+        logger.warning(f"⚠️ [HTTP] Login não autenticou (URL final: {response.url})")
+        return False
+
+    def fetch(self, url: str) -> httpx.Response:
+        """
+        Buscar uma página autenticada
+
+        Se o site redirecionar para o login (sessão expirada), faz login de novo
+        e repete a requisição uma vez.
+
+        Args:
+            url: URL da página
+
+        Returns:
+            httpx.Response final (após redirecionamentos)
+        """
+        response = self.client.get(url)
+        if "login" in urlparse(str(response.url)).path.lower():
+            logger.warning("⚠️ [HTTP] Sessão expirada, refazendo login...")
+            self.authenticated = False
+            if not self.login():
+                raise TubeHuntLoginError("Sessão HTTP expirada e novo login não autenticou")
+            response = self.client.get(url)
+        response.raise_for_status()
+        return response
+
+    def load_storage_state(self, storage_state: Dict[str, Any]):
+        """
+        Carregar cookies de um storage_state do Playwright no cookie jar
+
+        Args:
+            storage_state: Resultado de BrowserContext.storage_state()
+        """
+        for cookie in storage_state.get("cookies", []):
+            self.client.cookies.set(
+                cookie["name"],
+                cookie["value"],
+                domain=cookie.get("domain", ""),
+                path=cookie.get("path", "/"),
+            )
+
+    def export_storage_state(self) -> Dict[str, Any]:
+        """
+        Exportar o cookie jar no formato storage_state do Playwright
+
+        Returns:
+            storage_state com os cookies da sessão (localStorage vazio)
+        """
+        cookies = []
+        for cookie in self.client.cookies.jar:
+            cookies.append({
+                "name": cookie.name,
+                "value": cookie.value or "",
+                "domain": cookie.domain,
+                "path": cookie.path or "/",
+                "expires": float(cookie.expires) if cookie.expires else -1,
+                "httpOnly": cookie.has_nonstandard_attr("HttpOnly") or cookie.has_nonstandard_attr("httponly"),
+                "secure": bool(cookie.secure),
+                "sameSite": "Lax",
+            })
+        return {"cookies": cookies, "origins": []}
+
+
+def http_login_storage_state(username: str, password: str, login_url: str) -> Optional[Dict[str, Any]]:
+    """
+    Login por HTTP retornando o storage_state para iniciar contextos do Playwright
+
+    Returns:
+        storage_state ou None se o login HTTP não autenticou
+    """
+    with TubeHuntHttpClient(username=username, password=password, login_url=login_url) as client:
+        if not client.login():
+            return None
+        return client.export_storage_state()
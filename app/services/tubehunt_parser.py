@@ -0,0 +1,157 @@
+"""
+Parser offline (lxml) do HTML do TubeHunt.
+
+Reproduz a extração ao vivo a partir do HTML de `page.content()`, usando as
+mesmas specs (tubehunt_extract) compiladas para lxml: a página do
+navegador fica livre logo após a navegação e o parsing roda em um
+ProcessPoolExecutor, usando todos os núcleos. O mesmo HTML salvo em disco
+pode ser re-processado sem acessar o TubeHunt:
+
+    python -m app.services.tubehunt_parser listing pagina.html
+    python -m app.services.tubehunt_parser channel canal.html
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from app.core.config import settings
+from app.core.extraction import extract_html
+from app.services.tubehunt_extract import DETAIL_SPEC, LISTING_SPEC, normalize_listing
+
+logger = logging.getLogger(__name__)
+
+
+def parse_listing_html(page_html: str) -> List[Dict[str, Any]]:
+    """
+    Extrair os canais de uma página de listagem
+
+    Args:
+        page_html: HTML completo da listagem (page.content())
+
+    Returns:
+        Lista de canais no mesmo schema de extract_listing()
+    """
+    return normalize_listing(extract_html(LISTING_SPEC, page_html))
+
+
+def parse_channel_details_html(page_html: str) -> Dict[str, Any]:
+    """
+    Extrair os dados de detalhes de um canal
+
+    Args:
+        page_html: HTML completo da página do canal (page.content())
+
+    Returns:
+        Campos de ChannelDetailedData (sem channel_link)
+    """
+    return extract_html(DETAIL_SPEC, page_html)
+
+
+def save_snapshot(kind: str, url: str, page_html: str) -> Optional[str]:
+    """
+    Salvar o HTML extraído em HTML_SNAPSHOT_DIR para re-processamento posterior
+
+    Args:
+        kind: "listing" ou "channel"
+        url: URL da página (usada no nome do arquivo)
+        page_html: HTML completo da página
+
+    Returns:
+        Caminho do arquivo salvo, ou None se desabilitado/falhou
+    """
+    if not settings.HTML_SNAPSHOT_DIR:
+        return None
+    try:
+        os.makedirs(settings.HTML_SNAPSHOT_DIR, exist_ok=True)
+        digest = hashlib.sha1(url.encode("utf-8")).hexdigest()[:12]
+        path = os.path.join(settings.HTML_SNAPSHOT_DIR, f"{kind}-{int(time.time())}-{digest}.html")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(page_html)
+        return path
+    except Exception as e:
+        logger.warning(f"⚠️ Não foi possível salvar HTML de {url}: {str(e)}")
+        return None
+
+
+class ParserPool:
+    """
+    ProcessPoolExecutor compartilhado para o parsing offline
+
+    Criado sob demanda (o fork só acontece no primeiro uso) e encerrado no
+    shutdown da API.
+    """
+
+    def __init__(self, max_workers: int = 0):
+        """
+        Args:
+            max_workers: Número de processos (0 = número de CPUs)
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def executor(self) -> ProcessPoolExecutor:
+        """Obter (ou criar) o pool de processos"""
+        with self.lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+                logger.info(f"✅ Pool de parsing iniciado ({self.max_workers} processos)")
+            return self._executor
+
+    def parse_listing(self, page_html: str) -> List[Dict[str, Any]]:
+        """parse_listing_html() em um processo do pool (bloqueante)"""
+        return self.executor().submit(parse_listing_html, page_html).result()
+
+    def parse_channel_details(self, page_html: str) -> Dict[str, Any]:
+        """parse_channel_details_html() em um processo do pool (bloqueante)"""
+        return self.executor().submit(parse_channel_details_html, page_html).result()
+
+    async def parse_listing_async(self, page_html: str) -> List[Dict[str, Any]]:
+        """parse_listing_html() em um processo do pool, sem bloquear o loop"""
+        return await asyncio.get_running_loop().run_in_executor(self.executor(), parse_listing_html, page_html)
+
+    async def parse_channel_details_async(self, page_html: str) -> Dict[str, Any]:
+        """parse_channel_details_html() em um processo do pool, sem bloquear o loop"""
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor(), parse_channel_details_html, page_html
+        )
+
+    def shutdown(self):
+        """Encerrar o pool de processos"""
+        with self.lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+# Instância global do pool de parsing
+parser_pool = ParserPool(max_workers=settings.PARSER_PROCESSES)
+
+
+def main():
+    """Re-processar HTML salvo: python -m app.services.tubehunt_parser {listing|channel} arquivo.html"""
+    parser = argparse.ArgumentParser(description="Parser offline do HTML do TubeHunt")
+    parser.add_argument("kind", choices=["listing", "channel"])
+    parser.add_argument("path")
+    args = parser.parse_args()
+
+    with open(args.path, "r", encoding="utf-8") as f:
+        page_html = f.read()
+
+    if args.kind == "listing":
+        result: Any = parse_listing_html(page_html)
+    else:
+        result = parse_channel_details_html(page_html)
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+"""
+Pipeline listagem → detalhes do TubeHunt em um único job.
+
+Os canais saem do extrator da listagem (página única ou crawl) para uma fila
+limitada (PIPELINE_QUEUE_SIZE); workers de detalhes consomem a fila em
+paralelo com a mesma sessão autenticada (storage_state do job ou
+cache/coordenador de login), então a extração de detalhes começa assim que o
+primeiro card é lido. Cada resultado
+combina o canal da listagem com seus detalhes (`details`, ou None + `detail_error`).
+"""
+
+import asyncio
+import contextvars
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urljoin
+
+from app.core.browser import browser_pool
+from app.core.config import settings
+from app.core.concurrency import detail_concurrency, watch_responses
+
+logger = logging.getLogger(__name__)
+
+OnResult = Callable[[Dict[str, Any]], None]
+
+# Threads persistentes dos workers de detalhes do engine sync: o prefixo do pool
+# faz cada uma usar um navegador do BrowserPool (reciclagem incluída), e o driver
+# Playwright da thread é reaproveitado entre jobs. Cabem os workers de todos os
+# jobs simultâneos (um por thread do executor de scraping), então um job não
+# espera os workers de outro enquanto a fila da sua listagem enche
+PIPELINE_THREAD_PREFIX = f"{settings.BROWSER_POOL_THREAD_PREFIX}-pipeline"
+PIPELINE_WORKERS = settings.PIPELINE_DETAIL_CONCURRENCY * settings.BROWSER_POOL_SIZE
+pipeline_executor = ThreadPoolExecutor(max_workers=PIPELINE_WORKERS, thread_name_prefix=PIPELINE_THREAD_PREFIX)
+browser_pool.add_thread_group(PIPELINE_THREAD_PREFIX, PIPELINE_WORKERS)
+
+
+def _publish(on_result: OnResult, item: Dict[str, Any]):
+    """Entregar um resultado sem deixar um erro do callback matar o worker (e travar a fila)"""
+    try:
+        on_result(item)
+    except Exception as e:
+        logger.error(f"❌ [Pipeline] Falha ao publicar canal {item.get('channel_link')}: {str(e)}", exc_info=True)
+
+
+def _combine(index: int, channel: Dict[str, Any], details, error: Optional[str]) -> Dict[str, Any]:
+    """Canal da listagem + detalhes (com a posição na listagem para reordenar no final)"""
+    return {
+        **channel,
+        "listing_index": index,
+        "details": details.model_dump() if details is not None else None,
+        "detail_error": error,
+    }
+
+
+def detail_link(scrape_url: str, channel: Dict[str, Any]) -> Optional[str]:
+    """URL absoluta da página do canal (o card traz o link relativo)"""
+    link = channel.get("channel_link")
+    if not link or link == "N/A":
+        return None
+    return urljoin(scrape_url, link)
+
+
+def run_pipeline(
+    username: str,
+    password: str,
+    scrape_url: str,
+    listing: Callable[[Callable], Any],
+    on_result: OnResult,
+    concurrency: Optional[int] = None,
+    storage_state: Optional[Dict[str, Any]] = None,
+) -> int:
+    """
+    Pipeline para o engine sync: workers no pipeline_executor
+
+    A Sync API vincula cada navegador à thread, então cada worker abre seu
+    próprio serviço (contexto emprestado do navegador da thread no pool) com a
+    sessão do job; a listagem é consumida na thread do job.
+
+    Args:
+        username: Usuário da conta (sessão compartilhada via cache)
+        password: Senha da conta
+        scrape_url: URL da listagem (base dos links relativos)
+        listing: Função que recebe o callback `put(channel)` e produz a
+            listagem (iter_channels / crawl_listing); put bloqueia com a fila cheia
+        on_result: Chamado para cada canal com detalhes (ordem de conclusão)
+        concurrency: Workers de detalhes (None = settings.PIPELINE_DETAIL_CONCURRENCY, que é o teto)
+        storage_state: Sessão autenticada do job (None = cada worker autentica via cache)
+
+    Returns:
+        Número de canais lidos da listagem
+    """
+    from app.services.tubehunt import TubeHuntService
+
+    concurrency = min(concurrency or settings.PIPELINE_DETAIL_CONCURRENCY, settings.PIPELINE_DETAIL_CONCURRENCY)
+    work: queue.Queue = queue.Queue(maxsize=settings.PIPELINE_QUEUE_SIZE)
+    result_lock = threading.Lock()
+    started = time.time()
+
+    def worker():
+        service = TubeHuntService()
+        service.username = username
+        service.password = password
+        auth_error = None
+        try:
+            if storage_state:
+                service.get_page()
+                service.page = service.browser_manager.reset_context(storage_state=storage_state)
+                service.authenticated = True
+            else:
+                service.authenticate()
+        except Exception as e:
+            auth_error = f"Falha no login do worker: {str(e)}"
+            logger.error(f"❌ [Pipeline] {auth_error}")
+
+        try:
+            # Mesmo sem login, a fila é drenada para não travar a listagem
+            while (item := work.get()) is not None:
+                index, channel = item
+                details, error = None, auth_error
+                link = detail_link(scrape_url, channel)
+                if error is None and link is None:
+                    error = "Canal sem link"
+                if error is None:
+                    try:
+                        with detail_concurrency.slot() as sample:
+                            page = service.get_page()
+                            with watch_responses(page, sample):
+                                details = service.scrape_channel_details(page, link)
+                            sample.ok = details is not None
+                        error = None if details else "Falha ao extrair dados do canal"
+                    except Exception as e:
+                        error = str(e)
+                with result_lock:
+                    _publish(on_result, _combine(index, channel, details, error))
+        finally:
+            service.close()
+
+    # Cada worker roda numa cópia do contexto do job (job_id do rate limiter)
+    workers = [pipeline_executor.submit(contextvars.copy_context().run, worker) for _ in range(concurrency)]
+
+    total = 0
+
+    def put(channel: Dict[str, Any]):
+        nonlocal total
+        work.put((total, channel))
+        total += 1
+
+    try:
+        listing(put)
+    finally:
+        for _ in workers:
+            work.put(None)
+        wait(workers)
+
+    logger.info(f"✅ [Pipeline] {total} canais em {time.time() - started:.1f}s ({concurrency} workers)")
+    return total
+
+
+async def run_pipeline_async(
+    username: str,
+    password: str,
+    scrape_url: str,
+    listing: Callable[[Callable], Any],
+    on_result: OnResult,
+    concurrency: Optional[int] = None,
+) -> int:
+    """
+    Pipeline para o engine async: workers são tarefas no loop do engine
+
+    Args:
+        username: Usuário da conta (sessão compartilhada via cache)
+        password: Senha da conta
+        scrape_url: URL da listagem (base dos links relativos)
+        listing: Corrotina que recebe o callback `put(channel)` e produz a
+            listagem (aguardando o callback, que bloqueia com a fila cheia)
+        on_result: Chamado para cada canal com detalhes (ordem de conclusão)
+        concurrency: Workers de detalhes (None = settings.PIPELINE_DETAIL_CONCURRENCY, que é o teto)
+
+    Returns:
+        Número de canais lidos da listagem
+    """
+    from app.services.tubehunt_async import TubeHuntAsyncService
+
+    concurrency = min(concurrency or settings.PIPELINE_DETAIL_CONCURRENCY, settings.PIPELINE_DETAIL_CONCURRENCY)
+    work: asyncio.Queue = asyncio.Queue(maxsize=settings.PIPELINE_QUEUE_SIZE)
+    started = time.time()
+    total = 0
+
+    async def put(channel: Dict[str, Any]):
+        nonlocal total
+        await work.put((total, channel))
+        total += 1
+
+    async def worker():
+        service = TubeHuntAsyncService(username=username, password=password)
+        auth_error = None
+        try:
+            await service.authenticate()
+        except Exception as e:
+            auth_error = f"Falha no login do worker: {str(e)}"
+            logger.error(f"❌ [Pipeline] {auth_error}")
+
+        try:
+            while (item := await work.get()) is not None:
+                index, channel = item
+                details, error = None, auth_error
+                link = detail_link(scrape_url, channel)
+                if error is None and link is None:
+                    error = "Canal sem link"
+                if error is None:
+                    try:
+                        async with detail_concurrency.slot_async() as sample:
+                            page = await service.get_page()
+                            with watch_responses(page, sample):
+                                details = await service.scrape_channel_details(page, link)
+                            sample.ok = details is not None
+                        error = None if details else "Falha ao extrair dados do canal"
+                    except Exception as e:
+                        error = str(e)
+                _publish(on_result, _combine(index, channel, details, error))
+        finally:
+            await service.close()
+
+    workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+    try:
+        await listing(put)
+    finally:
+        for _ in workers:
+            await work.put(None)
+        await asyncio.gather(*workers, return_exceptions=True)
+
+    logger.info(f"✅ [Pipeline] {total} canais em {time.time() - started:.1f}s ({concurrency} workers)")
+    return total
@@ -61,7 +61,7 @@ class WebhookCaller:
         Args:
             webhook_url: URL do webhook
             job_id: ID do job
-            status: Status final (completed, failed)
+            status: Status final (completed, failed) ou "partial" (lote de resultados parciais)
             result: Resultado do scraping
             error: Mensagem de erro se falhou
             execution_time_seconds: Tempo de execução
@@ -76,7 +76,7 @@ class WebhookCaller:
             "timestamp": time.time()
         }
 
-        if status == "completed" and result:
+        if status in ("completed", "partial") and result:
             payload["result"] = result
         elif status == "failed" and error:
             payload["error"] = error
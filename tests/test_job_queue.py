@@ -0,0 +1,42 @@
+"""Testes dos resultados publicados por job (janela em memória + arquivo de spill)"""
+
+from app.core.job_queue import JobManager
+
+
+def _manager(tmp_path, buffer_size=3):
+    return JobManager(results_buffer_size=buffer_size, results_spill_dir=str(tmp_path / "job_results"))
+
+
+def test_only_window_stays_in_memory(tmp_path):
+    manager = _manager(tmp_path)
+    job_id = manager.create_job()
+    for i in range(10):
+        manager.append_job_results(job_id, [{"i": i}])
+
+    job = manager.get_job(job_id)
+    assert [item["i"] for item in job.results] == [7, 8, 9]
+    assert job.results_offset == 7
+    assert manager.count_job_results(job_id) == 10
+
+
+def test_older_items_served_from_spill(tmp_path):
+    manager = _manager(tmp_path)
+    job_id = manager.create_job()
+    manager.append_job_results(job_id, [{"i": i} for i in range(10)])
+
+    page = manager.get_job_results(job_id, offset=5, limit=4)
+    assert page["total"] == 10
+    assert [item["i"] for item in page["items"]] == [5, 6, 7, 8]
+    assert [item["i"] for item in manager.iter_job_results(job_id)] == list(range(10))
+
+
+def test_completed_result_does_not_hold_items(tmp_path):
+    manager = _manager(tmp_path)
+    job_id = manager.create_job()
+    manager.append_job_results(job_id, [{"i": i} for i in range(10)])
+    manager.mark_job_completed(job_id, {"total_channels": 10})
+
+    job_dict = manager.get_job_dict(job_id)
+    assert job_dict["result"] == {"total_channels": 10}
+    assert job_dict["results_available"] == 10
+    assert len(manager.get_job(job_id).results) == 3
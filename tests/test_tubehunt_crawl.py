@@ -0,0 +1,52 @@
+"""Testes do crawl incremental de listagem (ListingCrawl + high-water mark)"""
+
+from app.core.high_water import HighWaterMarkStore
+from app.services.tubehunt_crawl import ListingCrawl
+
+SCRAPE_URL = "https://app.tubehunt.io/long/?page=1&OrderBy=DateDESC"
+
+
+def _channels(*handles):
+    return [{"channel_handle": handle, "channel_link": f"https://app.tubehunt.io/channel/{handle}"} for handle in handles]
+
+
+def _crawl(store, page_end=3):
+    return ListingCrawl(SCRAPE_URL, page_start=1, page_end=page_end, known=store.load(SCRAPE_URL))
+
+
+def test_partial_failure_does_not_advance_high_water(tmp_path):
+    store = HighWaterMarkStore(path=str(tmp_path / "high_water.json"))
+    store.update(SCRAPE_URL, ["old"])
+
+    crawl = _crawl(store)
+    crawl.complete(1, _channels("a", "b"))
+    crawl.complete(2, None)
+    crawl.complete(3, _channels("c", "old"))
+
+    assert crawl.failed_pages == [2]
+    assert crawl.update_high_water(store) is False
+    # A próxima execução não pode parar antes dos canais da página que falhou
+    assert store.load(SCRAPE_URL) == ["old"]
+
+
+def test_complete_crawl_advances_high_water(tmp_path):
+    store = HighWaterMarkStore(path=str(tmp_path / "high_water.json"))
+    store.update(SCRAPE_URL, ["old"])
+
+    crawl = _crawl(store)
+    crawl.complete(1, _channels("a", "b"))
+    crawl.complete(2, _channels("c", "old"))
+
+    assert crawl.stopped_at == {"page": 2, "position": 1, "channel": "old"}
+    assert crawl.update_high_water(store) is True
+    assert store.load(SCRAPE_URL) == ["a", "b", "c", "old"]
+
+
+def test_job_error_does_not_advance_high_water(tmp_path):
+    store = HighWaterMarkStore(path=str(tmp_path / "high_water.json"))
+
+    crawl = _crawl(store, page_end=1)
+    crawl.complete(1, _channels("a"))
+
+    assert crawl.update_high_water(store, error="timeout") is False
+    assert store.load(SCRAPE_URL) == []